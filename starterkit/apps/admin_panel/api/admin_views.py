@@ -1,19 +1,28 @@
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import HttpRequest
-from inertia import render
+from django.http import HttpRequest, JsonResponse
 
+from apps.admin_panel.api.render_utils import arender
 from apps.admin_panel.domain.policies import can_access_admin
-from apps.admin_panel.selectors.auth import get_dashboard_stats
-from main.middleware import get_auth_props
+from apps.admin_panel.selectors.auth import aget_dashboard_stats
+from apps.admin_panel.serialization.dto import to_dict
+from apps.admin_panel.services.password_hashing import get_hashing_executor
 
 
 @login_required
 @user_passes_test(can_access_admin)
-def dashboard(request: HttpRequest):
+async def dashboard(request: HttpRequest):
     """
     Admin dashboard page with summary statistics.
     """
-    return render(request, "Admin/Dashboard", {
-        "auth": get_auth_props(request),
-        "stats": get_dashboard_stats(),
+    return await arender(request, "Admin/Dashboard", {
+        "stats": aget_dashboard_stats,
     })
+
+
+@login_required
+@user_passes_test(can_access_admin)
+def hashing_metrics(request: HttpRequest):
+    """
+    Queue depth and throughput of this worker's password hashing executor, as JSON.
+    """
+    return JsonResponse(to_dict(get_hashing_executor().metrics()))
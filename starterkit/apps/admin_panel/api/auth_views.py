@@ -1,16 +1,19 @@
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponseRedirect
 from django.urls import reverse
-from inertia import render
 
+from apps.admin_panel.api.render_utils import arender
 from apps.admin_panel.api.request_utils import get_request_data
 from apps.admin_panel.dto.auth import LoginInputDTO
-from apps.admin_panel.services.auth import login_service, logout_service
+from apps.admin_panel.services.auth import alogin_service, logout_service
 
 
-def login_view(request: HttpRequest):
+async def login_view(request: HttpRequest):
     """
     Inertia-powered login view that mirrors Django admin login behavior.
+
+    Async so the password check runs on the bounded hashing executor (see
+    `alogin_service`) rather than on the request thread.
     """
 
     data = get_request_data(request) if request.method == "POST" else {}
@@ -27,13 +30,13 @@ def login_view(request: HttpRequest):
             next_url=next_url,
         )
 
-        result = login_service(dto, request)
+        result = await alogin_service(dto, request)
 
         if result.success and result.redirect_url:
             return HttpResponseRedirect(result.redirect_url)
 
         # Re-render the login page with errors and the submitted username.
-        return render(
+        return await arender(
             request,
             "Auth/Login",
             {
@@ -48,7 +51,7 @@ def login_view(request: HttpRequest):
         )
 
     # GET request: render empty login form.
-    return render(
+    return await arender(
         request,
         "Auth/Login",
         {
@@ -1,23 +1,32 @@
-import dataclasses
+from functools import cache, partial
+from urllib.parse import urlencode
+
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.http import HttpRequest, HttpResponseRedirect
 from django.urls import reverse
-from inertia import render
+from inertia import optional
 
-from apps.admin_panel.api.request_utils import get_request_data
+from apps.admin_panel.api.export_utils import get_export_format, stream_export
+from apps.admin_panel.api.pagination_utils import get_list_total_mode, get_pagination_props
+from apps.admin_panel.api.render_utils import arender, render, wants_prop
+from apps.admin_panel.api.request_utils import get_request_data, parse_id, parse_ids
 from apps.admin_panel.domain.policies import can_manage_groups
-from apps.admin_panel.dto.groups import GroupFormInputDTO
+from apps.admin_panel.dto.groups import GroupFormInputDTO, PermissionMatrixCellDTO
+from apps.admin_panel.selectors.exports import GROUP_EXPORT_COLUMNS, iter_group_export_rows
 from apps.admin_panel.selectors.groups import (
+    aget_group_page,
     get_all_permissions_choices,
     get_group_detail_dto,
-    get_group_list_page,
+    get_group_members_page,
+    get_permission_matrix,
 )
+from apps.admin_panel.serialization.dto import to_dict, to_dicts
 from apps.admin_panel.services.groups import (
+    apply_permission_matrix_service,
     create_group_service,
     delete_group_service,
     update_group_service,
 )
-from main.middleware import get_auth_props
 
 
 def _parse_group_form_data(request: HttpRequest) -> dict:
@@ -25,43 +34,153 @@ def _parse_group_form_data(request: HttpRequest) -> dict:
     permission_ids = data.get("permission_ids")
     if not isinstance(permission_ids, list):
         permission_ids = [permission_ids] if permission_ids is not None and permission_ids != "" else []
-    permission_ids = [int(x) for x in permission_ids if str(x).isdigit()]
+    permission_ids = parse_ids(permission_ids)
     return {
         "name": (data.get("name") or "").strip(),
         "permission_ids": permission_ids,
     }
 
 
+MEMBERS_PAGE_SIZE = 25
+
+
+def _members_prop(request: HttpRequest, group_id: int):
+    """
+    Paginated, searchable group members, only resolved when the page asks for them
+    with a partial reload (`only: ["members"]`), so opening the edit page never scans
+    the membership of a large group.
+    """
+
+    search = request.GET.get("members_search", "").strip() or None
+    cursor = request.GET.get("members_cursor") or None
+    page = max(1, int(request.GET.get("members_page", 1)))
+
+    def load():
+        result = get_group_members_page(
+            group_id,
+            search=search,
+            cursor=cursor,
+            page_size=MEMBERS_PAGE_SIZE,
+            total_mode=get_list_total_mode(),
+        )
+        return {
+            "items": to_dicts(result.items),
+            "pagination": get_pagination_props(result, page=page, page_size=MEMBERS_PAGE_SIZE),
+            "filters": {"search": search or ""},
+        }
+
+    return optional(load)
+
+
 ALLOWED_GROUP_ORDER_FIELDS = {"name", "-name", "user_count", "-user_count", "permission_count", "-permission_count"}
 
 
 @login_required
 @user_passes_test(can_manage_groups)
-def group_list(request: HttpRequest):
+async def group_list(request: HttpRequest):
+    """
+    Group list page; the count and the page rows are read concurrently.
+    """
     search = request.GET.get("search", "").strip() or None
     page = max(1, int(request.GET.get("page", 1)))
     page_size = max(1, min(100, int(request.GET.get("page_size", 25))))
     order_by = request.GET.get("order_by", "name")
     if order_by not in ALLOWED_GROUP_ORDER_FIELDS:
         order_by = "name"
-    items, total = get_group_list_page(search=search, order_by=order_by, page=page, page_size=page_size)
-    return render(
+    cursor = request.GET.get("cursor") or None
+    result = await aget_group_page(
+        search=search,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        total_mode=get_list_total_mode(),
+    )
+    return await arender(
         request,
         "Admin/Groups/Index",
         {
-            "auth": get_auth_props(request),
-            "groups": [dataclasses.asdict(g) for g in items],
-            "pagination": {
-                "page": page,
-                "page_size": page_size,
-                "total": total,
-                "total_pages": (total + page_size - 1) // page_size if total else 0,
-            },
+            "groups": to_dicts(result.items),
+            "pagination": get_pagination_props(result, page=page, page_size=page_size),
             "filters": {"search": search or "", "order_by": order_by},
         },
     )
 
 
+@login_required
+@user_passes_test(can_manage_groups)
+def group_export(request: HttpRequest):
+    """
+    Stream every group matching the list's `search`/`order_by` as `?format=csv|jsonl`.
+    """
+    search = request.GET.get("search", "").strip() or None
+    order_by = request.GET.get("order_by", "name")
+    if order_by not in ALLOWED_GROUP_ORDER_FIELDS:
+        order_by = "name"
+    return stream_export(
+        request,
+        iter_group_export_rows(search=search, order_by=order_by),
+        columns=GROUP_EXPORT_COLUMNS,
+        fmt=get_export_format(request),
+        name="groups",
+    )
+
+
+def _parse_matrix_cells(data: dict) -> list[PermissionMatrixCellDTO]:
+    changes = data.get("changes")
+    if not isinstance(changes, list):
+        return []
+    cells = []
+    for change in changes:
+        if not isinstance(change, dict):
+            continue
+        group_id, permission_id = parse_id(change.get("group_id")), parse_id(change.get("permission_id"))
+        if group_id is None or permission_id is None:
+            continue
+        cells.append(
+            PermissionMatrixCellDTO(
+                group_id=group_id,
+                permission_id=permission_id,
+                granted=change.get("granted") in (True, "true", "on", 1, "1"),
+            )
+        )
+    return cells
+
+
+@login_required
+@user_passes_test(can_manage_groups)
+def group_permissions(request: HttpRequest):
+    """
+    Groups x permissions matrix, filtered by `?app_label=`. POST applies a batch of
+    `changes` ({group_id, permission_id, granted}) in one transaction.
+    """
+    if request.method == "POST":
+        data = get_request_data(request)
+        app_label = (data.get("app_label") or "").strip() or None
+        result = apply_permission_matrix_service(_parse_matrix_cells(data), request)
+        if result.success:
+            query = urlencode({"app_label": app_label} if app_label else {})
+            return HttpResponseRedirect(f"{reverse('admin_group_permissions')}?{query}")
+        errors = result.errors
+    else:
+        app_label = request.GET.get("app_label", "").strip() or None
+        errors = {}
+
+    matrix = get_permission_matrix(app_label=app_label)
+    return render(
+        request,
+        "Admin/Groups/Permissions",
+        {
+            "app_labels": matrix.app_labels,
+            "groups": matrix.groups,
+            "permissions": matrix.permissions,
+            "grants": [list(pair) for pair in matrix.grants],
+            "filters": {"app_label": app_label or ""},
+            "errors": errors,
+        },
+    )
+
+
 @login_required
 @user_passes_test(can_manage_groups)
 def group_create(request: HttpRequest):
@@ -78,10 +197,9 @@ def group_create(request: HttpRequest):
             request,
             "Admin/Groups/Create",
             {
-                "auth": get_auth_props(request),
                 "form": {"name": dto.name, "permission_ids": dto.permission_ids},
                 "errors": result.errors,
-                "permissions_choices": _permissions_choices(),
+                "permissions_choices": _permissions_choices,
             },
         )
 
@@ -89,10 +207,9 @@ def group_create(request: HttpRequest):
         request,
         "Admin/Groups/Create",
         {
-            "auth": get_auth_props(request),
             "form": {"name": "", "permission_ids": []},
             "errors": {},
-            "permissions_choices": _permissions_choices(),
+            "permissions_choices": _permissions_choices,
         },
     )
 
@@ -100,8 +217,9 @@ def group_create(request: HttpRequest):
 @login_required
 @user_passes_test(can_manage_groups)
 def group_edit(request: HttpRequest, group_id: int):
-    detail = get_group_detail_dto(group_id)
-    if not detail:
+    detail = cache(partial(get_group_detail_dto, group_id))
+    # Partial reloads of `members` (or `errors`) never load the group itself.
+    if wants_prop(request, "Admin/Groups/Edit", "group", "form") and not detail():
         return HttpResponseRedirect(reverse("admin_groups"))
 
     if request.method == "POST":
@@ -117,11 +235,11 @@ def group_edit(request: HttpRequest, group_id: int):
             request,
             "Admin/Groups/Edit",
             {
-                "auth": get_auth_props(request),
-                "group": _detail_to_form(detail),
+                "group": lambda: to_dict(detail()),
                 "form": {"name": dto.name, "permission_ids": dto.permission_ids},
                 "errors": result.errors,
-                "permissions_choices": _permissions_choices(),
+                "permissions_choices": _permissions_choices,
+                "members": _members_prop(request, group_id),
             },
         )
 
@@ -129,11 +247,11 @@ def group_edit(request: HttpRequest, group_id: int):
         request,
         "Admin/Groups/Edit",
         {
-            "auth": get_auth_props(request),
-            "group": _detail_to_form(detail),
-            "form": {"name": detail.name, "permission_ids": detail.permission_ids},
+            "group": lambda: to_dict(detail()),
+            "form": lambda: {"name": detail().name, "permission_ids": detail().permission_ids},
             "errors": {},
-            "permissions_choices": _permissions_choices(),
+            "permissions_choices": _permissions_choices,
+            "members": _members_prop(request, group_id),
         },
     )
 
@@ -149,20 +267,9 @@ def group_delete(request: HttpRequest, group_id: int):
     return render(
         request,
         "Admin/Groups/Index",
-        {"auth": get_auth_props(request), "errors": result.errors, "groups": [], "pagination": {"page": 1, "page_size": 25, "total": 0, "total_pages": 0}, "filters": {}},
+        {"errors": result.errors, "groups": [], "pagination": {"page": 1, "page_size": 25, "total": 0, "total_pages": 0}, "filters": {}},
     )
 
 
 def _permissions_choices():
     return [{"id": pid, "codename": cname} for pid, cname in get_all_permissions_choices()]
-
-
-def _detail_to_form(detail):
-    return {
-        "id": detail.id,
-        "name": detail.name,
-        "permission_ids": detail.permission_ids,
-        "permission_codenames": detail.permission_codenames,
-        "user_ids": detail.user_ids,
-        "user_usernames": detail.user_usernames,
-    }
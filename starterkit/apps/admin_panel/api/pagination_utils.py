@@ -0,0 +1,35 @@
+from django.conf import settings
+
+from apps.admin_panel.dto.pagination import ListPageDTO
+from apps.admin_panel.selectors.pagination import TOTAL_EXACT
+
+
+def get_list_total_mode() -> str:
+    """Counting strategy for admin list pages, from `ADMIN_PANEL_LIST_TOTAL_MODE`."""
+    return getattr(settings, "ADMIN_PANEL_LIST_TOTAL_MODE", TOTAL_EXACT)
+
+
+def get_pagination_props(result: ListPageDTO, *, page: int, page_size: int) -> dict:
+    """
+    Build the `pagination` Inertia prop for list pages.
+
+    `next_cursor`/`prev_cursor` should be sent back as `cursor` (with `page` +/- 1 for display).
+    `total`/`total_pages` are None when counting was skipped.
+    """
+
+    total = result.total
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = (total + page_size - 1) // page_size if total else 0
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total": total,
+        "total_pages": total_pages,
+        "total_is_estimate": result.total_is_estimate,
+        "has_next": result.has_next,
+        "has_prev": result.has_prev,
+        "next_cursor": result.next_cursor,
+        "prev_cursor": result.prev_cursor,
+    }
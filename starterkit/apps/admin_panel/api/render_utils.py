@@ -0,0 +1,76 @@
+import asyncio
+
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpRequest
+from inertia import InertiaResponse as BaseInertiaResponse
+
+PAGE_COMPONENT_CONTEXT_KEY = "inertia_component"
+
+
+class InertiaResponse(BaseInertiaResponse):
+    """
+    Inertia's response with the page component in the first-load template context, so
+    `{% vite_assets %}` can preload its chunks without decoding the page object.
+    """
+
+    def build_first_load_context_and_template(self, data):
+        context, template = super().build_first_load_context_and_template(data)
+        return {PAGE_COMPONENT_CONTEXT_KEY: self.component, **context}, template
+
+
+def render(request: HttpRequest, component: str, props: dict | None = None, template_data: dict | None = None):
+    """Inertia `render`, using the `InertiaResponse` above."""
+    return InertiaResponse(request, component, props or {}, template_data or {})
+
+
+def is_partial_reload(request: HttpRequest, component: str) -> bool:
+    """True for an Inertia partial reload (`only: [...]`) of `component`."""
+    return (
+        "X-Inertia-Partial-Data" in request.headers
+        and request.headers.get("X-Inertia-Partial-Component", "") == component
+    )
+
+
+def wants_prop(request: HttpRequest, component: str, *keys: str) -> bool:
+    """
+    True when the response for `component` will include any of `keys`: always on a
+    full load, and on a partial reload only if the client asked for one of them.
+
+    Callable props are already skipped by Inertia when not requested; this is for
+    work that several props share, such as the existence check of an edit page.
+    """
+
+    if not is_partial_reload(request, component):
+        return True
+    requested = request.headers.get("X-Inertia-Partial-Data", "").split(",")
+    return any(key in requested for key in keys)
+
+
+async def aresolve_props(request: HttpRequest, component: str, props: dict) -> dict:
+    """
+    Await the async callable props the response will include, concurrently, and drop
+    the ones it won't. Other props are returned untouched.
+    """
+
+    lazy = [key for key, prop in props.items() if iscoroutinefunction(prop)]
+    wanted = [key for key in lazy if wants_prop(request, component, key)]
+    values = await asyncio.gather(*(props[key]() for key in wanted))
+    resolved = {key: prop for key, prop in props.items() if key not in lazy}
+    resolved.update(zip(wanted, values))
+    return resolved
+
+
+async def arender(request: HttpRequest, component: str, props: dict):
+    """
+    Inertia `render` for async views.
+
+    Props may be async callables, which are only awaited when the response includes
+    them (see `aresolve_props`). Other callables run synchronously inside `render`,
+    so they must not query the database. `render` and the shared props also read the
+    session and `request.user`, which are loaded here first.
+    """
+
+    props = await aresolve_props(request, component, props)
+    await request.auser()
+    await request.session.aitems()
+    return render(request, component, props)
@@ -1,20 +1,65 @@
-import json
+from typing import Iterable
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
 from django.http import HttpRequest
 
+from apps.admin_panel.serialization.codecs import get_json_codec
+
+DEFAULT_JSON_MAX_BODY_SIZE = 1024 * 1024
+
+
+def _check_json_body_size(request: HttpRequest) -> None:
+    # Content-Length is checked before the body is read; the length read covers bodies
+    # sent without one (chunked, some ASGI servers).
+    limit = getattr(settings, "ADMIN_PANEL_JSON_MAX_BODY_SIZE", DEFAULT_JSON_MAX_BODY_SIZE)
+    if limit is None:
+        return
+    try:
+        declared = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        declared = 0
+    if declared > limit or len(request.body) > limit:
+        raise RequestDataTooBig("JSON request body exceeded ADMIN_PANEL_JSON_MAX_BODY_SIZE.")
+
 
 def get_request_data(request: HttpRequest) -> dict:
     """
     Return POST data as a dict. Supports both form-encoded and JSON body (Inertia).
     For form-encoded, list values (e.g. group_ids) are kept as lists; single values unwrapped.
+    JSON bodies over `ADMIN_PANEL_JSON_MAX_BODY_SIZE` bytes raise RequestDataTooBig (a 400)
+    without being parsed.
     """
     raw = {}
-    if request.content_type and "application/json" in request.content_type and request.body:
-        try:
-            raw = json.loads(request.body)
-        except (json.JSONDecodeError, ValueError):
-            pass
+    if request.content_type and "application/json" in request.content_type:
+        _check_json_body_size(request)
+        if request.body:
+            try:
+                raw = get_json_codec().loads(request.body)
+            except ValueError:
+                pass
     elif request.POST:
         raw = {k: v if len(v) != 1 else v[0] for k, v in request.POST.lists()}
     if not isinstance(raw, dict):
         return {}
     return raw
+
+
+def parse_id(value) -> int | None:
+    """
+    A non-negative integer id from request data (an int or a string of ASCII digits),
+    or None. `str.isdigit()` alone also accepts characters such as "²" that `int()`
+    rejects.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, str) and value.isascii() and value.isdecimal():
+        return int(value)
+    return None
+
+
+def parse_ids(values: Iterable) -> list[int]:
+    """The valid ids among `values` (see `parse_id`); the others are dropped."""
+    return [pk for pk in map(parse_id, values) if pk is not None]
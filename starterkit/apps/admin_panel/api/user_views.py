@@ -1,20 +1,28 @@
-import dataclasses
+import asyncio
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.http import HttpRequest, HttpResponseRedirect
 from django.urls import reverse
-from inertia import render
 
-from apps.admin_panel.api.request_utils import get_request_data
+from apps.admin_panel.api.export_utils import get_export_format, stream_export
+from apps.admin_panel.api.pagination_utils import get_list_total_mode, get_pagination_props
+from apps.admin_panel.api.render_utils import aresolve_props, arender, render, wants_prop
+from apps.admin_panel.api.request_utils import get_request_data, parse_id, parse_ids
 from apps.admin_panel.domain.policies import can_manage_users
-from apps.admin_panel.dto.users import UserFormInputDTO
+from apps.admin_panel.dto.users import UserBulkActionInputDTO, UserFormInputDTO
+from apps.admin_panel.selectors.exports import USER_EXPORT_COLUMNS, iter_user_export_rows
 from apps.admin_panel.selectors.groups import get_groups_choices
-from apps.admin_panel.selectors.users import get_user_detail_dto, get_user_list_page
+from apps.admin_panel.selectors.users import aget_user_page, get_user_detail_dto, get_user_page
+from apps.admin_panel.serialization.dto import to_dict, to_dicts
+from apps.admin_panel.services.user_bulk import bulk_user_action_service
+from apps.admin_panel.services.user_import import import_users_service
 from apps.admin_panel.services.users import (
-    create_user_service,
+    acreate_user_service,
+    aupdate_user_service,
     delete_user_service,
-    update_user_service,
 )
-from main.middleware import get_auth_props
 
 
 def _parse_user_form_data(request: HttpRequest) -> dict:
@@ -22,7 +30,7 @@ def _parse_user_form_data(request: HttpRequest) -> dict:
     group_ids = data.get("group_ids")
     if not isinstance(group_ids, list):
         group_ids = [group_ids] if group_ids is not None and group_ids != "" else []
-    group_ids = [int(x) for x in group_ids if str(x).isdigit()]
+    group_ids = parse_ids(group_ids)
     return {
         "username": (data.get("username") or "").strip(),
         "email": (data.get("email") or "").strip(),
@@ -39,36 +47,109 @@ def _parse_user_form_data(request: HttpRequest) -> dict:
 ALLOWED_USER_ORDER_FIELDS = {"username", "-username", "email", "-email", "is_staff", "-is_staff", "is_active", "-is_active", "is_superuser", "-is_superuser"}
 
 
+def _get_list_order_by(value: str | None) -> str:
+    return value if value in ALLOWED_USER_ORDER_FIELDS else "username"
+
+
+def _get_list_params(request: HttpRequest) -> dict:
+    return {
+        "search": request.GET.get("search", "").strip() or None,
+        "page": max(1, int(request.GET.get("page", 1))),
+        "page_size": max(1, min(100, int(request.GET.get("page_size", 25)))),
+        "order_by": _get_list_order_by(request.GET.get("order_by")),
+        "cursor": request.GET.get("cursor") or None,
+    }
+
+
+def _get_list_props(params: dict, result, errors: dict | None = None) -> dict:
+    return {
+        "users": to_dicts(result.items),
+        "pagination": get_pagination_props(result, page=params["page"], page_size=params["page_size"]),
+        "filters": {"search": params["search"] or "", "order_by": params["order_by"]},
+        "errors": errors or {},
+    }
+
+
+def _render_user_list(request: HttpRequest, errors: dict | None = None):
+    params = _get_list_params(request)
+    result = get_user_page(**params, total_mode=get_list_total_mode())
+    return render(
+        request,
+        "Admin/Users/Index",
+        {**_get_list_props(params, result, errors), "groups_choices": get_groups_choices},
+    )
+
+
 @login_required
 @user_passes_test(can_manage_users)
-def user_list(request: HttpRequest):
+async def user_list(request: HttpRequest):
+    """
+    User list page; the count, the page rows and (unless left out of a partial reload)
+    the group choices are read concurrently.
+    """
+    params = _get_list_params(request)
+    result, lazy = await asyncio.gather(
+        aget_user_page(**params, total_mode=get_list_total_mode()),
+        aresolve_props(request, "Admin/Users/Index", {"groups_choices": sync_to_async(get_groups_choices)}),
+    )
+    return await arender(request, "Admin/Users/Index", {**_get_list_props(params, result), **lazy})
+
+
+@login_required
+@user_passes_test(can_manage_users)
+def user_bulk_action(request: HttpRequest):
+    """
+    Apply a bulk action to the checked users, or with `select_all` to every user
+    matching `search`, then go back to the list with its filters kept.
+    """
+    if request.method != "POST":
+        return HttpResponseRedirect(reverse("admin_users"))
+    data = get_request_data(request)
+    user_ids = data.get("user_ids")
+    if not isinstance(user_ids, list):
+        user_ids = [user_ids] if user_ids is not None and user_ids != "" else []
+    group_id = data.get("group_id")
+    search = (data.get("search") or "").strip() or None
+    dto = UserBulkActionInputDTO(
+        action=(data.get("action") or "").strip(),
+        user_ids=parse_ids(user_ids),
+        select_all=data.get("select_all") in (True, "true", "on", 1, "1"),
+        search=search,
+        group_id=parse_id(group_id),
+    )
+    result = bulk_user_action_service(dto, request)
+    if result.success:
+        query = urlencode(
+            {k: v for k, v in (("search", search), ("order_by", _get_list_order_by(data.get("order_by")))) if v}
+        )
+        return HttpResponseRedirect(f"{reverse('admin_users')}?{query}")
+    return _render_user_list(request, result.errors)
+
+
+@login_required
+@user_passes_test(can_manage_users)
+def user_export(request: HttpRequest):
+    """
+    Stream every user matching the list's `search`/`order_by` as `?format=csv|jsonl`.
+    """
     search = request.GET.get("search", "").strip() or None
-    page = max(1, int(request.GET.get("page", 1)))
-    page_size = max(1, min(100, int(request.GET.get("page_size", 25))))
-    order_by = request.GET.get("order_by", "username")
-    if order_by not in ALLOWED_USER_ORDER_FIELDS:
-        order_by = "username"
-    items, total = get_user_list_page(search=search, order_by=order_by, page=page, page_size=page_size)
-    return render(
+    order_by = _get_list_order_by(request.GET.get("order_by"))
+    return stream_export(
         request,
-        "Admin/Users/Index",
-        {
-            "auth": get_auth_props(request),
-            "users": [dataclasses.asdict(u) for u in items],
-            "pagination": {
-                "page": page,
-                "page_size": page_size,
-                "total": total,
-                "total_pages": (total + page_size - 1) // page_size if total else 0,
-            },
-            "filters": {"search": search or "", "order_by": order_by},
-        },
+        iter_user_export_rows(search=search, order_by=order_by),
+        columns=USER_EXPORT_COLUMNS,
+        fmt=get_export_format(request),
+        name="users",
     )
 
 
 @login_required
 @user_passes_test(can_manage_users)
-def user_create(request: HttpRequest):
+async def user_create(request: HttpRequest):
+    """
+    Async so the password is hashed on the bounded hashing executor (see
+    `acreate_user_service`) rather than on the request thread.
+    """
     if request.method == "POST":
         fd = _parse_user_form_data(request)
         dto = UserFormInputDTO(
@@ -82,14 +163,13 @@ def user_create(request: HttpRequest):
             group_ids=fd["group_ids"],
             password=fd["password"],
         )
-        result = create_user_service(dto, request)
+        result = await acreate_user_service(dto, request)
         if result.success and result.user_id:
             return HttpResponseRedirect(reverse("admin_user_edit", kwargs={"user_id": result.user_id}))
-        return render(
+        return await arender(
             request,
             "Admin/Users/Create",
             {
-                "auth": get_auth_props(request),
                 "form": {
                     "username": dto.username,
                     "email": dto.email,
@@ -102,15 +182,14 @@ def user_create(request: HttpRequest):
                     "password": "",
                 },
                 "errors": result.errors,
-                "groups_choices": get_groups_choices(),
+                "groups_choices": sync_to_async(get_groups_choices),
             },
         )
 
-    return render(
+    return await arender(
         request,
         "Admin/Users/Create",
         {
-            "auth": get_auth_props(request),
             "form": {
                 "username": "",
                 "email": "",
@@ -123,17 +202,24 @@ def user_create(request: HttpRequest):
                 "password": "",
             },
             "errors": {},
-            "groups_choices": get_groups_choices(),
+            "groups_choices": sync_to_async(get_groups_choices),
         },
     )
 
 
 @login_required
 @user_passes_test(can_manage_users)
-def user_edit(request: HttpRequest, user_id: int):
-    detail = get_user_detail_dto(user_id)
-    if not detail:
-        return HttpResponseRedirect(reverse("admin_users"))
+async def user_edit(request: HttpRequest, user_id: int):
+    """
+    Async so a new password is hashed on the bounded hashing executor (see
+    `aupdate_user_service`) rather than on the request thread.
+    """
+    detail = None
+    # A partial reload that leaves out `user` and `form` never loads the user.
+    if wants_prop(request, "Admin/Users/Edit", "user", "form"):
+        detail = await sync_to_async(get_user_detail_dto)(user_id)
+        if not detail:
+            return HttpResponseRedirect(reverse("admin_users"))
 
     if request.method == "POST":
         fd = _parse_user_form_data(request)
@@ -148,15 +234,14 @@ def user_edit(request: HttpRequest, user_id: int):
             group_ids=fd["group_ids"],
             password=fd["password"],
         )
-        result = update_user_service(user_id, dto, request)
+        result = await aupdate_user_service(user_id, dto, request)
         if result.success:
             return HttpResponseRedirect(reverse("admin_user_edit", kwargs={"user_id": user_id}))
-        return render(
+        return await arender(
             request,
             "Admin/Users/Edit",
             {
-                "auth": get_auth_props(request),
-                "user": _detail_to_form(detail),
+                "user": lambda: to_dict(detail),
                 "form": {
                     "username": dto.username,
                     "email": dto.email,
@@ -169,33 +254,36 @@ def user_edit(request: HttpRequest, user_id: int):
                     "password": "",
                 },
                 "errors": result.errors,
-                "groups_choices": get_groups_choices(),
+                "groups_choices": sync_to_async(get_groups_choices),
             },
         )
 
-    return render(
+    return await arender(
         request,
         "Admin/Users/Edit",
         {
-            "auth": get_auth_props(request),
-            "user": _detail_to_form(detail),
-            "form": {
-                "username": detail.username,
-                "email": detail.email,
-                "first_name": detail.first_name,
-                "last_name": detail.last_name,
-                "is_staff": detail.is_staff,
-                "is_superuser": detail.is_superuser,
-                "is_active": detail.is_active,
-                "group_ids": detail.group_ids,
-                "password": "",
-            },
+            "user": lambda: to_dict(detail),
+            "form": lambda: _initial_form(detail),
             "errors": {},
-            "groups_choices": get_groups_choices(),
+            "groups_choices": sync_to_async(get_groups_choices),
         },
     )
 
 
+def _initial_form(detail) -> dict:
+    return {
+        "username": detail.username,
+        "email": detail.email,
+        "first_name": detail.first_name,
+        "last_name": detail.last_name,
+        "is_staff": detail.is_staff,
+        "is_superuser": detail.is_superuser,
+        "is_active": detail.is_active,
+        "group_ids": detail.group_ids,
+        "password": "",
+    }
+
+
 @login_required
 @user_passes_test(can_manage_users)
 def user_delete(request: HttpRequest, user_id: int):
@@ -207,20 +295,29 @@ def user_delete(request: HttpRequest, user_id: int):
     return render(
         request,
         "Admin/Users/Index",
-        {"auth": get_auth_props(request), "errors": result.errors, "users": [], "pagination": {"page": 1, "page_size": 25, "total": 0, "total_pages": 0}, "filters": {}},
+        {"errors": result.errors, "users": [], "pagination": {"page": 1, "page_size": 25, "total": 0, "total_pages": 0}, "filters": {}},
     )
 
 
-def _detail_to_form(detail):
-    return {
-        "id": detail.id,
-        "username": detail.username,
-        "email": detail.email,
-        "first_name": detail.first_name,
-        "last_name": detail.last_name,
-        "is_staff": detail.is_staff,
-        "is_superuser": detail.is_superuser,
-        "is_active": detail.is_active,
-        "group_ids": detail.group_ids,
-        "group_names": detail.group_names,
-    }
+@login_required
+@user_passes_test(can_manage_users)
+def user_import(request: HttpRequest):
+    """
+    Upload a CSV/JSONL file of users; the page shows how many were created and why
+    the rejected rows were skipped.
+    """
+    if request.method == "POST":
+        result = import_users_service(request.FILES.get("file"), request)
+        return render(
+            request,
+            "Admin/Users/Import",
+            {
+                "errors": result.errors,
+                "result": {
+                    "created": result.created,
+                    "failed": result.failed,
+                    "row_errors": to_dicts(result.row_errors),
+                },
+            },
+        )
+    return render(request, "Admin/Users/Import", {"errors": {}, "result": None})
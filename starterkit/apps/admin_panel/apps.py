@@ -5,3 +5,23 @@ class AdminPanelConfig(AppConfig):
     name = "apps.admin_panel"
     verbose_name = "Admin Panel"
 
+    def ready(self):
+        from apps.admin_panel import checks, signals  # noqa: F401
+
+        self.configure_inertia()
+
+    def configure_inertia(self):
+        """
+        Install the admin panel's defaults for Inertia settings that need app code, so
+        settings.py doesn't import it. Inertia reads Django settings first, so a value
+        set there still wins.
+        """
+        from django.utils.functional import lazy
+        from inertia.settings import settings as inertia_settings
+
+        from apps.admin_panel.assets.vite import get_asset_version
+        from apps.admin_panel.serialization.codecs import CodecInertiaJsonEncoder
+
+        inertia_settings.INERTIA_JSON_ENCODER = CodecInertiaJsonEncoder
+        # Resolved per read, so a new build versions pages without a restart.
+        inertia_settings.INERTIA_VERSION = lazy(get_asset_version, str)()
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
+
+from django.conf import settings
+from django.templatetags.static import static
+
+DEFAULT_VITE_ENTRY = "app.js"
+DEV_ASSET_VERSION = "dev"
+
+# request.META key set by the `vite_assets` tag and sent as a `Link` header by the
+# `vite_preload_headers` middleware. META rather than an attribute, like CSRF_COOKIE,
+# because Inertia renders the layout with a wrapper around the request.
+LINK_HEADER_META_KEY = "VITE_LINK_HEADER"
+
+
+@dataclass(frozen=True, slots=True)
+class ViteAssets:
+    """
+    URLs a page needs from the build: `scripts` to run, `preloads` to fetch
+    alongside them (modulepreload) and `styles` to link.
+    """
+
+    scripts: List[str] = field(default_factory=list)
+    preloads: List[str] = field(default_factory=list)
+    styles: List[str] = field(default_factory=list)
+
+
+def get_dev_server_url() -> str | None:
+    """The Vite dev server origin from `ADMIN_PANEL_VITE_DEV_SERVER`, or None to use the build."""
+    url = getattr(settings, "ADMIN_PANEL_VITE_DEV_SERVER", None)
+    return url.rstrip("/") if url else None
+
+
+def _manifest_path() -> str:
+    default = settings.BASE_DIR / "static" / ".vite" / "manifest.json"
+    return os.fspath(getattr(settings, "ADMIN_PANEL_VITE_MANIFEST", default))
+
+
+@lru_cache(maxsize=4)
+def _read_manifest(path: str, mtime_ns: int) -> tuple[dict, str]:
+    # Keyed by mtime so a rebuild (`vite build --watch`) is picked up without a restart.
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return json.loads(raw), hashlib.sha256(raw).hexdigest()[:16]
+
+
+def load_manifest() -> tuple[dict, str] | None:
+    """
+    Return (manifest, hash of its bytes) for the build at `ADMIN_PANEL_VITE_MANIFEST`,
+    or None when nothing has been built.
+    """
+
+    path = _manifest_path()
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _read_manifest(path, mtime_ns)
+
+
+def get_asset_version() -> str:
+    """
+    Inertia asset version: the manifest hash, so each build changes it exactly once.
+
+    Clients holding another version get a 409 from InertiaMiddleware and do one full
+    reload onto the new bundle.
+    """
+
+    if get_dev_server_url():
+        return DEV_ASSET_VERSION
+    loaded = load_manifest()
+    return loaded[1] if loaded else DEV_ASSET_VERSION
+
+
+def _collect(manifest: dict, key: str, assets: ViteAssets, seen: set) -> None:
+    # Static imports are needed before the chunk can run, so preload them (and their CSS)
+    # too; dynamic imports are left for the chunk to fetch on demand.
+    if key in seen or key not in manifest:
+        return
+    seen.add(key)
+    chunk = manifest[key]
+    for css in chunk.get("css", []):
+        _append(assets.styles, static(css))
+    for imported in chunk.get("imports", []):
+        if imported in manifest and static(manifest[imported]["file"]) not in assets.scripts:
+            _append(assets.preloads, static(manifest[imported]["file"]))
+        _collect(manifest, imported, assets, seen)
+
+
+def _append(urls: List[str], url: str) -> None:
+    if url not in urls:
+        urls.append(url)
+
+
+def get_page_assets(component: str | None = None) -> ViteAssets:
+    """
+    Assets for a full page load: the entry script, its CSS and, for the Inertia
+    `component` about to be shown, that page's chunk as a modulepreload.
+
+    In development this is just the dev server client and entry. Without a build
+    (or one lacking the entry) it is empty; the admin_panel.W002/W003 checks report that.
+    """
+
+    entry = getattr(settings, "ADMIN_PANEL_VITE_ENTRY", DEFAULT_VITE_ENTRY)
+    dev_server = get_dev_server_url()
+    if dev_server:
+        return ViteAssets(scripts=[f"{dev_server}/@vite/client", f"{dev_server}/{entry}"])
+
+    loaded = load_manifest()
+    if loaded is None or entry not in loaded[0]:
+        return ViteAssets()
+    manifest = loaded[0]
+    assets = ViteAssets(scripts=[static(manifest[entry]["file"])])
+    seen: set = set()
+    _collect(manifest, entry, assets, seen)
+    page = f"Pages/{component}.vue" if component else None
+    if page in manifest:
+        _append(assets.preloads, static(manifest[page]["file"]))
+        _collect(manifest, page, assets, seen)
+    return assets
+
+
+def get_link_header(assets: ViteAssets) -> str:
+    """`Link` header preloading the stylesheets and modules of `assets`."""
+    links = [f"<{url}>; rel=preload; as=style" for url in assets.styles]
+    links += [f"<{url}>; rel=modulepreload" for url in [*assets.scripts, *assets.preloads]]
+    return ", ".join(links)
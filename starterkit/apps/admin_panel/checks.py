@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+from apps.admin_panel.assets.vite import DEFAULT_VITE_ENTRY, get_dev_server_url, load_manifest
+
+
+@register()
+def check_session_cache(app_configs, **kwargs):
+    """
+    cached_db sessions need a cache shared by every worker; a per-process cache
+    serves stale sessions as soon as there is more than one.
+    """
+
+    if settings.DEBUG or not settings.SESSION_ENGINE.endswith(".cached_db"):
+        return []
+    if not isinstance(caches[settings.SESSION_CACHE_ALIAS], (LocMemCache, DummyCache)):
+        return []
+    return [
+        Warning(
+            "cached_db sessions are backed by a per-process cache.",
+            hint=(
+                f"Point CACHES['{settings.SESSION_CACHE_ALIAS}'] (SESSION_CACHE_ALIAS) at a shared "
+                "cache such as Redis or Memcached, or use the db or signed_cookies session engine."
+            ),
+            id="admin_panel.W001",
+        )
+    ]
+
+
+@register()
+def check_vite_build(app_configs, **kwargs):
+    """
+    Without the dev server, pages take their scripts from the build manifest; with no
+    build, or one without the configured entry, they render with no scripts at all.
+    """
+
+    if get_dev_server_url():
+        return []
+    loaded = load_manifest()
+    if loaded is None:
+        return [
+            Warning(
+                "No Vite build manifest found and ADMIN_PANEL_VITE_DEV_SERVER is not set.",
+                hint=(
+                    "Run `npm run build` in frontend/ so ADMIN_PANEL_VITE_MANIFEST exists, or set "
+                    "ADMIN_PANEL_VITE_DEV_SERVER to load assets from the Vite dev server."
+                ),
+                id="admin_panel.W002",
+            )
+        ]
+    entry = getattr(settings, "ADMIN_PANEL_VITE_ENTRY", DEFAULT_VITE_ENTRY)
+    if entry not in loaded[0]:
+        return [
+            Warning(
+                f"The Vite build manifest has no entry {entry!r}.",
+                hint="Set ADMIN_PANEL_VITE_ENTRY to the build input in frontend/vite.config.js.",
+                id="admin_panel.W003",
+            )
+        ]
+    return []
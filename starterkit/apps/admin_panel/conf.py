@@ -0,0 +1,26 @@
+from functools import cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.utils.module_loading import import_string
+
+
+def cached_setting_import(setting_name: str, default: str) -> Callable[[], Any]:
+    """
+    Return a getter for the pluggable class named by the dotted path in `setting_name`
+    (`default` when unset). The first call instantiates it; later calls return that
+    instance until override_settings() changes the setting.
+    """
+
+    @cache
+    def get() -> Any:
+        return import_string(getattr(settings, setting_name, default))()
+
+    def reset(setting, **kwargs):
+        if setting == setting_name:
+            get.cache_clear()
+
+    setting_changed.connect(reset, weak=False, dispatch_uid=f"admin_panel_reset_{setting_name}")
+    get.__doc__ = f"Return the instance configured by `{setting_name}`."
+    return get
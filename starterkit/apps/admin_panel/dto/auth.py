@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginInputDTO:
     """
     Immutable container for login request data.
@@ -13,7 +13,7 @@ class LoginInputDTO:
     next_url: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginResultDTO:
     """
     Result of attempting to log a user in.
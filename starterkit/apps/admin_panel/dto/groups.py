@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupListItemDTO:
     id: int
     name: str
@@ -10,24 +10,53 @@ class GroupListItemDTO:
     permission_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupDetailDTO:
     id: int
     name: str
     permission_ids: List[int]
     permission_codenames: List[str]
-    user_ids: List[int]
-    user_usernames: List[str]
+    user_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class GroupMemberDTO:
+    id: int
+    username: str
+    email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupFormInputDTO:
     name: str
     permission_ids: List[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupFormResultDTO:
     success: bool
     group_id: int | None
     errors: Mapping[str, Sequence[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionMatrixDTO:
+    app_labels: List[str]  # every app label with permissions, for the filter
+    groups: List[Mapping[str, object]]  # {id, name}
+    permissions: List[Mapping[str, object]]  # {id, codename}, only the filtered app
+    grants: List[tuple[int, int]]  # (group_id, permission_id) among the rows above
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionMatrixCellDTO:
+    group_id: int
+    permission_id: int
+    granted: bool
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionMatrixResultDTO:
+    success: bool
+    granted: int
+    revoked: int
+    errors: Mapping[str, Sequence[str]]
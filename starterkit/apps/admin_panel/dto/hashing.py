@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class HashQueueMetricsDTO:
+    """
+    Point-in-time view of the shared password hashing executor.
+    """
+
+    workers: int
+    max_queue: int
+    running: int
+    queued: int  # submitted, waiting for a worker
+    peak_queued: int
+    completed: int
+    rejected: int  # turned away because the queue was full
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import List, Mapping, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRowErrorDTO:
+    """
+    Why one input row was skipped; `line` is 1-based in the source file.
+    """
+
+    line: int
+    errors: Mapping[str, Sequence[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportResultDTO:
+    """
+    Outcome of a bulk import.
+
+    `errors` holds problems with the request or file as a whole; `row_errors` is capped,
+    while `failed` counts every skipped row.
+    """
+
+    created: int
+    failed: int
+    errors: Mapping[str, Sequence[str]]
+    row_errors: List[ImportRowErrorDTO]
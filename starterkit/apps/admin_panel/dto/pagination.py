@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+
+@dataclass(frozen=True, slots=True)
+class ListPageDTO:
+    """
+    One page of a list selector.
+
+    `next_cursor`/`prev_cursor` are opaque keyset cursors; pass them back as
+    `cursor` to seek to the neighbouring page without an OFFSET scan.
+    `total` is None when the selector was asked not to count, and approximate
+    when `total_is_estimate` is set.
+    """
+
+    items: List[Any]
+    total: int | None
+    has_next: bool
+    has_prev: bool
+    next_cursor: str | None
+    prev_cursor: str | None
+    total_is_estimate: bool = False
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserListItemDTO:
     id: int
     username: str
@@ -12,7 +12,7 @@ class UserListItemDTO:
     is_active: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserDetailDTO:
     id: int
     username: str
@@ -26,7 +26,7 @@ class UserDetailDTO:
     group_names: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserFormInputDTO:
     username: str
     email: str
@@ -39,8 +39,24 @@ class UserFormInputDTO:
     password: str | None  # None = don't change; "" = clear; non-empty = set
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserFormResultDTO:
     success: bool
     user_id: int | None
     errors: Mapping[str, Sequence[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class UserBulkActionInputDTO:
+    action: str
+    user_ids: List[int]
+    select_all: bool  # True = every user matching `search`, ignoring `user_ids`
+    search: str | None
+    group_id: int | None  # for add_to_group / remove_from_group
+
+
+@dataclass(frozen=True, slots=True)
+class UserBulkActionResultDTO:
+    success: bool
+    affected: int
+    errors: Mapping[str, Sequence[str]]
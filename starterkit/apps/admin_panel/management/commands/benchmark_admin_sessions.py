@@ -0,0 +1,61 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+User = get_user_model()
+
+SESSION_ENGINES = {
+    "django db": "django.contrib.sessions.backends.db",
+    "db": "apps.admin_panel.sessions.db",
+    "cached_db": "apps.admin_panel.sessions.cached_db",
+    "signed_cookies": "apps.admin_panel.sessions.signed_cookies",
+}
+ADMIN_PATHS = ("/admin/", "/admin/users/", "/admin/groups/")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request queries and latency of the admin views under each session "
+        "engine. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rounds", type=int, default=20, help="Requests per admin view and engine.")
+
+    def handle(self, *args, **options):
+        rounds = max(1, options["rounds"])
+        rows = []
+        with transaction.atomic():
+            user = User.objects.create_superuser(username=f"bench-{uuid.uuid4().hex[:12]}", password=None)
+            for label, engine in SESSION_ENGINES.items():
+                rows.append((label, *self._measure(engine, user, rounds)))
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{'engine':<16}{'queries/req':>12}{'session q/req':>15}{'ms/req':>9}")
+        for label, queries, session_queries, ms in rows:
+            self.stdout.write(f"{label:<16}{queries:>12.2f}{session_queries:>15.2f}{ms:>9.2f}")
+
+    def _measure(self, engine: str, user, rounds: int) -> tuple[float, float, float]:
+        with override_settings(SESSION_ENGINE=engine, ALLOWED_HOSTS=["testserver"]):
+            client = Client(headers={"X-Inertia": "true"})
+            client.force_login(user)
+            for path in ADMIN_PATHS:  # warm caches and the session store
+                client.get(path)
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    for path in ADMIN_PATHS:
+                        client.get(path)
+                elapsed = time.perf_counter() - start
+        requests = rounds * len(ADMIN_PATHS)
+        session_queries = sum("django_session" in query["sql"] for query in ctx.captured_queries)
+        return (
+            len(ctx.captured_queries) / requests,
+            session_queries / requests,
+            elapsed * 1000 / requests,
+        )
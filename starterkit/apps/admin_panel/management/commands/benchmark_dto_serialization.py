@@ -0,0 +1,71 @@
+import dataclasses
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.admin_panel.dto.groups import GroupDetailDTO
+from apps.admin_panel.dto.users import UserDetailDTO, UserListItemDTO
+from apps.admin_panel.serialization.dto import to_dicts
+
+
+def _sample_rows(size: int) -> dict[str, list]:
+    return {
+        "UserListItemDTO": [
+            UserListItemDTO(
+                id=n,
+                username=f"user{n}",
+                email=f"user{n}@example.com",
+                is_staff=n % 7 == 0,
+                is_superuser=False,
+                is_active=True,
+            )
+            for n in range(size)
+        ],
+        "UserDetailDTO": [
+            UserDetailDTO(
+                id=n,
+                username=f"user{n}",
+                email=f"user{n}@example.com",
+                first_name="First",
+                last_name="Last",
+                is_staff=False,
+                is_superuser=False,
+                is_active=True,
+                group_ids=[1, 2, 3],
+                group_names=["Editors", "Support", "Viewers"],
+            )
+            for n in range(size)
+        ],
+        "GroupDetailDTO": [
+            GroupDetailDTO(
+                id=n,
+                name=f"group{n}",
+                permission_ids=list(range(20)),
+                permission_codenames=[f"auth.perm_{p}" for p in range(20)],
+                user_count=n,
+            )
+            for n in range(size)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare dataclasses.asdict with the compiled DTO serializers used by the admin views."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="DTOs serialized per round.")
+        parser.add_argument("--rounds", type=int, default=20, help="Rounds per serializer; the best is kept.")
+
+    def handle(self, *args, **options):
+        rows = max(1, options["rows"])
+        rounds = max(1, options["rounds"])
+        self.stdout.write(f"{'dto':<18}{'asdict us/row':>15}{'to_dicts us/row':>17}{'speedup':>9}")
+        for label, dtos in _sample_rows(rows).items():
+            if to_dicts(dtos) != [dataclasses.asdict(dto) for dto in dtos]:
+                raise CommandError(f"to_dicts and asdict disagree on {label}.")
+            slow = self._best(lambda: [dataclasses.asdict(dto) for dto in dtos], rounds) / rows
+            fast = self._best(lambda: to_dicts(dtos), rounds) / rows
+            self.stdout.write(f"{label:<18}{slow * 1e6:>15.3f}{fast * 1e6:>17.3f}{slow / fast:>8.1f}x")
+
+    def _best(self, func, rounds: int) -> float:
+        return min(timeit.repeat(func, number=1, repeat=rounds))
@@ -0,0 +1,55 @@
+import io
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.admin_panel.services.user_import import (
+    DEFAULT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    detect_import_format,
+    import_users,
+    iter_import_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create users from a CSV (with header row) or JSON Lines file. Columns: username, "
+        "email, first_name, last_name, password or password_hash, is_active, is_staff, "
+        "is_superuser, groups (names separated by ';')."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for stdin.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per transaction.")
+        parser.add_argument("--workers", type=int, help="Password hashing processes (default: CPU count).")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or (None if path == "-" else detect_import_format(path))
+        if fmt is None:
+            raise CommandError("Cannot tell the format from the file name; pass --format.")
+
+        if path == "-":
+            stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+        else:
+            try:
+                stream = open(path, encoding="utf-8-sig", newline="")
+            except OSError as e:
+                raise CommandError(str(e))
+        with stream:
+            result = import_users(
+                iter_import_rows(stream, fmt),
+                batch_size=max(1, options["batch_size"]),
+                workers=options["workers"],
+            )
+
+        for row_error in result.row_errors:
+            messages = "; ".join(f"{field}: {' '.join(msgs)}" for field, msgs in row_error.errors.items())
+            self.stderr.write(f"line {row_error.line}: {messages}")
+        if result.failed > len(result.row_errors):
+            self.stderr.write(f"... and {result.failed - len(result.row_errors)} more rejected rows.")
+        for field, messages in result.errors.items():
+            self.stderr.write(self.style.ERROR(f"{field}: {' '.join(messages)}"))
+        self.stdout.write(self.style.SUCCESS(f"Imported {result.created} users ({result.failed} rejected)."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.admin_panel.services.dashboard_stats import rebuild_dashboard_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the dashboard statistics rollup and the daily signup series."
+
+    def handle(self, *args, **options):
+        stats = rebuild_dashboard_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt dashboard stats ({stats})."))
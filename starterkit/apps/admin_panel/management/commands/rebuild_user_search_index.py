@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from apps.admin_panel.search.backends import get_user_search_backend
+
+
+class Command(BaseCommand):
+    help = "Recreate the admin user search index from the user table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild the index on.",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        backend = get_user_search_backend()
+        with transaction.atomic(using=using):
+            backend.install(connections[using])
+            indexed = backend.rebuild(using=using)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} users with {type(backend).__name__}."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.admin_panel.services.group_counters import reconcile_group_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized group member/permission counters."
+
+    def handle(self, *args, **options):
+        fixed = reconcile_group_counters()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled group counters ({fixed} corrected)."))
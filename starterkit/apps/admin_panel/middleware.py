@@ -0,0 +1,122 @@
+from functools import partial
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.middleware.csrf import get_token
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.functional import SimpleLazyObject
+from inertia.middleware import InertiaMiddleware as BaseInertiaMiddleware
+
+from apps.admin_panel.assets.vite import LINK_HEADER_META_KEY
+from apps.admin_panel.selectors.auth import get_request_user
+from apps.admin_panel.services.invalidation import sync_invalidations
+
+
+@sync_and_async_middleware
+def invalidation_sync(get_response):
+    """
+    Middleware that applies cache invalidations published by other workers before
+    anything reads an in-process cache for this request.
+    """
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            await sync_to_async(sync_invalidations)()
+            return await get_response(request)
+
+    else:
+
+        def middleware(request):
+            sync_invalidations()
+            return get_response(request)
+
+    return middleware
+
+
+def _add_link_header(request, response):
+    links = request.META.get(LINK_HEADER_META_KEY)
+    if links and not response.has_header("Link"):
+        response["Link"] = links
+    return response
+
+
+@sync_and_async_middleware
+def vite_preload_headers(get_response):
+    """
+    Middleware that sends the stylesheets and modules a full page load needs as a
+    `Link` preload header, so browsers (and proxies that turn it into 103 Early
+    Hints) start fetching them before parsing the HTML. The `vite_assets` tag
+    collects them while the page renders.
+    """
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            return _add_link_header(request, await get_response(request))
+
+    else:
+
+        def middleware(request):
+            return _add_link_header(request, get_response(request))
+
+    return middleware
+
+
+class InertiaMiddleware(BaseInertiaMiddleware):
+    """
+    Inertia's middleware, made async-capable so it doesn't force the ASGI handler
+    to run the rest of the chain (and async views) through `async_to_sync`.
+
+    Nothing after the view here does I/O, so both branches share `_finish`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._finish(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._finish(request, await self.get_response(request))
+
+    def _finish(self, request, response):
+        # Same steps as InertiaMiddleware.__call__ after the view has run.
+        get_token(request)
+        if not self.is_inertia_request(request):
+            return response
+        if self.is_non_post_redirect(request, response):
+            response.status_code = 303
+        if self.is_stale(request):
+            return self.force_refresh(request)
+        return response
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    Drop-in for Django's AuthenticationMiddleware that resolves `request.user` through
+    the per-process user snapshot cache (`selectors.auth.get_request_user`).
+
+    A subclass rather than a function so the admin's middleware system check still
+    recognises it.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_request_user(request))
+        request.auser = partial(_auser, request)
+
+
+async def _auser(request):
+    # Resolve the same lazy `request.user` the sync path uses, so async views (and the
+    # async auth decorators) share one lookup and may read `request.user` afterwards.
+    user = request.user
+    await sync_to_async(getattr)(user, "is_authenticated")
+    return user
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db import migrations
+
+from apps.admin_panel.search.backends import get_user_search_backend
+
+
+def install_user_search_index(apps, schema_editor):
+    backend = get_user_search_backend()
+    backend.install(schema_editor.connection)
+    backend.rebuild(using=schema_editor.connection.alias)
+
+
+def uninstall_user_search_index(apps, schema_editor):
+    get_user_search_backend().uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(install_user_search_index, uninstall_user_search_index),
+    ]
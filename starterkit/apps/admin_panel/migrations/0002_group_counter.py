@@ -0,0 +1,53 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_group_counters(apps, schema_editor):
+    Group = apps.get_model('auth', 'Group')
+    GroupCounter = apps.get_model('admin_panel', 'GroupCounter')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    user_counts = dict(
+        User.groups.through.objects.values_list('group_id').annotate(n=Count('*')).order_by()
+    )
+    permission_counts = dict(
+        Group.permissions.through.objects.values_list('group_id').annotate(n=Count('*')).order_by()
+    )
+    GroupCounter.objects.bulk_create(
+        [
+            GroupCounter(
+                group_id=pk,
+                user_count=user_counts.get(pk, 0),
+                permission_count=permission_counts.get(pk, 0),
+            )
+            for pk in Group.objects.values_list('pk', flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0001_user_search_index'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupCounter',
+            fields=[
+                ('group', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counter', serialize=False, to='auth.group')),
+                ('user_count', models.PositiveIntegerField(default=0)),
+                ('permission_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_count', 'group'], name='admin_group_user_count_idx'), models.Index(fields=['permission_count', 'group'], name='admin_group_perm_count_idx')],
+            },
+        ),
+        migrations.RunPython(populate_group_counters, migrations.RunPython.noop),
+    ]
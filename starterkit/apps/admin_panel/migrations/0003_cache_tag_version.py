@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0002_group_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheTagVersion',
+            fields=[
+                ('tag', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
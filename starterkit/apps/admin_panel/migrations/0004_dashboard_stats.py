@@ -0,0 +1,64 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:01
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+
+
+def populate_dashboard_stats(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Group = apps.get_model('auth', 'Group')
+    DashboardStats = apps.get_model('admin_panel', 'DashboardStats')
+    DailySignupCount = apps.get_model('admin_panel', 'DailySignupCount')
+    totals = User.objects.aggregate(
+        user_count=Count('pk'),
+        active_user_count=Count('pk', filter=Q(is_active=True)),
+        staff_user_count=Count('pk', filter=Q(is_staff=True)),
+        superuser_count=Count('pk', filter=Q(is_superuser=True)),
+    )
+    DashboardStats.objects.update_or_create(pk=1, defaults={**totals, 'group_count': Group.objects.count()})
+    DailySignupCount.objects.bulk_create(
+        [
+            DailySignupCount(day=day, count=n)
+            for day, n in User.objects.annotate(day=TruncDate('date_joined'))
+            .values_list('day')
+            .annotate(n=Count('*'))
+            .order_by()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0003_cache_tag_version'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySignupCount',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('user_count', models.PositiveIntegerField(default=0)),
+                ('active_user_count', models.PositiveIntegerField(default=0)),
+                ('staff_user_count', models.PositiveIntegerField(default=0)),
+                ('superuser_count', models.PositiveIntegerField(default=0)),
+                ('group_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'dashboard stats',
+            },
+        ),
+        migrations.RunPython(populate_dashboard_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+from django.contrib.auth.models import Group
+from django.db import models
+
+
+class GroupCounter(models.Model):
+    """
+    Denormalized member/permission counts for a group.
+
+    Kept exact by the m2m/delete signals in `apps.admin_panel.signals`; run the
+    `reconcile_group_counters` command after writes that bypass signals (raw SQL,
+    bulk through-table inserts).
+    """
+
+    group = models.OneToOneField(Group, on_delete=models.CASCADE, primary_key=True, related_name="counter")
+    user_count = models.PositiveIntegerField(default=0)
+    permission_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user_count", "group"], name="admin_group_user_count_idx"),
+            models.Index(fields=["permission_count", "group"], name="admin_group_perm_count_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.group_id}: {self.user_count} users, {self.permission_count} permissions"
+
+
+class CacheTagVersion(models.Model):
+    """
+    Shared per-tag version counter used to invalidate in-process caches across workers.
+
+    Writers bump it inside their transaction (`services.invalidation.invalidate`);
+    each worker compares versions at the start of a request and drops local entries
+    for the tags that moved.
+    """
+
+    tag = models.CharField(max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.tag}@{self.version}"
+
+
+class DashboardStats(models.Model):
+    """
+    Single-row rollup of the user/group totals shown on the admin dashboard.
+
+    Kept current by the user/group signals in `apps.admin_panel.signals`; run the
+    `rebuild_dashboard_stats` command after writes that bypass signals.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    user_count = models.PositiveIntegerField(default=0)
+    active_user_count = models.PositiveIntegerField(default=0)
+    staff_user_count = models.PositiveIntegerField(default=0)
+    superuser_count = models.PositiveIntegerField(default=0)
+    group_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "dashboard stats"
+
+    def __str__(self):
+        return f"{self.user_count} users, {self.group_count} groups"
+
+
+class DailySignupCount(models.Model):
+    """
+    Number of users whose `date_joined` falls on `day` (in the project time zone).
+    """
+
+    day = models.DateField(primary_key=True)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day}: {self.count}"
@@ -0,0 +1,129 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from apps.admin_panel.conf import cached_setting_import
+
+User = get_user_model()
+
+USER_SEARCH_TABLE = "admin_panel_user_search"
+
+DEFAULT_USER_SEARCH_BACKEND = "apps.admin_panel.search.backends.SQLiteFTS5SearchBackend"
+
+
+class UserSearchBackend(ABC):
+    """
+    Interface for the index behind the admin user search.
+
+    `index`/`remove` keep the index in step with the user table (signals call them on
+    save/delete; bulk writers must call them explicitly), `filter` narrows a queryset
+    to the users matching a search term without changing its ordering.
+    """
+
+    def install(self, connection) -> None:
+        """Create the index structures on `connection`."""
+
+    def uninstall(self, connection) -> None:
+        """Drop the index structures from `connection`."""
+
+    def index(self, rows: Iterable[tuple[int, str, str]], *, using: str = "default") -> None:
+        """Insert or refresh (id, username, email) rows."""
+
+    def remove(self, user_ids: Iterable[int], *, using: str = "default") -> None:
+        """Forget deleted users."""
+
+    def rebuild(self, *, using: str = "default") -> int:
+        """Re-index every user and return how many rows were indexed."""
+        return 0
+
+    @abstractmethod
+    def filter(self, qs: QuerySet, term: str) -> QuerySet:
+        """Narrow `qs` to the users whose username or email contains `term`."""
+
+
+class IContainsSearchBackend(UserSearchBackend):
+    """
+    No index: case-insensitive substring match on username and email.
+    """
+
+    def filter(self, qs: QuerySet, term: str) -> QuerySet:
+        return qs.filter(Q(username__icontains=term) | Q(email__icontains=term))
+
+
+class SQLiteFTS5SearchBackend(IContainsSearchBackend):
+    """
+    FTS5 virtual table with the trigram tokenizer, keyed by user id.
+
+    Trigram matching gives the same case-insensitive substring semantics as icontains
+    but through an index. Terms shorter than a trigram, and databases other than
+    SQLite >= 3.34, fall back to icontains.
+    """
+
+    table = USER_SEARCH_TABLE
+    min_term_length = 3
+
+    def is_supported(self, connection) -> bool:
+        return connection.vendor == "sqlite" and sqlite3.sqlite_version_info >= (3, 34, 0)
+
+    def install(self, connection) -> None:
+        if not self.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+                "USING fts5(username, email, tokenize='trigram')"
+            )
+
+    def uninstall(self, connection) -> None:
+        if not self.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def index(self, rows: Iterable[tuple[int, str, str]], *, using: str = "default") -> None:
+        connection = connections[using]
+        rows = list(rows)
+        if not rows or not self.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO {self.table}(rowid, username, email) VALUES (%s, %s, %s)",
+                rows,
+            )
+
+    def remove(self, user_ids: Iterable[int], *, using: str = "default") -> None:
+        connection = connections[using]
+        user_ids = list(user_ids)
+        if not user_ids or not self.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [(pk,) for pk in user_ids])
+
+    def rebuild(self, *, using: str = "default") -> int:
+        connection = connections[using]
+        if not self.is_supported(connection):
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table}(rowid, username, email) "
+                f"SELECT id, username, COALESCE(email, '') FROM {User._meta.db_table}"
+            )
+            return cursor.rowcount
+
+    def filter(self, qs: QuerySet, term: str) -> QuerySet:
+        if len(term) < self.min_term_length or not self.is_supported(connections[qs.db]):
+            return super().filter(qs, term)
+        # Quote as a single FTS5 phrase so operators in the term are matched literally.
+        phrase = '"' + term.replace('"', '""') + '"'
+        return qs.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", [phrase])
+        )
+
+
+get_user_search_backend = cached_setting_import("ADMIN_PANEL_USER_SEARCH_BACKEND", DEFAULT_USER_SEARCH_BACKEND)
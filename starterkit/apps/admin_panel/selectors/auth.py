@@ -1,17 +1,39 @@
+import datetime
+from functools import partial
 from typing import Optional
 
-from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user, get_user_model
 from django.contrib.auth.models import Group
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.admin_panel.models import DailySignupCount, DashboardStats
+from apps.admin_panel.selectors.caching import USERS_TAG, LocalTagCache, user_tag
+from apps.admin_panel.selectors.concurrency import gather_reads
 
 
 UserModel = get_user_model()
 
+DASHBOARD_STAT_FIELDS = (
+    "user_count",
+    "active_user_count",
+    "staff_user_count",
+    "superuser_count",
+    "group_count",
+)
+SIGNUP_SERIES_DAYS = 30
+
+_request_user_cache = LocalTagCache("request_user", max_entries=10_000)
+
 
 def get_user_by_username(username: str) -> Optional[UserModel]:
     """
     Selector for looking up a user by username.
 
     No business logic, just a thin wrapper around the ORM.
+
+    Queries: 1 (returns a full instance; callers need it for auth checks).
     """
 
     if not username:
@@ -20,10 +42,92 @@ def get_user_by_username(username: str) -> Optional[UserModel]:
     return UserModel.objects.filter(username=username).first()
 
 
-def get_dashboard_stats() -> dict:
-    """Return aggregate counts for the admin dashboard."""
+def get_request_user(request):
+    """
+    Resolve `request.user` like `django.contrib.auth.get_user`, served from a per-process
+    snapshot of the user row when one is fresh.
+
+    Snapshots are keyed by user id, auth backend and session auth hash, so a password
+    change never matches an old entry. They expire after `ADMIN_PANEL_AUTH_USER_CACHE_TIMEOUT`
+    seconds (0 disables the cache). Saving or deleting a user evicts that user's snapshots
+    through its `user_tag`; bulk writes evict them all through the `users` tag.
+
+    Queries: 0 on a hit, otherwise those of `get_user` (1).
+    """
+
+    timeout = getattr(settings, "ADMIN_PANEL_AUTH_USER_CACHE_TIMEOUT", 30)
+    try:
+        user_id = UserModel._meta.pk.to_python(request.session[SESSION_KEY])
+        backend_path = request.session[BACKEND_SESSION_KEY]
+        session_hash = request.session.get(HASH_SESSION_KEY)
+    except KeyError:
+        return get_user(request)
+    if not timeout or not session_hash or backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return get_user(request)
+
+    key = (user_id, backend_path, session_hash)
+    snapshot = _request_user_cache.get(key)
+    if snapshot is not None:
+        db, field_names, values = snapshot
+        user = UserModel.from_db(db, field_names, values)
+        user.backend = backend_path
+        return user
+
+    user = get_user(request)
+    if user.is_authenticated and user.pk == user_id:
+        field_names = [field.attname for field in UserModel._meta.concrete_fields]
+        _request_user_cache.set(
+            key,
+            (user._state.db, field_names, tuple(getattr(user, name) for name in field_names)),
+            tags=[USERS_TAG, user_tag(user_id)],
+            timeout=timeout,
+        )
+    return user
+
+
+def get_dashboard_stats(days: int = SIGNUP_SERIES_DAYS) -> dict:
+    """
+    Return the admin dashboard totals and the daily signups of the last `days` days.
+
+    Reads the `DashboardStats` rollup rather than counting the tables; if the rollup
+    row is missing the totals are aggregated live instead.
+
+    Queries: 2 (rollup row, signup series).
+    """
+
+    return {**_get_dashboard_totals(), "signups": _get_signup_series(days)}
+
+
+async def aget_dashboard_stats(days: int = SIGNUP_SERIES_DAYS) -> dict:
+    """
+    `get_dashboard_stats` for async views; the totals and the signup series are read
+    concurrently.
+    """
+
+    totals, signups = await gather_reads(_get_dashboard_totals, partial(_get_signup_series, days))
+    return {**totals, "signups": signups}
+
+
+def _get_dashboard_totals() -> dict:
+    stats = DashboardStats.objects.filter(pk=DashboardStats.SINGLETON_ID).values(*DASHBOARD_STAT_FIELDS).first()
+    if stats is not None:
+        return stats
     return {
-        "user_count": UserModel.objects.count(),
+        **UserModel.objects.aggregate(
+            user_count=Count("pk"),
+            active_user_count=Count("pk", filter=Q(is_active=True)),
+            staff_user_count=Count("pk", filter=Q(is_staff=True)),
+            superuser_count=Count("pk", filter=Q(is_superuser=True)),
+        ),
         "group_count": Group.objects.count(),
     }
 
+
+def _get_signup_series(days: int) -> list[dict]:
+    today = timezone.localdate()
+    start = today - datetime.timedelta(days=days - 1)
+    counts = dict(DailySignupCount.objects.filter(day__gte=start, day__lte=today).values_list("day", "count"))
+    return [
+        {"date": day.isoformat(), "count": counts.get(day, 0)}
+        for day in (start + datetime.timedelta(days=n) for n in range(days))
+    ]
@@ -0,0 +1,168 @@
+import functools
+import hashlib
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+KEY_PREFIX = "admin_panel:selector"
+
+GROUPS_TAG = "groups"
+PERMISSIONS_TAG = "permissions"
+USERS_TAG = "users"
+
+
+def user_tag(user_id) -> str:
+    """Tag of the entries that depend on one user's row (e.g. request-user snapshots)."""
+    return f"{USERS_TAG}:{user_id}"
+
+
+def _cache():
+    return caches[getattr(settings, "ADMIN_PANEL_SELECTOR_CACHE", "default")]
+
+
+def _tag_key(tag: str) -> str:
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def _tag_versions(tags: tuple[str, ...]) -> list[str]:
+    cache = _cache()
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    missing = {key: uuid.uuid4().hex for key in keys if key not in versions}
+    if missing:
+        # Tag versions never expire on their own; a lost version just means a miss.
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def _bump_tags(tags: tuple[str, ...]) -> None:
+    _cache().set_many({_tag_key(tag): uuid.uuid4().hex for tag in tags}, None)
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Drop every cached selector result carrying any of `tags`.
+
+    Runs now and again when the surrounding transaction commits, so a concurrent
+    request cannot re-cache pre-commit data under the new version.
+    """
+
+    _bump_tags(tags)
+    transaction.on_commit(lambda: _bump_tags(tags))
+
+
+def cached_selector(*tags: str, timeout: int | None = None) -> Callable:
+    """
+    Cache a selector's return value in the configured Django cache under `tags`.
+
+    The key embeds the current version of each tag, so `invalidate_tags` makes old
+    entries unreachable without having to know their keys. Arguments must have a stable
+    `repr`. The undecorated function stays available as `.uncached`.
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            signature = repr((args, sorted(kwargs.items()), _tag_versions(tags)))
+            key = f"{KEY_PREFIX}:{name}:{hashlib.sha1(signature.encode()).hexdigest()}"
+            cache = _cache()
+            sentinel = object()
+            value = cache.get(key, sentinel)
+            if value is sentinel:
+                value = func(*args, **kwargs)
+                cache.set(
+                    key,
+                    value,
+                    timeout if timeout is not None else getattr(settings, "ADMIN_PANEL_SELECTOR_CACHE_TIMEOUT", 300),
+                )
+            return value
+
+        wrapper.uncached = func
+        wrapper.cache_tags = tags
+        return wrapper
+
+    return decorator
+
+
+class LocalTagCache:
+    """
+    Process-local memo for values that are too hot to fetch from a remote cache.
+
+    Entries carry tags and an optional TTL. `drop_local_tags` (driven by the
+    cross-worker bus in `services.invalidation`) evicts exactly the tagged entries.
+    With `max_entries`, expired entries and then the oldest ones are evicted on `set`.
+    """
+
+    def __init__(self, name: str, *, max_entries: int | None = None):
+        self.name = name
+        self.max_entries = max_entries
+        self._entries: dict[Any, tuple[Any, frozenset[str], float | None]] = {}
+        self._lock = threading.Lock()
+        _local_caches.add(self)
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, _, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value, *, tags: Iterable[str], timeout: float | None = None) -> None:
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, frozenset(tags), expires_at)
+            if self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (_, _, exp) in self._entries.items() if exp is not None and exp <= now]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def drop_tags(self, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        with self._lock:
+            for key in [k for k, (_, entry_tags, _) in self._entries.items() if entry_tags & tags]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local_caches: "weakref.WeakSet[LocalTagCache]" = weakref.WeakSet()
+
+
+def drop_local_tags(tags: Iterable[str]) -> None:
+    """
+    Evict `tags` from every in-process cache of this worker.
+
+    This includes `cached_selector` entries when the Django cache is itself per-process.
+    """
+
+    tags = tuple(tags)
+    for local_cache in list(_local_caches):
+        local_cache.drop_tags(tags)
+    if isinstance(_cache(), (LocMemCache, DummyCache)):
+        _bump_tags(tags)
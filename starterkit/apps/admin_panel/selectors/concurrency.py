@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+
+
+def _on_own_connection(func: Callable[[], Any]) -> Callable[[], Any]:
+    def run():
+        try:
+            return func()
+        finally:
+            # Executor threads outlive the request: hand the connection back per CONN_MAX_AGE.
+            close_old_connections()
+
+    return run
+
+
+def _connections_persist(using: str) -> bool:
+    # CONN_MAX_AGE None means unlimited; 0 closes the connection after every call here.
+    max_age = connections.settings[using].get("CONN_MAX_AGE", 0)
+    return max_age is None or max_age > 0
+
+
+def _run_in_turn(funcs: tuple[Callable[[], Any], ...], using: str) -> list | None:
+    # One hop to the request's own thread: run everything here if a transaction is open
+    # (ATOMIC_REQUESTS, tests), since other connections can't see its writes.
+    if connections[using].in_atomic_block:
+        return [func() for func in funcs]
+    return None
+
+
+async def gather_reads(*funcs: Callable[[], Any], using: str = DEFAULT_DB_ALIAS) -> list:
+    """
+    Run independent read-only callables concurrently and return their results in order.
+
+    Awaiting several async ORM calls together does not overlap them: they all run on
+    the request's single sync thread and connection. Each callable here gets a worker
+    thread, and so its own database connection, and the whole call takes about as long
+    as the slowest one. Inside an open transaction, or with
+    ADMIN_PANEL_CONCURRENT_READS off, they run one after another on the request's
+    connection instead.
+
+    Worker connections are only worth it when they are reused, so concurrency also
+    needs persistent connections (CONN_MAX_AGE > 0 or None). With the default of 0 every
+    read would pay for a connect and a close, and the reads run in turn as well.
+    """
+
+    concurrent = getattr(settings, "ADMIN_PANEL_CONCURRENT_READS", True) and _connections_persist(using)
+    if len(funcs) < 2 or not concurrent:
+        return await sync_to_async(lambda: [func() for func in funcs])()
+    results = await sync_to_async(_run_in_turn)(funcs, using)
+    if results is not None:
+        return results
+    return list(
+        await asyncio.gather(
+            *(sync_to_async(_on_own_connection(func), thread_sensitive=False)() for func in funcs)
+        )
+    )
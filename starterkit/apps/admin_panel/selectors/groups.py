@@ -1,7 +1,31 @@
-from django.contrib.auth.models import Group
-from django.db.models import Count, QuerySet
+from typing import Iterable
 
-from apps.admin_panel.dto.groups import GroupDetailDTO, GroupListItemDTO
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db.models import F, QuerySet
+from django.db.models.functions import Coalesce
+
+from apps.admin_panel.dto.groups import (
+    GroupDetailDTO,
+    GroupListItemDTO,
+    GroupMemberDTO,
+    PermissionMatrixDTO,
+)
+from apps.admin_panel.dto.pagination import ListPageDTO
+from apps.admin_panel.search.backends import get_user_search_backend
+from apps.admin_panel.selectors.caching import GROUPS_TAG, PERMISSIONS_TAG, cached_selector
+from apps.admin_panel.selectors.pagination import (
+    TOTAL_EXACT,
+    apaginate,
+    count_total,
+    paginate,
+    paginate_keyset,
+)
+
+User = get_user_model()
+GroupPermissions = Group.permissions.through
+
+GROUP_LIST_FIELDS = ("id", "name", "user_count", "permission_count")
 
 
 def get_groups_queryset(
@@ -9,9 +33,13 @@ def get_groups_queryset(
     search: str | None = None,
     order_by: str = "name",
 ) -> QuerySet:
+    # Counts come from the denormalized GroupCounter row (indexed, no GROUP BY), so
+    # sorting and keyset paging on them never aggregates the membership tables. A group
+    # created behind the signals' back has no counter row until reconciled; it counts as
+    # 0, so cursors never have to seek on NULL.
     qs = Group.objects.annotate(
-        user_count=Count("user"),
-        permission_count=Count("permissions"),
+        user_count=Coalesce(F("counter__user_count"), 0),
+        permission_count=Coalesce(F("counter__permission_count"), 0),
     ).order_by(order_by)
     if search and search.strip():
         term = search.strip()
@@ -26,54 +54,228 @@ def get_group_list_page(
     page: int = 1,
     page_size: int = 25,
 ) -> tuple[list[GroupListItemDTO], int]:
-    qs = get_groups_queryset(search=search, order_by=order_by)
+    """
+    Offset page of groups plus the exact total.
+
+    Queries: 2 (count, page).
+    """
+
+    qs = get_groups_queryset(search=search, order_by=order_by).values_list(*GROUP_LIST_FIELDS)
     total = qs.count()
     start = (page - 1) * page_size
     rows = qs[start : start + page_size]
-    items = [
-        GroupListItemDTO(
-            id=g.id,
-            name=g.name,
-            user_count=g.user_count,
-            permission_count=g.permission_count,
-        )
-        for g in rows
-    ]
+    items = [_to_list_item(row) for row in rows]
     return items, total
 
 
+def get_group_page(
+    *,
+    search: str | None = None,
+    order_by: str = "name",
+    page: int = 1,
+    cursor: str | None = None,
+    page_size: int = 25,
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    Page of groups for the admin list; seeks on (`order_by`, id) when given a `cursor`.
+    `total_mode` picks exact, estimated or no counting (see selectors.pagination).
+
+    Queries: 1 for the page, plus 1 for the count unless `total_mode` is "none" or an
+    estimate is served from planner statistics or the cache.
+    """
+
+    qs = get_groups_queryset(search=search, order_by=order_by).values_list(*GROUP_LIST_FIELDS)
+    total, total_is_estimate = count_total(qs, mode=total_mode)
+    return paginate(
+        qs,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        to_item=_to_list_item,
+        total=total,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+async def aget_group_page(
+    *,
+    search: str | None = None,
+    order_by: str = "name",
+    page: int = 1,
+    cursor: str | None = None,
+    page_size: int = 25,
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    `get_group_page` for async views; the count and the page run concurrently.
+    """
+
+    qs = get_groups_queryset(search=search, order_by=order_by).values_list(*GROUP_LIST_FIELDS)
+    return await apaginate(
+        qs,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        to_item=_to_list_item,
+        total_mode=total_mode,
+    )
+
+
+def _to_list_item(row: tuple) -> GroupListItemDTO:
+    group_id, name, user_count, permission_count = row
+    return GroupListItemDTO(
+        id=group_id,
+        name=name,
+        user_count=user_count,
+        permission_count=permission_count,
+    )
+
+
 def get_group_by_id(group_id: int) -> Group | None:
+    """Full group instance for services that save it. Queries: 1."""
     return Group.objects.filter(pk=group_id).first()
 
 
 def get_group_detail_dto(group_id: int) -> GroupDetailDTO | None:
-    group = get_group_by_id(group_id)
-    if not group:
-        return None
-    perms = list(group.permissions.all().order_by("content_type__app_label", "codename"))
-    users = list(group.user_set.all().order_by("username"))
-    return GroupDetailDTO(
-        id=group.id,
-        name=group.name,
-        permission_ids=[p.id for p in perms],
-        permission_codenames=[f"{p.content_type.app_label}.{p.codename}" for p in perms],
-        user_ids=[u.id for u in users],
-        user_usernames=[u.username for u in users],
+    """
+    Group detail with its permissions and member count.
+
+    Members are not loaded here; page through them with `get_group_members_page`.
+
+    Queries: 1 (see `get_group_detail_dtos`).
+    """
+
+    return get_group_detail_dtos([group_id]).get(group_id)
+
+
+def get_group_detail_dtos(group_ids: Iterable[int]) -> dict[int, GroupDetailDTO]:
+    """
+    Batched `get_group_detail_dto`: {id: dto} for the groups that exist.
+
+    Queries: 1 regardless of how many ids (group name and counter LEFT JOINed to
+    permissions and their content type). Cost does not depend on group size.
+    """
+
+    group_ids = set(group_ids)
+    if not group_ids:
+        return {}
+    rows = (
+        Group.objects.filter(pk__in=group_ids)
+        .values_list(
+            "id",
+            "name",
+            "counter__user_count",
+            "permissions__id",
+            "permissions__content_type__app_label",
+            "permissions__codename",
+        )
+        .order_by("pk", "permissions__content_type__app_label", "permissions__codename")
+    )
+    groups: dict[int, tuple[str, int]] = {}
+    perms: dict[int, list[tuple[int, str]]] = {}
+    for gid, name, user_count, pid, app_label, codename in rows:
+        groups.setdefault(gid, (name, user_count or 0))
+        group_perms = perms.setdefault(gid, [])
+        if pid is not None:
+            group_perms.append((pid, f"{app_label}.{codename}"))
+
+    return {
+        gid: GroupDetailDTO(
+            id=gid,
+            name=name,
+            permission_ids=[pid for pid, _ in perms[gid]],
+            permission_codenames=[label for _, label in perms[gid]],
+            user_count=user_count,
+        )
+        for gid, (name, user_count) in groups.items()
+    }
+
+
+def get_group_members_page(
+    group_id: int,
+    *,
+    search: str | None = None,
+    cursor: str | None = None,
+    page_size: int = 25,
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    Keyset page of a group's members ordered by username, optionally searched through
+    the user search index.
+
+    Queries: 1 for the page, plus 1 for the count unless `total_mode` is "none" or an
+    estimate is served from the cache.
+    """
+
+    qs = User.objects.filter(groups__id=group_id)
+    if search and search.strip():
+        qs = get_user_search_backend().filter(qs, search.strip())
+    qs = qs.values_list("id", "username", "email")
+    total, total_is_estimate = count_total(qs, mode=total_mode)
+    return paginate_keyset(
+        qs,
+        order_by="username",
+        cursor=cursor,
+        page_size=page_size,
+        to_item=_to_member,
+        total=total,
+        total_is_estimate=total_is_estimate,
     )
 
 
+def _to_member(row: tuple) -> GroupMemberDTO:
+    user_id, username, email = row
+    return GroupMemberDTO(id=user_id, username=username, email=email or "")
+
+
+@cached_selector(GROUPS_TAG)
 def get_groups_choices() -> list[dict]:
-    """Return list of {id, name} for all groups for use in user forms."""
-    return [{"id": g.id, "name": g.name} for g in Group.objects.order_by("name")]
+    """
+    Return list of {id, name} for all groups for use in user forms.
+
+    Queries: 1 on a cache miss, 0 otherwise (invalidated on group save/delete).
+    """
+    return [{"id": gid, "name": name} for gid, name in Group.objects.order_by("name").values_list("id", "name")]
 
 
+@cached_selector(PERMISSIONS_TAG)
 def get_all_permissions_choices() -> list[tuple[int, str]]:
-    """Return (id, label) for all permissions for use in forms."""
-    from django.contrib.auth.models import Permission
+    """
+    Return (id, label) for all permissions for use in forms.
 
-    perms = (
-        Permission.objects.select_related("content_type")
-        .order_by("content_type__app_label", "codename")
-        .all()
+    Queries: 1 on a cache miss (permissions joined to their content type), 0 otherwise
+    (invalidated on permission/content type changes and after migrate).
+    """
+    rows = Permission.objects.order_by("content_type__app_label", "codename").values_list(
+        "id", "content_type__app_label", "codename"
     )
-    return [(p.id, f"{p.content_type.app_label}.{p.codename}") for p in perms]
+    return [(pid, f"{app_label}.{codename}") for pid, app_label, codename in rows]
+
+
+def get_permission_matrix(*, app_label: str | None = None) -> PermissionMatrixDTO:
+    """
+    Groups x permissions grid for the bulk permission editor, limited to the
+    permissions of `app_label` (all apps when None).
+
+    Queries: 1 for the grants, plus 1 each for the group and permission lists on a
+    selector cache miss.
+    """
+
+    choices = get_all_permissions_choices()
+    permissions = [
+        {"id": pid, "codename": label}
+        for pid, label in choices
+        if app_label is None or label.split(".", 1)[0] == app_label
+    ]
+    app_labels = sorted({label.split(".", 1)[0] for _, label in choices})
+    groups = get_groups_choices()
+    grants: list[tuple[int, int]] = []
+    if groups and permissions:
+        qs = GroupPermissions.objects.order_by("group_id", "permission_id")
+        if app_label is not None:
+            qs = qs.filter(permission__content_type__app_label=app_label)
+        grants = list(qs.values_list("group_id", "permission_id"))
+    return PermissionMatrixDTO(app_labels=app_labels, groups=groups, permissions=permissions, grants=grants)
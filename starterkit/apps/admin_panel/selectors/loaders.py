@@ -0,0 +1,59 @@
+from typing import Callable, Generic, Iterable, TypeVar
+
+from django.http import HttpRequest
+
+from apps.admin_panel.dto.groups import GroupDetailDTO
+from apps.admin_panel.dto.users import UserDetailDTO
+from apps.admin_panel.selectors.groups import get_group_detail_dtos
+from apps.admin_panel.selectors.users import get_user_detail_dtos
+
+T = TypeVar("T")
+
+
+class DetailLoader(Generic[T]):
+    """
+    DataLoader-style memo around a batched detail selector.
+
+    `load_many` resolves every id not seen before in one call to `batch_fn`, so looping
+    callers pay the batch selector's constant query count once per new id set. Misses
+    are remembered too.
+    """
+
+    def __init__(self, batch_fn: Callable[[Iterable[int]], dict[int, T]]):
+        self._batch_fn = batch_fn
+        self._cache: dict[int, T | None] = {}
+
+    def load(self, pk: int) -> T | None:
+        return self.load_many([pk])[0]
+
+    def load_many(self, pks: Iterable[int]) -> list[T | None]:
+        pks = list(pks)
+        missing = {pk for pk in pks if pk not in self._cache}
+        if missing:
+            found = self._batch_fn(missing)
+            for pk in missing:
+                self._cache[pk] = found.get(pk)
+        return [self._cache[pk] for pk in pks]
+
+    def clear(self, pk: int | None = None) -> None:
+        if pk is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(pk, None)
+
+
+def _request_loader(request: HttpRequest, key: str, batch_fn) -> DetailLoader:
+    loaders = request.__dict__.setdefault("_admin_panel_loaders", {})
+    if key not in loaders:
+        loaders[key] = DetailLoader(batch_fn)
+    return loaders[key]
+
+
+def get_user_detail_loader(request: HttpRequest) -> DetailLoader[UserDetailDTO]:
+    """Per-request loader for `UserDetailDTO`s."""
+    return _request_loader(request, "user_detail", get_user_detail_dtos)
+
+
+def get_group_detail_loader(request: HttpRequest) -> DetailLoader[GroupDetailDTO]:
+    """Per-request loader for `GroupDetailDTO`s."""
+    return _request_loader(request, "group_detail", get_group_detail_dtos)
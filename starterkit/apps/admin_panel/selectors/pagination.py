@@ -0,0 +1,287 @@
+import base64
+import dataclasses
+import hashlib
+import json
+from functools import partial
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+from apps.admin_panel.dto.pagination import ListPageDTO
+from apps.admin_panel.selectors.concurrency import gather_reads
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+# How list selectors compute `total`:
+# - exact: run COUNT(*) on every request.
+# - estimate: planner statistics for unfiltered lists (PostgreSQL), otherwise a COUNT(*)
+#   cached per filter signature for ADMIN_PANEL_COUNT_CACHE_TIMEOUT seconds.
+# - none: skip counting; `has_next` comes from fetching one extra row.
+TOTAL_EXACT = "exact"
+TOTAL_ESTIMATE = "estimate"
+TOTAL_NONE = "none"
+TOTAL_MODES = {TOTAL_EXACT, TOTAL_ESTIMATE, TOTAL_NONE}
+
+
+def encode_cursor(order_by: str, value: Any, pk: int, direction: str) -> str:
+    """
+    Build an opaque cursor pointing just past the row (`value`, `pk`).
+
+    The active `order_by` is baked in so a cursor is ignored once the sort changes.
+    """
+
+    payload = json.dumps({"o": order_by, "v": value, "id": pk, "d": direction}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, order_by: str) -> dict | None:
+    """
+    Return the cursor payload, or None if it is missing, malformed or for another ordering.
+    """
+
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("o") != order_by:
+        return None
+    if data.get("d") not in (CURSOR_NEXT, CURSOR_PREV) or not isinstance(data.get("id"), int):
+        return None
+    return data
+
+
+def _planner_row_estimate(qs: QuerySet) -> int | None:
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [qs.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 until the table has been vacuumed/analyzed at least once.
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def _count_cache_key(qs: QuerySet) -> str:
+    signature = str(qs.order_by().query)
+    digest = hashlib.sha1(signature.encode()).hexdigest()
+    return f"admin_panel:count:{qs.model._meta.label_lower}:{digest}"
+
+
+def count_total(qs: QuerySet, *, mode: str = TOTAL_EXACT) -> tuple[int | None, bool]:
+    """
+    Return (total, is_estimate) for `qs` according to `mode` (see TOTAL_MODES).
+    """
+
+    if mode == TOTAL_NONE:
+        return None, False
+    if mode != TOTAL_ESTIMATE:
+        return qs.count(), False
+
+    if not qs.query.where:
+        estimate = _planner_row_estimate(qs)
+        if estimate is not None:
+            return estimate, True
+
+    key = _count_cache_key(qs)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, True
+    total = qs.count()
+    cache.set(key, total, getattr(settings, "ADMIN_PANEL_COUNT_CACHE_TIMEOUT", 60))
+    return total, False
+
+
+def _seek_filter(field: str, descending: bool, value: Any, pk: int) -> Q:
+    op = "lt" if descending else "gt"
+    return Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": pk})
+
+
+def _ordered(qs: QuerySet, field: str, descending: bool) -> QuerySet:
+    if descending:
+        return qs.order_by(f"-{field}", "-pk")
+    return qs.order_by(field, "pk")
+
+
+def _build_page(
+    items: list,
+    *,
+    order_by: str,
+    total: int | None,
+    total_is_estimate: bool,
+    has_next: bool,
+    has_prev: bool,
+) -> ListPageDTO:
+    field = order_by.lstrip("-")
+    next_cursor = prev_cursor = None
+    if items and has_next:
+        last = items[-1]
+        next_cursor = encode_cursor(order_by, getattr(last, field), last.id, CURSOR_NEXT)
+    if items and has_prev:
+        first = items[0]
+        prev_cursor = encode_cursor(order_by, getattr(first, field), first.id, CURSOR_PREV)
+    return ListPageDTO(
+        items=items,
+        total=total,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+def paginate_keyset(
+    qs: QuerySet,
+    *,
+    order_by: str,
+    cursor: str | None,
+    page_size: int,
+    to_item: Callable[[Any], Any],
+    total: int | None,
+    total_is_estimate: bool = False,
+) -> ListPageDTO:
+    """
+    Seek to the page after/before `cursor` on (`order_by`, pk) instead of using OFFSET.
+
+    Items returned by `to_item` must expose the ordered field and `id` as attributes;
+    they are used to build the neighbouring cursors.
+    """
+
+    field = order_by.lstrip("-")
+    descending = order_by.startswith("-")
+    state = decode_cursor(cursor, order_by)
+    backwards = state is not None and state["d"] == CURSOR_PREV
+    scan_descending = descending != backwards
+
+    qs = _ordered(qs, field, scan_descending)
+    if state is not None:
+        qs = qs.filter(_seek_filter(field, scan_descending, state["v"], state["id"]))
+
+    rows = list(qs[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    return _build_page(
+        [to_item(r) for r in rows],
+        order_by=order_by,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        has_next=True if backwards else has_more,
+        has_prev=has_more if backwards else state is not None,
+    )
+
+
+def paginate_offset(
+    qs: QuerySet,
+    *,
+    order_by: str,
+    page: int,
+    page_size: int,
+    to_item: Callable[[Any], Any],
+    total: int | None,
+    total_is_estimate: bool = False,
+) -> ListPageDTO:
+    """
+    Classic page-number slicing, still emitting cursors so the client can seek from here on.
+
+    One extra row is fetched to know `has_next` without counting; on the last page the
+    exact total falls out of the slice for free.
+    """
+
+    field = order_by.lstrip("-")
+    qs = _ordered(qs, field, order_by.startswith("-"))
+    start = (page - 1) * page_size
+    rows = list(qs[start : start + page_size + 1])
+    has_next = len(rows) > page_size
+    if not has_next and (rows or page == 1):
+        total, total_is_estimate = start + len(rows), False
+    return _build_page(
+        [to_item(r) for r in rows[:page_size]],
+        order_by=order_by,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        has_next=has_next,
+        has_prev=page > 1,
+    )
+
+
+def paginate(
+    qs: QuerySet,
+    *,
+    order_by: str,
+    page: int,
+    cursor: str | None,
+    page_size: int,
+    to_item: Callable[[Any], Any],
+    total: int | None,
+    total_is_estimate: bool = False,
+) -> ListPageDTO:
+    """`paginate_keyset` when given a `cursor`, else `paginate_offset`."""
+    if cursor:
+        return paginate_keyset(
+            qs,
+            order_by=order_by,
+            cursor=cursor,
+            page_size=page_size,
+            to_item=to_item,
+            total=total,
+            total_is_estimate=total_is_estimate,
+        )
+    return paginate_offset(
+        qs,
+        order_by=order_by,
+        page=page,
+        page_size=page_size,
+        to_item=to_item,
+        total=total,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+async def apaginate(
+    qs: QuerySet,
+    *,
+    order_by: str,
+    page: int,
+    cursor: str | None,
+    page_size: int,
+    to_item: Callable[[Any], Any],
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    `count_total` + `paginate` for async views, with the count and the page rows
+    fetched concurrently (see `gather_reads`).
+    """
+
+    rows = partial(
+        paginate,
+        qs,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        to_item=to_item,
+        total=None,
+    )
+    if total_mode == TOTAL_NONE:
+        (result,) = await gather_reads(rows)
+        return result
+    (total, total_is_estimate), result = await gather_reads(partial(count_total, qs, mode=total_mode), rows)
+    if result.total is not None:
+        # An offset page with nothing after it already knows the exact total.
+        return result
+    return dataclasses.replace(result, total=total, total_is_estimate=total_is_estimate)
@@ -1,7 +1,17 @@
+from typing import Iterable
+
 from django.contrib.auth import get_user_model
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
+from apps.admin_panel.dto.pagination import ListPageDTO
 from apps.admin_panel.dto.users import UserDetailDTO, UserListItemDTO
+from apps.admin_panel.search.backends import get_user_search_backend
+from apps.admin_panel.selectors.pagination import (
+    TOTAL_EXACT,
+    apaginate,
+    count_total,
+    paginate,
+)
 
 User = get_user_model()
 
@@ -14,12 +24,24 @@ def get_users_queryset(
     qs = User.objects.all().order_by(order_by)
     if search and search.strip():
         term = search.strip()
-        qs = qs.filter(
-            Q(username__icontains=term) | Q(email__icontains=term)
-        )
+        qs = get_user_search_backend().filter(qs, term)
     return qs
 
 
+# Columns each DTO is built from; selectors never load full user rows (password hashes etc.).
+USER_LIST_FIELDS = ("id", "username", "email", "is_staff", "is_superuser", "is_active")
+USER_DETAIL_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "is_staff",
+    "is_superuser",
+    "is_active",
+)
+
+
 def get_user_list_page(
     *,
     search: str | None = None,
@@ -27,42 +49,144 @@ def get_user_list_page(
     page: int = 1,
     page_size: int = 25,
 ) -> tuple[list[UserListItemDTO], int]:
-    qs = get_users_queryset(search=search, order_by=order_by)
+    """
+    Offset page of users plus the exact total.
+
+    Queries: 2 (count, page).
+    """
+
+    qs = get_users_queryset(search=search, order_by=order_by).values_list(*USER_LIST_FIELDS)
     total = qs.count()
     start = (page - 1) * page_size
     rows = qs[start : start + page_size]
-    items = [
-        UserListItemDTO(
-            id=u.id,
-            username=u.username,
-            email=u.email or "",
-            is_staff=u.is_staff,
-            is_superuser=u.is_superuser,
-            is_active=u.is_active,
-        )
-        for u in rows
-    ]
+    items = [_to_list_item(row) for row in rows]
     return items, total
 
 
+def get_user_page(
+    *,
+    search: str | None = None,
+    order_by: str = "username",
+    page: int = 1,
+    cursor: str | None = None,
+    page_size: int = 25,
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    Page of users for the admin list.
+
+    With a `cursor` (from a previous page) this seeks on (`order_by`, id) so deep
+    pages cost the same as the first one; otherwise it falls back to `page` slicing.
+    `total_mode` picks exact, estimated or no counting (see selectors.pagination).
+
+    Queries: 1 for the page, plus 1 for the count unless `total_mode` is "none" or an
+    estimate is served from planner statistics or the cache.
+    """
+
+    qs = get_users_queryset(search=search, order_by=order_by).values_list(*USER_LIST_FIELDS)
+    total, total_is_estimate = count_total(qs, mode=total_mode)
+    return paginate(
+        qs,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        to_item=_to_list_item,
+        total=total,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+async def aget_user_page(
+    *,
+    search: str | None = None,
+    order_by: str = "username",
+    page: int = 1,
+    cursor: str | None = None,
+    page_size: int = 25,
+    total_mode: str = TOTAL_EXACT,
+) -> ListPageDTO:
+    """
+    `get_user_page` for async views; the count and the page run concurrently.
+    """
+
+    qs = get_users_queryset(search=search, order_by=order_by).values_list(*USER_LIST_FIELDS)
+    return await apaginate(
+        qs,
+        order_by=order_by,
+        page=page,
+        cursor=cursor,
+        page_size=page_size,
+        to_item=_to_list_item,
+        total_mode=total_mode,
+    )
+
+
+def _to_list_item(row: tuple) -> UserListItemDTO:
+    user_id, username, email, is_staff, is_superuser, is_active = row
+    return UserListItemDTO(
+        id=user_id,
+        username=username,
+        email=email or "",
+        is_staff=is_staff,
+        is_superuser=is_superuser,
+        is_active=is_active,
+    )
+
+
 def get_user_by_id(user_id: int) -> User | None:
+    """Full user instance for services that save it. Queries: 1."""
     return User.objects.filter(pk=user_id).first()
 
 
 def get_user_detail_dto(user_id: int) -> UserDetailDTO | None:
-    user = get_user_by_id(user_id)
-    if not user:
-        return None
-    groups = list(user.groups.all())
+    """
+    User detail with group memberships.
+
+    Queries: 1 (see `get_user_detail_dtos`).
+    """
+
+    return get_user_detail_dtos([user_id]).get(user_id)
+
+
+def get_user_detail_dtos(user_ids: Iterable[int]) -> dict[int, UserDetailDTO]:
+    """
+    Batched `get_user_detail_dto`: {id: dto} for the users that exist.
+
+    Queries: 1 regardless of how many ids (user columns LEFT JOINed to groups,
+    one row per membership).
+    """
+
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    rows = (
+        User.objects.filter(pk__in=user_ids)
+        .values_list(*USER_DETAIL_FIELDS, "groups__id", "groups__name")
+        .order_by("pk", "groups__name")
+    )
+    columns: dict[int, tuple] = {}
+    groups: dict[int, list[tuple[int, str]]] = {}
+    for row in rows:
+        uid = row[0]
+        columns.setdefault(uid, row[:8])
+        memberships = groups.setdefault(uid, [])
+        if row[8] is not None:
+            memberships.append((row[8], row[9]))
+    return {uid: _to_detail(columns[uid], groups[uid]) for uid in columns}
+
+
+def _to_detail(row: tuple, groups: list[tuple[int, str]]) -> UserDetailDTO:
+    uid, username, email, first_name, last_name, is_staff, is_superuser, is_active = row
     return UserDetailDTO(
-        id=user.id,
-        username=user.username,
-        email=user.email or "",
-        first_name=user.first_name or "",
-        last_name=user.last_name or "",
-        is_staff=user.is_staff,
-        is_superuser=user.is_superuser,
-        is_active=user.is_active,
-        group_ids=[g.id for g in groups],
-        group_names=[g.name for g in groups],
+        id=uid,
+        username=username,
+        email=email or "",
+        first_name=first_name or "",
+        last_name=last_name or "",
+        is_staff=is_staff,
+        is_superuser=is_superuser,
+        is_active=is_active,
+        group_ids=[gid for gid, _ in groups],
+        group_names=[name for _, name in groups],
     )
@@ -0,0 +1,78 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from inertia.utils import InertiaJsonEncoder
+
+from apps.admin_panel.conf import cached_setting_import
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_JSON_CODEC = "apps.admin_panel.serialization.codecs.StdlibCodec"
+
+
+class JSONCodec(ABC):
+    """
+    Interface for the JSON parser/encoder behind request bodies and Inertia pages.
+
+    `dumps` must produce the same document as `json.dumps` for plain data and hand
+    anything else to `default`, so Django/Inertia encoders keep working unchanged.
+    """
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """Parse a JSON document; malformed input raises ValueError."""
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        """Serialize `obj`, calling `default` for values JSON has no type for."""
+
+
+class StdlibCodec(JSONCodec):
+    """The standard library `json` module."""
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        return json.dumps(obj, default=default)
+
+
+class OrjsonCodec(StdlibCodec):
+    """
+    orjson when it is installed, otherwise the standard library.
+
+    Datetimes are passed through to `default` so they are formatted exactly as
+    DjangoJSONEncoder does; non-ASCII text is written as UTF-8 rather than escaped.
+    """
+
+    def is_supported(self) -> bool:
+        return orjson is not None
+
+    def loads(self, data: bytes | str) -> Any:
+        if not self.is_supported():
+            return super().loads(data)
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        if not self.is_supported():
+            return super().dumps(obj, default=default)
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=options).decode()
+
+
+get_json_codec = cached_setting_import("ADMIN_PANEL_JSON_CODEC", DEFAULT_JSON_CODEC)
+
+
+class CodecInertiaJsonEncoder(InertiaJsonEncoder):
+    """
+    `INERTIA_JSON_ENCODER` that serializes page objects with `get_json_codec()`,
+    falling back to `InertiaJsonEncoder.default` for models, querysets and the types
+    DjangoJSONEncoder knows.
+    """
+
+    def encode(self, o: Any) -> str:
+        return get_json_codec().dumps(o, default=self.default)
@@ -0,0 +1,35 @@
+import dataclasses
+from functools import cache
+from typing import Any, Callable, Iterable
+
+
+@cache
+def _compile_to_dict(cls: type) -> Callable[[Any], dict]:
+    # One generated function per DTO class, e.g. `lambda obj: {"id": obj.id, ...}`: no
+    # per-call field introspection, recursion or deep copies as in `dataclasses.asdict`.
+    items = ", ".join(f"{field.name!r}: obj.{field.name}" for field in dataclasses.fields(cls))
+    namespace: dict = {}
+    exec(f"def to_dict(obj):\n    return {{{items}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"to_dict[{cls.__qualname__}]"
+    return to_dict
+
+
+def to_dict(dto: Any) -> dict:
+    """
+    Shallow dict of a DTO's fields, in declaration order.
+
+    Field values are shared, not copied, and nested DTOs are left as they are; DTOs
+    hold plain data, so the result serializes exactly like `dataclasses.asdict`'s.
+    """
+
+    return _compile_to_dict(type(dto))(dto)
+
+
+def to_dicts(dtos: Iterable[Any]) -> list[dict]:
+    """`to_dict` for every DTO in `dtos`, all of the same class (e.g. a page of rows)."""
+    dtos = list(dtos)
+    if not dtos:
+        return []
+    convert = _compile_to_dict(type(dtos[0]))
+    return [convert(dto) for dto in dtos]
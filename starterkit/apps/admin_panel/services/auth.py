@@ -1,12 +1,33 @@
 from typing import Dict, List
 
-from django.contrib.auth import authenticate, login as django_login, logout as django_logout
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import (
+    aauthenticate,
+    alogin as django_alogin,
+    authenticate,
+    login as django_login,
+    logout as django_logout,
+    user_login_failed,
+)
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
 from django.http import HttpRequest
 from django.utils.http import url_has_allowed_host_and_scheme
 
 from apps.admin_panel.domain.policies import is_active_staff
 from apps.admin_panel.dto.auth import LoginInputDTO, LoginResultDTO
 from apps.admin_panel.selectors.auth import get_user_by_username
+from apps.admin_panel.services.login_throttle import reset_login_throttle, throttle_login_attempt
+from apps.admin_panel.services.password_hashing import HashQueueFull, get_hashing_executor
+
+MODEL_BACKEND = "django.contrib.auth.backends.ModelBackend"
+
+STAFF_LOGIN_ERROR = (
+    "Please enter the correct username and password for a staff account. "
+    "Note that both fields may be case-sensitive."
+)
+THROTTLED_LOGIN_ERROR = "Too many login attempts. Please try again in {seconds} seconds."
+BUSY_LOGIN_ERROR = "Too many sign-in attempts are being processed. Please try again in a moment."
 
 
 def _default_admin_redirect() -> str:
@@ -35,15 +56,31 @@ def _clean_next_url(request: HttpRequest, next_url: str | None) -> str:
     return candidate
 
 
-def login_service(dto: LoginInputDTO, request: HttpRequest) -> LoginResultDTO:
-    """
-    Perform login using Django's auth stack and mirror Django admin behavior:
+def _failed(errors: Dict[str, List[str]]) -> LoginResultDTO:
+    return LoginResultDTO(
+        success=False,
+        redirect_url=None,
+        user_id=None,
+        username=None,
+        is_staff=False,
+        is_superuser=False,
+        errors=errors,
+    )
 
-    - Use `authenticate` with the provided credentials.
-    - Require the user to be active and `is_staff`.
-    - Respect a validated `next` parameter for post-login redirect.
-    """
 
+def _succeeded(request: HttpRequest, dto: LoginInputDTO, user) -> LoginResultDTO:
+    return LoginResultDTO(
+        success=True,
+        redirect_url=_clean_next_url(request, dto.next_url),
+        user_id=user.pk,
+        username=user.get_username(),
+        is_staff=user.is_staff,
+        is_superuser=user.is_superuser,
+        errors={},
+    )
+
+
+def _validate_login(dto: LoginInputDTO) -> tuple[str, str, Dict[str, List[str]]]:
     errors: Dict[str, List[str]] = {}
 
     username = (dto.username or "").strip()
@@ -55,74 +92,119 @@ def login_service(dto: LoginInputDTO, request: HttpRequest) -> LoginResultDTO:
     if not password:
         errors.setdefault("password", []).append("This field is required.")
 
-    if errors:
-        return LoginResultDTO(
-            success=False,
-            redirect_url=None,
-            user_id=None,
-            username=None,
-            is_staff=False,
-            is_superuser=False,
-            errors=errors,
-        )
+    return username, password, errors
 
-    user = authenticate(request, username=username, password=password)
 
+def _throttled(request: HttpRequest, username: str) -> LoginResultDTO | None:
+    # Checked before `authenticate`, so over-budget attempts never reach the hasher.
+    retry_after = throttle_login_attempt(request, username)
+    if retry_after:
+        return _failed({"non_field_errors": [THROTTLED_LOGIN_ERROR.format(seconds=retry_after)]})
+    return None
+
+
+def _authentication_errors(username: str) -> Dict[str, List[str]]:
     # If authentication failed, we can still distinguish between inactive and non-staff users.
-    if user is None:
-        existing_user = get_user_by_username(username)
-        non_field_errors: list[str] = []
+    existing_user = get_user_by_username(username)
+    if existing_user is not None and not existing_user.is_active:
+        return {"non_field_errors": ["This account is inactive."]}
+    return {"non_field_errors": [STAFF_LOGIN_ERROR]}
 
-        if existing_user is not None and not existing_user.is_active:
-            non_field_errors.append("This account is inactive.")
-        else:
-            non_field_errors.append(
-                "Please enter the correct username and password for a staff account. "
-                "Note that both fields may be case-sensitive."
-            )
-
-        errors["non_field_errors"] = non_field_errors
-
-        return LoginResultDTO(
-            success=False,
-            redirect_url=None,
-            user_id=None,
-            username=None,
-            is_staff=False,
-            is_superuser=False,
-            errors=errors,
-        )
+
+def login_service(dto: LoginInputDTO, request: HttpRequest) -> LoginResultDTO:
+    """
+    Perform login using Django's auth stack and mirror Django admin behavior:
+
+    - Use `authenticate` with the provided credentials.
+    - Require the user to be active and `is_staff`.
+    - Respect a validated `next` parameter for post-login redirect.
+    - Throttle attempts per username and client IP (`throttle_login_attempt`).
+    """
+
+    username, password, errors = _validate_login(dto)
+    if errors:
+        return _failed(errors)
+
+    throttled = _throttled(request, username)
+    if throttled:
+        return throttled
+
+    user = authenticate(request, username=username, password=password)
+    if user is None:
+        return _failed(_authentication_errors(username))
 
     # Mirror Django admin: require active staff users to log into the admin.
     if not is_active_staff(user):
-        errors["non_field_errors"] = [
-            "Please enter the correct username and password for a staff account. "
-            "Note that both fields may be case-sensitive."
-        ]
-        return LoginResultDTO(
-            success=False,
-            redirect_url=None,
-            user_id=None,
-            username=None,
-            is_staff=False,
-            is_superuser=False,
-            errors=errors,
-        )
+        return _failed({"non_field_errors": [STAFF_LOGIN_ERROR]})
 
     # Successful login.
     django_login(request, user)
+    reset_login_throttle(request, username)
+    return _succeeded(request, dto, user)
 
-    redirect_url = _clean_next_url(request, dto.next_url)
 
-    return LoginResultDTO(
-        success=True,
-        redirect_url=redirect_url,
-        user_id=user.pk,
-        username=user.get_username(),
-        is_staff=user.is_staff,
-        is_superuser=user.is_superuser,
-        errors={},
-    )
+def _needs_rehash(encoded: str) -> bool:
+    preferred = get_hasher()
+    return identify_hasher(encoded).algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+async def _aauthenticate_model_user(request: HttpRequest, username: str, password: str):
+    """
+    `ModelBackend.authenticate`, with the password check run on the hashing executor.
+    """
+
+    executor = get_hashing_executor()
+    user = await sync_to_async(get_user_by_username)(username)
+    if user is None:
+        # Hash anyway so unknown usernames take as long as wrong passwords.
+        await executor.run(make_password, password)
+        valid = False
+    else:
+        valid = await executor.run(check_password, password, user.password)
+    if valid and _needs_rehash(user.password):
+        # What check_password's setter would do: store the hash in the preferred format.
+        user.password = await executor.run(make_password, password)
+        await user.asave(update_fields=["password"])
+    if not valid or not user.is_active:
+        await user_login_failed.asend(sender=__name__, credentials={"username": username}, request=request)
+        return None
+    user.backend = MODEL_BACKEND
+    return user
+
+
+async def alogin_service(dto: LoginInputDTO, request: HttpRequest) -> LoginResultDTO:
+    """
+    Async `login_service`: the password check runs on the bounded hashing executor
+    rather than the event loop or the shared `sync_to_async` thread.
+
+    Only the default ModelBackend is handled that way; other backends go through
+    `aauthenticate`. A full hashing queue fails the attempt with a "try again" error.
+    """
+
+    username, password, errors = _validate_login(dto)
+    if errors:
+        return _failed(errors)
+
+    throttled = await sync_to_async(_throttled)(request, username)
+    if throttled:
+        return throttled
+
+    try:
+        if list(settings.AUTHENTICATION_BACKENDS) == [MODEL_BACKEND]:
+            user = await _aauthenticate_model_user(request, username, password)
+        else:
+            user = await aauthenticate(request, username=username, password=password)
+    except HashQueueFull:
+        return _failed({"non_field_errors": [BUSY_LOGIN_ERROR]})
+    if user is None:
+        return _failed(await sync_to_async(_authentication_errors)(username))
+
+    if not is_active_staff(user):
+        return _failed({"non_field_errors": [STAFF_LOGIN_ERROR]})
+
+    await django_alogin(request, user)
+    await sync_to_async(reset_login_throttle)(request, username)
+    return _succeeded(request, dto, user)
 
 
 def logout_service(request: HttpRequest) -> str:
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_bulk_user_writes = ContextVar("admin_panel_bulk_user_writes", default=False)
+
+
+@contextmanager
+def bulk_user_writes():
+    """
+    Skip the per-row user delete bookkeeping in `signals` (search index, counters,
+    stats, cache invalidation) for writes whose caller does it set-based instead.
+    """
+
+    token = _bulk_user_writes.set(True)
+    try:
+        yield
+    finally:
+        _bulk_user_writes.reset(token)
+
+
+def in_bulk_user_writes() -> bool:
+    """True inside `bulk_user_writes()`."""
+    return _bulk_user_writes.get()
@@ -0,0 +1,149 @@
+import datetime
+from collections import Counter
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.admin_panel.models import DailySignupCount, DashboardStats
+
+User = get_user_model()
+
+USER_COUNT = "user_count"
+ACTIVE_USER_COUNT = "active_user_count"
+STAFF_USER_COUNT = "staff_user_count"
+SUPERUSER_COUNT = "superuser_count"
+GROUP_COUNT = "group_count"
+
+# User fields whose value moves one of the rollup totals.
+USER_STAT_FIELDS = ("is_active", "is_staff", "is_superuser")
+
+
+def user_stat_contribution(is_active: bool, is_staff: bool, is_superuser: bool) -> dict[str, int]:
+    """What a single user with these flags adds to the rollup totals."""
+    return {
+        USER_COUNT: 1,
+        ACTIVE_USER_COUNT: int(bool(is_active)),
+        STAFF_USER_COUNT: int(bool(is_staff)),
+        SUPERUSER_COUNT: int(bool(is_superuser)),
+    }
+
+
+def signup_day(date_joined: datetime.datetime) -> datetime.date:
+    """The rollup day for a `date_joined` value, in the current time zone."""
+    if timezone.is_aware(date_joined):
+        return timezone.localdate(date_joined)
+    return date_joined.date()
+
+
+def apply_stats_deltas(deltas: dict[str, int]) -> bool:
+    """
+    Shift the dashboard totals by `deltas` in a single UPDATE.
+
+    A missing rollup row is rebuilt from scratch instead, together with the signup
+    series; returns False in that case so callers skip their signup deltas.
+    """
+
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return True
+    updated = DashboardStats.objects.filter(pk=DashboardStats.SINGLETON_ID).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+    if not updated:
+        rebuild_dashboard_stats()
+        return False
+    return True
+
+
+def apply_signup_deltas(days: dict[datetime.date, int]) -> None:
+    """
+    Shift the per-day signup counts; days not seen before are created.
+    """
+
+    by_delta: dict[int, list[datetime.date]] = {}
+    for day, delta in days.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(day)
+    if not by_delta:
+        return
+    existing = set(DailySignupCount.objects.filter(day__in=list(days)).values_list("day", flat=True))
+    for delta, group_days in by_delta.items():
+        DailySignupCount.objects.filter(day__in=[d for d in group_days if d in existing]).update(
+            count=F("count") + delta
+        )
+    missing = [
+        DailySignupCount(day=day, count=delta) for day, delta in days.items() if delta > 0 and day not in existing
+    ]
+    if not missing:
+        return
+    try:
+        with transaction.atomic():
+            DailySignupCount.objects.bulk_create(missing)
+    except IntegrityError:
+        # Another writer created some of these days since `existing` was read: add to
+        # its rows rather than dropping these signups.
+        for row in missing:
+            _add_signups(row.day, row.count)
+
+
+def _add_signups(day: datetime.date, delta: int) -> None:
+    while not DailySignupCount.objects.filter(day=day).update(count=F("count") + delta):
+        try:
+            with transaction.atomic():
+                DailySignupCount.objects.create(day=day, count=delta)
+            return
+        except IntegrityError:
+            continue
+
+
+def record_users_added(rows: Iterable[tuple[bool, bool, bool, datetime.datetime]]) -> None:
+    """
+    Count (is_active, is_staff, is_superuser, date_joined) rows of new users.
+
+    For bulk writers that bypass the post_save signal.
+    """
+
+    totals: Counter = Counter()
+    days: Counter = Counter()
+    for is_active, is_staff, is_superuser, date_joined in rows:
+        totals.update(user_stat_contribution(is_active, is_staff, is_superuser))
+        days[signup_day(date_joined)] += 1
+    if apply_stats_deltas(dict(totals)):
+        apply_signup_deltas(dict(days))
+
+
+def rebuild_dashboard_stats() -> DashboardStats:
+    """
+    Recompute the dashboard rollup and the daily signup series from the source tables.
+    """
+
+    with transaction.atomic():
+        totals = User.objects.aggregate(
+            **{
+                USER_COUNT: Count("pk"),
+                ACTIVE_USER_COUNT: Count("pk", filter=Q(is_active=True)),
+                STAFF_USER_COUNT: Count("pk", filter=Q(is_staff=True)),
+                SUPERUSER_COUNT: Count("pk", filter=Q(is_superuser=True)),
+            }
+        )
+        stats, _ = DashboardStats.objects.update_or_create(
+            pk=DashboardStats.SINGLETON_ID,
+            defaults={**totals, GROUP_COUNT: Group.objects.count()},
+        )
+        DailySignupCount.objects.all().delete()
+        DailySignupCount.objects.bulk_create(
+            [
+                DailySignupCount(day=day, count=n)
+                for day, n in User.objects.annotate(day=TruncDate("date_joined"))
+                .values_list("day")
+                .annotate(n=Count("*"))
+                .order_by()
+            ],
+            batch_size=1000,
+        )
+    return stats
@@ -0,0 +1,39 @@
+from typing import Any, Iterable, List
+
+from django.db.models import Model
+
+
+def assign_changed_fields(instance: Model, values: dict[str, Any]) -> List[str]:
+    """
+    Set the fields in `values` whose value differs from `instance` and return their
+    names, ready for `save(update_fields=...)`.
+    """
+
+    changed = []
+    for name, value in values.items():
+        if getattr(instance, name) != value:
+            setattr(instance, name, value)
+            changed.append(name)
+    return changed
+
+
+def sync_related_ids(manager, wanted_ids: Iterable[int], model: type[Model]) -> tuple[set[int], set[int]]:
+    """
+    Make the m2m `manager` hold exactly `wanted_ids`, touching only the rows that differ.
+
+    Unlike `manager.set()` on a queryset this reads the current ids once and leaves an
+    unchanged relation alone; ids without a `model` row are ignored. `add`/`remove` still
+    send `m2m_changed`, so counters and caches follow. Returns (added, removed).
+    """
+
+    current = set(manager.values_list("pk", flat=True))
+    wanted = set(wanted_ids)
+    added = wanted - current
+    if added:
+        added = set(model.objects.filter(pk__in=added).values_list("pk", flat=True))
+    removed = current - wanted
+    if removed:
+        manager.remove(*removed)
+    if added:
+        manager.add(*added)
+    return added, removed
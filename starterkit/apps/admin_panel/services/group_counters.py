@@ -0,0 +1,86 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.admin_panel.models import GroupCounter
+
+User = get_user_model()
+
+USER_COUNT = "user_count"
+PERMISSION_COUNT = "permission_count"
+
+RECONCILE_CHUNK_SIZE = 500
+
+
+def apply_group_count_deltas(field: str, deltas: dict[int, int]) -> None:
+    """
+    Shift `field` ("user_count"/"permission_count") by the given per-group deltas.
+
+    Groups sharing a delta are updated with a single UPDATE.
+    """
+
+    by_delta: dict[int, list[int]] = defaultdict(list)
+    for group_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(group_id)
+    for delta, group_ids in by_delta.items():
+        GroupCounter.objects.filter(group_id__in=group_ids).update(**{field: F(field) + delta})
+
+
+def lock_group_counters(group_ids: Iterable[int]) -> None:
+    """
+    Lock the counters of `group_ids` until the end of the transaction.
+
+    Take this before reading the rows a bulk write will turn into deltas, so two such
+    writers on the same groups can't both count the same change. Locks are taken in
+    group order to keep writers from deadlocking on each other.
+    """
+
+    locked = GroupCounter.objects.select_for_update().filter(group_id__in=group_ids).order_by("group_id")
+    list(locked.values_list("pk", flat=True))
+
+
+def _count_for_group(through) -> Coalesce:
+    rows = (
+        through.objects.filter(group_id=OuterRef("group_id"))
+        .order_by()
+        .values("group_id")
+        .annotate(n=Count("*"))
+        .values("n")
+    )
+    return Coalesce(Subquery(rows), 0)
+
+
+def reconcile_group_counters() -> int:
+    """
+    Recompute every group counter from the membership tables.
+
+    Returns how many counters were created or corrected.
+    """
+
+    with transaction.atomic():
+        missing = list(Group.objects.filter(counter__isnull=True).values_list("pk", flat=True))
+        GroupCounter.objects.bulk_create(
+            [GroupCounter(group_id=pk) for pk in missing],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        user_count = _count_for_group(User.groups.through)
+        permission_count = _count_for_group(Group.permissions.through)
+        drifted = list(
+            GroupCounter.objects.annotate(expected_users=user_count, expected_permissions=permission_count)
+            .exclude(user_count=F("expected_users"), permission_count=F("expected_permissions"))
+            .values_list("pk", flat=True)
+        )
+        stale = sorted(set(drifted) | set(missing))
+        for start in range(0, len(stale), RECONCILE_CHUNK_SIZE):
+            GroupCounter.objects.filter(pk__in=stale[start : start + RECONCILE_CHUNK_SIZE]).update(
+                user_count=user_count,
+                permission_count=permission_count,
+            )
+    return len(stale)
@@ -1,11 +1,30 @@
-from typing import Dict, List
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, List
 
 from django.contrib.auth.models import Group, Permission
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.http import HttpRequest
 
 from apps.admin_panel.domain.policies import can_manage_groups
-from apps.admin_panel.dto.groups import GroupFormInputDTO, GroupFormResultDTO
+from apps.admin_panel.dto.groups import (
+    GroupFormInputDTO,
+    GroupFormResultDTO,
+    PermissionMatrixCellDTO,
+    PermissionMatrixResultDTO,
+)
 from apps.admin_panel.selectors.groups import get_group_by_id
+from apps.admin_panel.services.diff import assign_changed_fields, sync_related_ids
+from apps.admin_panel.services.group_counters import (
+    PERMISSION_COUNT,
+    apply_group_count_deltas,
+    lock_group_counters,
+)
+
+GroupPermissions = Group.permissions.through
+
+MAX_MATRIX_CHANGES = 10_000
 
 
 def _check_permission(request: HttpRequest) -> GroupFormResultDTO | None:
@@ -58,20 +77,26 @@ def update_group_service(
             errors={"non_field_errors": ["Group not found."]},
         )
 
-    errors: Dict[str, List[str]] = {}
     name = (dto.name or "").strip()
     if not name:
-        errors.setdefault("name", []).append("This field is required.")
-    if Group.objects.filter(name=name).exclude(pk=group_id).exists():
-        errors.setdefault("name", []).append("A group with that name already exists.")
-
-    if errors:
-        return GroupFormResultDTO(success=False, group_id=None, errors=errors)
-
-    group.name = name
-    group.save()
-    permission_ids = getattr(dto, "permission_ids", []) or []
-    group.permissions.set(Permission.objects.filter(pk__in=permission_ids))
+        return GroupFormResultDTO(success=False, group_id=None, errors={"name": ["This field is required."]})
+
+    # Only changed columns and permission rows are written; a clashing name is caught
+    # by the unique constraint rather than checked up front.
+    changed = assign_changed_fields(group, {"name": name})
+    try:
+        with transaction.atomic():
+            if changed:
+                group.save(update_fields=changed)
+            sync_related_ids(group.permissions, getattr(dto, "permission_ids", []) or [], Permission)
+    except IntegrityError:
+        if changed and Group.objects.filter(name=name).exclude(pk=group_id).exists():
+            return GroupFormResultDTO(
+                success=False,
+                group_id=None,
+                errors={"name": ["A group with that name already exists."]},
+            )
+        raise
 
     return GroupFormResultDTO(success=True, group_id=group.id, errors={})
 
@@ -91,3 +116,79 @@ def delete_group_service(group_id: int, request: HttpRequest) -> GroupFormResult
 
     group.delete()
     return GroupFormResultDTO(success=True, group_id=None, errors={})
+
+
+def _cells_filter(pairs: Iterable[tuple[int, int]]) -> Q:
+    by_group: dict[int, set[int]] = {}
+    for group_id, permission_id in pairs:
+        by_group.setdefault(group_id, set()).add(permission_id)
+    return reduce(or_, (Q(group_id=gid, permission_id__in=pids) for gid, pids in by_group.items()))
+
+
+def apply_permission_matrix_service(
+    cells: List[PermissionMatrixCellDTO],
+    request: HttpRequest,
+) -> PermissionMatrixResultDTO:
+    """
+    Grant or revoke a batch of (group, permission) cells in one transaction.
+
+    Reads the existing rows for the touched cells once, then inserts the missing grants
+    with one bulk INSERT and drops the revoked rows with one DELETE; cells that already
+    hold the requested state cost nothing. When a cell appears twice the last one wins.
+    Group permission counters are shifted to match, since bulk writes send no
+    `m2m_changed`; they are locked before the read so concurrent batches on the same
+    groups apply one after the other instead of counting the same cell twice.
+    """
+
+    if not can_manage_groups(request.user):
+        return PermissionMatrixResultDTO(
+            success=False, granted=0, revoked=0, errors={"non_field_errors": ["Permission denied."]}
+        )
+    if len(cells) > MAX_MATRIX_CHANGES:
+        return PermissionMatrixResultDTO(
+            success=False,
+            granted=0,
+            revoked=0,
+            errors={"changes": [f"Apply at most {MAX_MATRIX_CHANGES} changes at a time."]},
+        )
+
+    wanted = {(cell.group_id, cell.permission_id): cell.granted for cell in cells}
+    if not wanted:
+        return PermissionMatrixResultDTO(success=True, granted=0, revoked=0, errors={})
+
+    group_ids = {gid for gid, _ in wanted}
+    permission_ids = {pid for _, pid in wanted}
+    errors: Dict[str, List[str]] = {}
+    if Group.objects.filter(pk__in=group_ids).count() != len(group_ids):
+        errors["changes"] = ["Some groups no longer exist. Reload the page and try again."]
+    elif Permission.objects.filter(pk__in=permission_ids).count() != len(permission_ids):
+        errors["changes"] = ["Some permissions no longer exist. Reload the page and try again."]
+    if errors:
+        return PermissionMatrixResultDTO(success=False, granted=0, revoked=0, errors=errors)
+
+    with transaction.atomic():
+        lock_group_counters(group_ids)
+        existing = {
+            (gid, pid): row_id
+            for row_id, gid, pid in GroupPermissions.objects.filter(_cells_filter(wanted)).values_list(
+                "id", "group_id", "permission_id"
+            )
+        }
+        to_grant = [pair for pair, granted in wanted.items() if granted and pair not in existing]
+        to_revoke = [pair for pair, granted in wanted.items() if not granted and pair in existing]
+
+        GroupPermissions.objects.bulk_create(
+            [GroupPermissions(group_id=gid, permission_id=pid) for gid, pid in to_grant],
+            ignore_conflicts=True,
+        )
+        if to_revoke:
+            GroupPermissions.objects.filter(pk__in=[existing[pair] for pair in to_revoke]).delete()
+
+        deltas: dict[int, int] = {}
+        for gid, _ in to_grant:
+            deltas[gid] = deltas.get(gid, 0) + 1
+        for gid, _ in to_revoke:
+            deltas[gid] = deltas.get(gid, 0) - 1
+        apply_group_count_deltas(PERMISSION_COUNT, deltas)
+
+    return PermissionMatrixResultDTO(success=True, granted=len(to_grant), revoked=len(to_revoke), errors={})
@@ -0,0 +1,78 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+from apps.admin_panel.models import CacheTagVersion
+from apps.admin_panel.selectors.caching import drop_local_tags, invalidate_tags
+
+DEFAULT_INVALIDATION_SYNC_INTERVAL = 2
+
+_state_lock = threading.Lock()
+_seen_versions: dict[str, int] | None = None
+_last_sync = 0.0
+
+
+def publish_tags(*tags: str) -> None:
+    """
+    Bump the shared version of `tags` so other workers drop their local entries.
+
+    Runs in the caller's transaction: the new versions become visible exactly when the
+    write that caused them commits.
+    """
+
+    tags = sorted(set(tags))
+    if not tags:
+        return
+    with transaction.atomic():
+        existing = set(CacheTagVersion.objects.filter(tag__in=tags).values_list("tag", flat=True))
+        CacheTagVersion.objects.bulk_create(
+            [CacheTagVersion(tag=tag) for tag in tags if tag not in existing],
+            ignore_conflicts=True,
+        )
+        CacheTagVersion.objects.filter(tag__in=tags).update(version=F("version") + 1)
+
+
+def invalidate(*tags: str) -> None:
+    """Invalidate `tags` in this worker's caches, the shared cache and, via the bus, all other workers."""
+    invalidate_tags(*tags)
+    drop_local_tags(tags)
+    transaction.on_commit(lambda: drop_local_tags(tags))
+    publish_tags(*tags)
+
+
+def sync_invalidations(*, force: bool = False) -> set[str]:
+    """
+    Compare the shared tag versions with the ones this process last saw and evict
+    local entries for the tags that moved. Returns those tags.
+
+    Queries: 1 (the version table holds one row per tag), skipped entirely while
+    within `ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL` seconds of the previous sync.
+    """
+
+    global _seen_versions, _last_sync
+
+    interval = getattr(settings, "ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL", DEFAULT_INVALIDATION_SYNC_INTERVAL)
+    now = time.monotonic()
+    if not force and interval and now - _last_sync < interval:
+        return set()
+
+    current = dict(CacheTagVersion.objects.values_list("tag", "version"))
+    with _state_lock:
+        _last_sync = now
+        if _seen_versions is None:
+            # First sync of this process: nothing local can predate it.
+            changed = set()
+        else:
+            changed = {tag for tag, version in current.items() if _seen_versions.get(tag) != version}
+        _seen_versions = current
+    if changed:
+        drop_local_tags(changed)
+    return changed
+
+
+def bus_is_installed() -> bool:
+    """Whether the version table exists (it may not while migrations are being unapplied)."""
+    return CacheTagVersion._meta.db_table in connection.introspection.table_names()
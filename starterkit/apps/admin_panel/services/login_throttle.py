@@ -0,0 +1,62 @@
+import hashlib
+import math
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from apps.admin_panel.throttling.backends import get_login_throttle_backend
+
+# scope -> (burst size, seconds to refill a full burst); None disables a scope.
+DEFAULT_LOGIN_THROTTLE_RATES = {
+    "username": (5, 60),
+    "ip": (20, 60),
+}
+
+
+def _rates() -> dict:
+    return getattr(settings, "ADMIN_PANEL_LOGIN_THROTTLE_RATES", DEFAULT_LOGIN_THROTTLE_RATES) or {}
+
+
+def _key(scope: str, value: str) -> str:
+    return f"{scope}:{hashlib.sha1(value.encode()).hexdigest()}"
+
+
+def _client_ip(request: HttpRequest) -> str:
+    # REMOTE_ADDR only: forwarded headers are client-controlled unless a proxy sets them.
+    return request.META.get("REMOTE_ADDR") or ""
+
+
+def _scope_values(request: HttpRequest, username: str) -> dict[str, str]:
+    # Usernames are matched case-sensitively, but an attacker must not get a fresh
+    # budget per capitalisation.
+    return {"username": username.lower(), "ip": _client_ip(request)}
+
+
+def throttle_login_attempt(request: HttpRequest, username: str) -> int:
+    """
+    Spend one login attempt from the username's and the client IP's token buckets.
+
+    Returns 0 when the attempt may go ahead, or else the whole seconds until it can be
+    retried; a rejected attempt spends nothing.
+    """
+
+    values = _scope_values(request, username)
+    buckets = []
+    for scope, rate in _rates().items():
+        if rate and values.get(scope):
+            capacity, period = rate
+            buckets.append((_key(scope, values[scope]), capacity, capacity / period))
+    if not buckets:
+        return 0
+    return math.ceil(get_login_throttle_backend().consume(buckets))
+
+
+def reset_login_throttle(request: HttpRequest, username: str) -> None:
+    """
+    Give a username its full budget back after a successful login.
+
+    The IP bucket is left alone, so one good password doesn't reset an IP's budget for
+    guessing others.
+    """
+
+    get_login_throttle_backend().reset([_key("username", _scope_values(request, username)["username"])])
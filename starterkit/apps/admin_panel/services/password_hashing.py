@@ -0,0 +1,180 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, List, TypeVar
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+from apps.admin_panel.dto.hashing import HashQueueMetricsDTO
+
+# Spawned hashing workers import this module before Django is set up: keep it free of
+# model imports.
+
+T = TypeVar("T")
+
+DEFAULT_HASH_QUEUE_LIMIT = 64
+
+# Below this many passwords per call, hashing inline beats shipping them to the pool.
+INLINE_HASH_LIMIT = 8
+
+
+def _init_hash_worker(settings_module: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+class PasswordHasherPool:
+    """
+    Hash passwords with `make_password` across `workers` processes.
+
+    The pool is only started once a batch has enough passwords to be worth it, and uses
+    the spawn start method so it is safe to create from a threaded web worker. Threads
+    may share one pool.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def hash(self, passwords: List[str]) -> List[str]:
+        if self.workers == 1 or len(passwords) < INLINE_HASH_LIMIT:
+            return [make_password(password) for password in passwords]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_hash_worker,
+                    initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", "main.settings"),),
+                )
+            executor = self._executor
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_import_hasher_pool: PasswordHasherPool | None = None
+_import_hasher_pool_lock = threading.Lock()
+
+
+def get_import_hasher_pool() -> PasswordHasherPool:
+    """
+    The per-process `PasswordHasherPool` for imports made in web requests, sized from
+    ADMIN_PANEL_IMPORT_HASH_WORKERS (None = CPU count), so uploads share its worker
+    processes instead of spawning a pool each.
+    """
+
+    global _import_hasher_pool
+    if _import_hasher_pool is None:
+        with _import_hasher_pool_lock:
+            if _import_hasher_pool is None:
+                _import_hasher_pool = PasswordHasherPool(getattr(settings, "ADMIN_PANEL_IMPORT_HASH_WORKERS", None))
+    return _import_hasher_pool
+
+
+class HashQueueFull(Exception):
+    """The hashing executor already has `max_queue` jobs waiting."""
+
+
+class HashingExecutor:
+    """
+    A bounded thread pool for password hashing and checking on the async request path.
+
+    The hashers release the GIL while deriving keys, so `workers` threads (default: the
+    core count) hash in parallel without tying up the event loop or the shared
+    `sync_to_async` thread. At most `max_queue` jobs wait for a worker; beyond that
+    `submit` raises `HashQueueFull` at once, so a login burst is turned away instead of
+    queueing behind itself and starving other admin requests.
+    """
+
+    def __init__(self, workers: int | None = None, max_queue: int = DEFAULT_HASH_QUEUE_LIMIT):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="admin-panel-hash")
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        with self._lock:
+            if self._queued + self._running >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise HashQueueFull()
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            return self._executor.submit(self._call, fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Await `fn(*args, **kwargs)` on a hashing worker."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _call(self, fn, args, kwargs):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def metrics(self) -> HashQueueMetricsDTO:
+        with self._lock:
+            return HashQueueMetricsDTO(
+                workers=self.workers,
+                max_queue=self.max_queue,
+                running=self._running,
+                queued=self._queued,
+                peak_queued=self._peak_queued,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_hashing_executor: HashingExecutor | None = None
+_hashing_executor_lock = threading.Lock()
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """
+    The per-process `HashingExecutor`, sized from ADMIN_PANEL_HASH_EXECUTOR_WORKERS
+    (None = CPU count) and ADMIN_PANEL_HASH_EXECUTOR_MAX_QUEUE.
+    """
+
+    global _hashing_executor
+    if _hashing_executor is None:
+        with _hashing_executor_lock:
+            if _hashing_executor is None:
+                _hashing_executor = HashingExecutor(
+                    workers=getattr(settings, "ADMIN_PANEL_HASH_EXECUTOR_WORKERS", None),
+                    max_queue=getattr(settings, "ADMIN_PANEL_HASH_EXECUTOR_MAX_QUEUE", DEFAULT_HASH_QUEUE_LIMIT),
+                )
+    return _hashing_executor
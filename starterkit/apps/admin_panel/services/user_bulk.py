@@ -0,0 +1,156 @@
+from typing import Iterator, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet
+from django.db.models.functions import TruncDate
+from django.http import HttpRequest
+
+from apps.admin_panel.domain.policies import can_manage_users
+from apps.admin_panel.dto.users import UserBulkActionInputDTO, UserBulkActionResultDTO
+from apps.admin_panel.search.backends import get_user_search_backend
+from apps.admin_panel.selectors.caching import USERS_TAG
+from apps.admin_panel.selectors.users import get_users_queryset
+from apps.admin_panel.services import dashboard_stats
+from apps.admin_panel.services.bulk_writes import bulk_user_writes
+from apps.admin_panel.services.group_counters import USER_COUNT, apply_group_count_deltas
+from apps.admin_panel.services.invalidation import invalidate
+
+User = get_user_model()
+UserGroups = User.groups.through
+
+ACTIVATE = "activate"
+DEACTIVATE = "deactivate"
+MAKE_STAFF = "make_staff"
+REMOVE_STAFF = "remove_staff"
+DELETE = "delete"
+ADD_TO_GROUP = "add_to_group"
+REMOVE_FROM_GROUP = "remove_from_group"
+
+BULK_ACTIONS = (ACTIVATE, DEACTIVATE, MAKE_STAFF, REMOVE_STAFF, DELETE, ADD_TO_GROUP, REMOVE_FROM_GROUP)
+GROUP_ACTIONS = {ADD_TO_GROUP, REMOVE_FROM_GROUP}
+# Actions that never apply to the acting user, so nobody can lock themselves out.
+SELF_EXCLUDED_ACTIONS = {DEACTIVATE, REMOVE_STAFF, DELETE}
+
+# action -> (field, new value, dashboard counter it moves)
+FLAG_ACTIONS = {
+    ACTIVATE: ("is_active", True, dashboard_stats.ACTIVE_USER_COUNT),
+    DEACTIVATE: ("is_active", False, dashboard_stats.ACTIVE_USER_COUNT),
+    MAKE_STAFF: ("is_staff", True, dashboard_stats.STAFF_USER_COUNT),
+    REMOVE_STAFF: ("is_staff", False, dashboard_stats.STAFF_USER_COUNT),
+}
+
+BULK_CHUNK_SIZE = 1000
+
+
+def _iter_id_chunks(qs: QuerySet, chunk_size: int) -> Iterator[List[int]]:
+    """Walk the ids of `qs` in pk order, one keyset-seeked chunk at a time."""
+    last = 0
+    while True:
+        ids = list(qs.filter(pk__gt=last).order_by("pk").values_list("pk", flat=True)[:chunk_size])
+        if not ids:
+            return
+        yield ids
+        last = ids[-1]
+
+
+def _update_flag(ids: List[int], field: str, value: bool, counter: str) -> int:
+    changed = User.objects.filter(pk__in=ids).exclude(**{field: value}).update(**{field: value})
+    dashboard_stats.apply_stats_deltas({counter: changed if value else -changed})
+    return changed
+
+
+def _delete(ids: List[int]) -> int:
+    qs = User.objects.filter(pk__in=ids)
+    totals = qs.aggregate(
+        **{
+            dashboard_stats.USER_COUNT: Count("pk"),
+            dashboard_stats.ACTIVE_USER_COUNT: Count("pk", filter=Q(is_active=True)),
+            dashboard_stats.STAFF_USER_COUNT: Count("pk", filter=Q(is_staff=True)),
+            dashboard_stats.SUPERUSER_COUNT: Count("pk", filter=Q(is_superuser=True)),
+        }
+    )
+    days = dict(qs.annotate(day=TruncDate("date_joined")).values_list("day").annotate(n=Count("*")).order_by())
+    memberships = dict(
+        UserGroups.objects.filter(user_id__in=ids).values_list("group_id").annotate(n=Count("*")).order_by()
+    )
+    # Unlike the other actions this is not a single statement: User has delete
+    # receivers, so the collector loads the chunk's users (and anything cascading from
+    # them) and sends pre/post_delete per row, which return early under
+    # bulk_user_writes(). That cost is bounded by the chunk size.
+    with bulk_user_writes():
+        qs.delete()
+    apply_group_count_deltas(USER_COUNT, {group_id: -n for group_id, n in memberships.items()})
+    if dashboard_stats.apply_stats_deltas({field: -n for field, n in totals.items()}):
+        dashboard_stats.apply_signup_deltas({day: -n for day, n in days.items()})
+    get_user_search_backend().remove(ids)
+    return totals[dashboard_stats.USER_COUNT]
+
+
+def _add_to_group(ids: List[int], group_id: int) -> int:
+    existing = set(UserGroups.objects.filter(group_id=group_id, user_id__in=ids).values_list("user_id", flat=True))
+    rows = [UserGroups(user_id=pk, group_id=group_id) for pk in ids if pk not in existing]
+    UserGroups.objects.bulk_create(rows, ignore_conflicts=True)
+    apply_group_count_deltas(USER_COUNT, {group_id: len(rows)})
+    return len(rows)
+
+
+def _remove_from_group(ids: List[int], group_id: int) -> int:
+    removed, _ = UserGroups.objects.filter(group_id=group_id, user_id__in=ids).delete()
+    apply_group_count_deltas(USER_COUNT, {group_id: -removed})
+    return removed
+
+
+def bulk_user_action_service(
+    dto: UserBulkActionInputDTO,
+    request: HttpRequest,
+    *,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> UserBulkActionResultDTO:
+    """
+    Apply one action to the selected users, or to every user matching `dto.search`.
+
+    Each chunk of `chunk_size` ids is one transaction of set-based statements (UPDATE,
+    through-table INSERT/DELETE) with the search index, group counters, dashboard
+    rollup and cached request users updated alongside, since none of these statements
+    send per-row signals. Deletes go through Django's collector, which does load the
+    chunk and signal per row; the receivers skip their bookkeeping for it.
+    `affected` counts rows that actually changed.
+    """
+
+    if not can_manage_users(request.user):
+        return UserBulkActionResultDTO(success=False, affected=0, errors={"non_field_errors": ["Permission denied."]})
+
+    errors = {}
+    if dto.action not in BULK_ACTIONS:
+        errors["action"] = ["Choose a valid action."]
+    if dto.action in GROUP_ACTIONS and not Group.objects.filter(pk=dto.group_id).exists():
+        errors["group_id"] = ["Choose a valid group."]
+    if not dto.select_all and not dto.user_ids:
+        errors["user_ids"] = ["Select at least one user."]
+    if errors:
+        return UserBulkActionResultDTO(success=False, affected=0, errors=errors)
+
+    if dto.select_all:
+        qs = get_users_queryset(search=dto.search)
+    else:
+        qs = User.objects.filter(pk__in=dto.user_ids)
+    if dto.action in SELF_EXCLUDED_ACTIONS:
+        qs = qs.exclude(pk=request.user.pk)
+
+    affected = 0
+    for ids in _iter_id_chunks(qs, chunk_size):
+        with transaction.atomic():
+            if dto.action in FLAG_ACTIONS:
+                affected += _update_flag(ids, *FLAG_ACTIONS[dto.action])
+            elif dto.action == DELETE:
+                affected += _delete(ids)
+            elif dto.action == ADD_TO_GROUP:
+                affected += _add_to_group(ids, dto.group_id)
+            else:
+                affected += _remove_from_group(ids, dto.group_id)
+
+    if affected and dto.action not in GROUP_ACTIONS:
+        invalidate(USERS_TAG)
+    return UserBulkActionResultDTO(success=True, affected=affected, errors={})
@@ -0,0 +1,320 @@
+import csv
+import io
+import json
+import os
+from collections import Counter
+from contextlib import ExitStack
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.http import HttpRequest
+from django.utils import timezone
+
+from apps.admin_panel.domain.policies import can_manage_users
+from apps.admin_panel.dto.imports import ImportResultDTO, ImportRowErrorDTO
+from apps.admin_panel.search.backends import get_user_search_backend
+from apps.admin_panel.services.dashboard_stats import record_users_added
+from apps.admin_panel.services.group_counters import USER_COUNT, apply_group_count_deltas
+from apps.admin_panel.services.password_hashing import PasswordHasherPool, get_import_hasher_pool
+
+User = get_user_model()
+UserGroups = User.groups.through
+
+IMPORT_FORMATS = ("csv", "jsonl")
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+GROUP_SEPARATOR = ";"
+
+# Leading characters spreadsheets read as a formula. Exported CSV cells starting with one
+# are prefixed with "'", which the CSV import strips again.
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+FALSE_VALUES = {"0", "false", "no", "n", "off"}
+
+# (line, raw row, parse errors)
+ParsedRow = tuple[int, dict, Dict[str, List[str]]]
+
+
+def detect_import_format(filename: str) -> str | None:
+    """Import format for a file name ("csv"/"jsonl"), or None if unsupported."""
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if ext == "ndjson":
+        return "jsonl"
+    return ext if ext in IMPORT_FORMATS else None
+
+
+def iter_import_rows(stream: IO[str], fmt: str) -> Iterator[ParsedRow]:
+    """
+    Stream rows from a CSV (header row required) or JSON Lines text stream.
+
+    CSV `groups` cells hold names separated by ";"; JSONL rows may use a list. CSV cells
+    quoted against formula injection (`'=...`) are read back without the quote.
+    """
+
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {k: _csv_unquote(v) for k, v in row.items() if k is not None}, {}
+        return
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError:
+            yield line, {}, {"row": ["Invalid JSON."]}
+            continue
+        if not isinstance(row, dict):
+            yield line, {}, {"row": ["Expected a JSON object."]}
+            continue
+        yield line, row, {}
+
+
+def _csv_unquote(value):
+    if isinstance(value, str) and value.startswith("'") and value[1:].startswith(CSV_FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def _parse_bool(value, default: bool) -> bool | None:
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    return None
+
+
+def _clean_row(row: dict, group_ids_by_name: dict[str, int]) -> tuple[dict, Dict[str, List[str]]]:
+    """
+    Validate one raw row the way `create_user_service` would, without touching the DB.
+    """
+
+    errors: Dict[str, List[str]] = {}
+    values: dict = {}
+
+    username = str(row.get("username") or "").strip()
+    if not username:
+        errors.setdefault("username", []).append("This field is required.")
+    else:
+        try:
+            User._meta.get_field("username").run_validators(username)
+        except ValidationError as e:
+            errors.setdefault("username", []).extend(e.messages)
+    values["username"] = username
+
+    email = str(row.get("email") or "").strip()
+    if email:
+        try:
+            User._meta.get_field("email").run_validators(email)
+        except ValidationError as e:
+            errors.setdefault("email", []).extend(e.messages)
+    values["email"] = email
+
+    for name in ("first_name", "last_name"):
+        value = str(row.get(name) or "").strip()
+        if len(value) > User._meta.get_field(name).max_length:
+            errors.setdefault(name, []).append("Ensure this value is not too long.")
+        values[name] = value
+
+    for name, default in (("is_active", True), ("is_staff", False), ("is_superuser", False)):
+        value = _parse_bool(row.get(name), default)
+        if value is None:
+            errors.setdefault(name, []).append("Enter a boolean value.")
+        values[name] = value
+
+    groups = row.get("groups") or []
+    if isinstance(groups, str):
+        groups = groups.split(GROUP_SEPARATOR)
+    names = [str(name).strip() for name in groups if str(name).strip()]
+    unknown = [name for name in names if name not in group_ids_by_name]
+    if unknown:
+        errors.setdefault("groups", []).append(f"Unknown group(s): {', '.join(unknown)}.")
+    values["group_ids"] = sorted({group_ids_by_name[name] for name in names if name in group_ids_by_name})
+
+    password = row.get("password") or None
+    password_hash = row.get("password_hash") or None
+    if password is not None and password_hash is not None:
+        errors.setdefault("password", []).append("Give either password or password_hash, not both.")
+    if password_hash is not None:
+        try:
+            identify_hasher(str(password_hash))
+        except ValueError:
+            errors.setdefault("password_hash", []).append("Unknown password hash format.")
+    values["password"] = None if password is None else str(password)
+    values["password_hash"] = None if password_hash is None else str(password_hash)
+
+    return values, errors
+
+
+def _insert_batch(batch: List[tuple[int, dict]], passwords: List[str]) -> None:
+    """
+    Insert one batch of validated rows, their group memberships and every derived
+    structure that signals would normally maintain, in a single transaction.
+    """
+
+    now = timezone.now()
+    users = [
+        User(
+            username=values["username"],
+            email=values["email"],
+            first_name=values["first_name"],
+            last_name=values["last_name"],
+            is_active=values["is_active"],
+            is_staff=values["is_staff"],
+            is_superuser=values["is_superuser"],
+            password=password,
+            date_joined=now,
+        )
+        for (_, values), password in zip(batch, passwords)
+    ]
+    with transaction.atomic():
+        User.objects.bulk_create(users)
+        if any(user.pk is None for user in users):
+            # Backends that can't return ids from a bulk insert.
+            ids = dict(User.objects.filter(username__in=[u.username for u in users]).values_list("username", "pk"))
+            for user in users:
+                user.pk = ids[user.username]
+
+        memberships = [
+            UserGroups(user_id=user.pk, group_id=group_id)
+            for user, (_, values) in zip(users, batch)
+            for group_id in values["group_ids"]
+        ]
+        UserGroups.objects.bulk_create(memberships, batch_size=DEFAULT_BATCH_SIZE)
+
+        # bulk_create sends no signals: keep the search index, group counters and
+        # dashboard rollup in step by hand.
+        get_user_search_backend().index((user.pk, user.username, user.email) for user in users)
+        apply_group_count_deltas(USER_COUNT, Counter(m.group_id for m in memberships))
+        record_users_added((u.is_active, u.is_staff, u.is_superuser, u.date_joined) for u in users)
+
+
+def import_users(
+    rows: Iterable[ParsedRow],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+    hasher: PasswordHasherPool | None = None,
+) -> ImportResultDTO:
+    """
+    Create users from parsed rows in batches of `batch_size`, each committed on its own.
+
+    Invalid rows (bad values, unknown groups, usernames taken in the DB or earlier in the
+    input) are reported and skipped; they never abort their batch. Plain-text passwords
+    are hashed in `hasher`, or in a `PasswordHasherPool` of `workers` processes started
+    for this call; `password_hash` values are stored as given and rows with neither get
+    an unusable password.
+    """
+
+    group_ids_by_name = dict(Group.objects.values_list("name", "pk"))
+    seen: set[str] = set()
+    created = failed = 0
+    row_errors: List[ImportRowErrorDTO] = []
+
+    def reject(line: int, errors: Dict[str, List[str]]) -> None:
+        nonlocal failed
+        failed += 1
+        if len(row_errors) < MAX_REPORTED_ERRORS:
+            row_errors.append(ImportRowErrorDTO(line=line, errors=errors))
+
+    file_errors: Dict[str, List[str]] = {}
+    rows = iter(rows)
+    with ExitStack() as stack:
+        if hasher is None:
+            hasher = stack.enter_context(PasswordHasherPool(workers))
+        while True:
+            try:
+                chunk = list(islice(rows, batch_size))
+            except (UnicodeDecodeError, csv.Error) as e:
+                # Earlier batches are already committed; stop here and say why.
+                file_errors = {"file": [f"Could not read the rest of the file: {e}"]}
+                break
+            if not chunk:
+                break
+            batch: List[tuple[int, dict]] = []
+            for line, raw, errors in chunk:
+                values = {}
+                if not errors:
+                    values, errors = _clean_row(raw, group_ids_by_name)
+                if not errors and values["username"] in seen:
+                    errors = {"username": ["Duplicate username in this file."]}
+                if errors:
+                    reject(line, errors)
+                    continue
+                seen.add(values["username"])
+                batch.append((line, values))
+
+            encoded: dict[int, str] = {}
+            for attempt in range(2):
+                taken = set(
+                    User.objects.filter(username__in=[v["username"] for _, v in batch]).values_list(
+                        "username", flat=True
+                    )
+                )
+                for line, values in batch:
+                    if values["username"] in taken:
+                        reject(line, {"username": ["A user with that username already exists."]})
+                batch = [(line, values) for line, values in batch if values["username"] not in taken]
+                if not batch:
+                    break
+
+                # Keyed by line, so a retry only hashes passwords it hasn't yet.
+                to_hash = [
+                    (line, values["password"])
+                    for line, values in batch
+                    if values["password"] is not None and line not in encoded
+                ]
+                if to_hash:
+                    encoded.update(zip([line for line, _ in to_hash], hasher.hash([pw for _, pw in to_hash])))
+                passwords = [
+                    encoded.get(line) or values["password_hash"] or make_password(None) for line, values in batch
+                ]
+                try:
+                    _insert_batch(batch, passwords)
+                except IntegrityError:
+                    # A concurrent writer took one of the usernames; re-check once.
+                    if attempt:
+                        for line, _ in batch:
+                            reject(line, {"non_field_errors": ["Could not be saved; please retry."]})
+                    continue
+                created += len(batch)
+                break
+
+    row_errors.sort(key=lambda e: e.line)
+    return ImportResultDTO(created=created, failed=failed, errors=file_errors, row_errors=row_errors)
+
+
+def import_users_service(upload, request: HttpRequest) -> ImportResultDTO:
+    """
+    Import users from an uploaded CSV/JSONL file (admin upload).
+    """
+
+    if not can_manage_users(request.user):
+        return ImportResultDTO(created=0, failed=0, errors={"non_field_errors": ["Permission denied."]}, row_errors=[])
+    if upload is None:
+        return ImportResultDTO(created=0, failed=0, errors={"file": ["This field is required."]}, row_errors=[])
+    fmt = detect_import_format(upload.name)
+    if fmt is None:
+        return ImportResultDTO(
+            created=0,
+            failed=0,
+            errors={"file": ["Upload a .csv or .jsonl file."]},
+            row_errors=[],
+        )
+
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        return import_users(iter_import_rows(stream, fmt), hasher=get_import_hasher_pool())
+    finally:
+        stream.detach()
@@ -1,7 +1,10 @@
 from typing import Dict, List
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
+from django.db import IntegrityError, transaction
 from django.http import HttpRequest
 
 from apps.admin_panel.domain.policies import can_manage_users
@@ -10,6 +13,8 @@ from apps.admin_panel.dto.users import (
     UserFormResultDTO,
 )
 from apps.admin_panel.selectors.users import get_user_by_id
+from apps.admin_panel.services.diff import assign_changed_fields, sync_related_ids
+from apps.admin_panel.services.password_hashing import HashQueueFull, get_hashing_executor
 
 User = get_user_model()
 
@@ -24,11 +29,21 @@ def _check_permission(request: HttpRequest) -> UserFormResultDTO | None:
     return None
 
 
-def create_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserFormResultDTO:
-    denied = _check_permission(request)
-    if denied:
-        return denied
+def _busy() -> UserFormResultDTO:
+    return UserFormResultDTO(
+        success=False,
+        user_id=None,
+        errors={"non_field_errors": ["The server is busy hashing passwords. Please try again in a moment."]},
+    )
+
 
+def _set_encoded_password(user, raw_password: str, encoded: str) -> None:
+    # What `set_password` does, with the hash computed by the caller.
+    user.password = encoded
+    user._password = raw_password
+
+
+def _create_errors(dto: UserFormInputDTO) -> Dict[str, List[str]]:
     errors: Dict[str, List[str]] = {}
 
     if not (dto.username or "").strip():
@@ -39,9 +54,10 @@ def create_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserForm
     if dto.password is None or (isinstance(dto.password, str) and len(dto.password) < 1):
         errors.setdefault("password", []).append("This field is required.")
 
-    if errors:
-        return UserFormResultDTO(success=False, user_id=None, errors=errors)
+    return errors
+
 
+def _create_user(dto: UserFormInputDTO, encoded_password: str | None) -> UserFormResultDTO:
     user = User()
     user.username = (dto.username or "").strip()
     user.email = (dto.email or "").strip()
@@ -50,8 +66,8 @@ def create_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserForm
     user.is_staff = bool(dto.is_staff)
     user.is_superuser = bool(dto.is_superuser)
     user.is_active = bool(dto.is_active)
-    if dto.password:
-        user.set_password(dto.password)
+    if encoded_password:
+        _set_encoded_password(user, dto.password, encoded_password)
     user.save()
 
     group_ids = getattr(dto, "group_ids", []) or []
@@ -60,49 +76,133 @@ def create_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserForm
     return UserFormResultDTO(success=True, user_id=user.id, errors={})
 
 
-def update_user_service(
-    user_id: int,
-    dto: UserFormInputDTO,
-    request: HttpRequest,
-) -> UserFormResultDTO:
+def create_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserFormResultDTO:
     denied = _check_permission(request)
     if denied:
         return denied
 
+    errors = _create_errors(dto)
+    if errors:
+        return UserFormResultDTO(success=False, user_id=None, errors=errors)
+
+    return _create_user(dto, make_password(dto.password) if dto.password else None)
+
+
+async def acreate_user_service(dto: UserFormInputDTO, request: HttpRequest) -> UserFormResultDTO:
+    """
+    Async `create_user_service`; the password is hashed on the bounded hashing executor.
+    """
+
+    denied = await sync_to_async(_check_permission)(request)
+    if denied:
+        return denied
+
+    errors = await sync_to_async(_create_errors)(dto)
+    if errors:
+        return UserFormResultDTO(success=False, user_id=None, errors=errors)
+
+    encoded = None
+    if dto.password:
+        try:
+            encoded = await get_hashing_executor().run(make_password, dto.password)
+        except HashQueueFull:
+            return _busy()
+    return await sync_to_async(_create_user)(dto, encoded)
+
+
+def _update_errors(user_id: int, dto: UserFormInputDTO) -> tuple[object | None, Dict[str, List[str]]]:
     user = get_user_by_id(user_id)
     if not user:
-        return UserFormResultDTO(
-            success=False,
-            user_id=None,
-            errors={"non_field_errors": ["User not found."]},
-        )
+        return None, {"non_field_errors": ["User not found."]}
 
     errors: Dict[str, List[str]] = {}
 
-    username = (dto.username or "").strip()
-    if not username:
+    # Username uniqueness is left to the database constraint (see `_update_user`).
+    if not (dto.username or "").strip():
         errors.setdefault("username", []).append("This field is required.")
-    if User.objects.filter(username=username).exclude(pk=user_id).exists():
-        errors.setdefault("username", []).append("A user with that username already exists.")
 
+    return user, errors
+
+
+def _update_user(user, dto: UserFormInputDTO, encoded_password: str | None) -> UserFormResultDTO:
+    """
+    Write only what the form changed: the differing columns, and the membership rows
+    that were added or removed. An unchanged resubmit reads the groups and writes nothing.
+    """
+
+    changed = assign_changed_fields(
+        user,
+        {
+            "username": (dto.username or "").strip(),
+            "email": (dto.email or "").strip(),
+            "first_name": (dto.first_name or "").strip(),
+            "last_name": (dto.last_name or "").strip(),
+            "is_staff": bool(dto.is_staff),
+            "is_superuser": bool(dto.is_superuser),
+            "is_active": bool(dto.is_active),
+        },
+    )
+    if encoded_password:
+        _set_encoded_password(user, dto.password, encoded_password)
+        changed.append("password")
+
+    try:
+        with transaction.atomic():
+            if changed:
+                user.save(update_fields=changed)
+            sync_related_ids(user.groups, getattr(dto, "group_ids", []) or [], Group)
+    except IntegrityError:
+        if "username" in changed and User.objects.filter(username=user.username).exclude(pk=user.pk).exists():
+            return UserFormResultDTO(
+                success=False,
+                user_id=None,
+                errors={"username": ["A user with that username already exists."]},
+            )
+        raise
+
+    return UserFormResultDTO(success=True, user_id=user.id, errors={})
+
+
+def update_user_service(
+    user_id: int,
+    dto: UserFormInputDTO,
+    request: HttpRequest,
+) -> UserFormResultDTO:
+    denied = _check_permission(request)
+    if denied:
+        return denied
+
+    user, errors = _update_errors(user_id, dto)
     if errors:
         return UserFormResultDTO(success=False, user_id=None, errors=errors)
 
-    user.username = username
-    user.email = (dto.email or "").strip()
-    user.first_name = (dto.first_name or "").strip()
-    user.last_name = (dto.last_name or "").strip()
-    user.is_staff = bool(dto.is_staff)
-    user.is_superuser = bool(dto.is_superuser)
-    user.is_active = bool(dto.is_active)
-    if dto.password is not None and dto.password != "":
-        user.set_password(dto.password)
-    user.save()
+    return _update_user(user, dto, make_password(dto.password) if dto.password else None)
 
-    group_ids = getattr(dto, "group_ids", []) or []
-    user.groups.set(Group.objects.filter(pk__in=group_ids))
 
-    return UserFormResultDTO(success=True, user_id=user.id, errors={})
+async def aupdate_user_service(
+    user_id: int,
+    dto: UserFormInputDTO,
+    request: HttpRequest,
+) -> UserFormResultDTO:
+    """
+    Async `update_user_service`; a new password is hashed on the bounded hashing executor.
+    """
+
+    denied = await sync_to_async(_check_permission)(request)
+    if denied:
+        return denied
+
+    user, errors = await sync_to_async(_update_errors)(user_id, dto)
+    if errors:
+        return UserFormResultDTO(success=False, user_id=None, errors=errors)
+
+    encoded = None
+    if dto.password:
+        try:
+            encoded = await get_hashing_executor().run(make_password, dto.password)
+        except HashQueueFull:
+            return _busy()
+    return await sync_to_async(_update_user)(user, dto, encoded)
 
 
 def delete_user_service(user_id: int, request: HttpRequest) -> UserFormResultDTO:
@@ -0,0 +1,7 @@
+"""
+Session engines for the admin.
+
+Point `SESSION_ENGINE` at one of the modules in this package ("db", "cached_db",
+"signed_cookies"); each wraps the Django engine of the same name with
+`WriteAvoidingSessionMixin`.
+"""
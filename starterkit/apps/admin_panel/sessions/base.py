@@ -0,0 +1,32 @@
+# Values that cannot have been mutated in place since they were read, so an equal
+# assignment really is a no-op.
+SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class WriteAvoidingSessionMixin:
+    """
+    Don't mark the session modified when a key is set to the value it already holds.
+
+    `login()` rewrites the user id, backend and auth hash on every call, which would
+    otherwise cost a session UPDATE (or a new Set-Cookie) even when nothing changed.
+    Only scalar values are compared; containers always count as a change because they
+    may have been mutated in place.
+    """
+
+    def __setitem__(self, key, value):
+        if isinstance(value, SCALAR_TYPES) and self._is_unchanged(key, value):
+            return
+        super().__setitem__(key, value)
+
+    def update(self, dict_):
+        changed = {
+            key: value
+            for key, value in dict_.items()
+            if not (isinstance(value, SCALAR_TYPES) and self._is_unchanged(key, value))
+        }
+        if changed:
+            super().update(changed)
+
+    def _is_unchanged(self, key, value) -> bool:
+        session = self._session
+        return key in session and type(session[key]) is type(value) and session[key] == value
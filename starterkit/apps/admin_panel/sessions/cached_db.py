@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.cached_db import SessionStore as BaseCachedDBSessionStore
+
+from apps.admin_panel.sessions.base import WriteAvoidingSessionMixin
+
+
+class SessionStore(WriteAvoidingSessionMixin, BaseCachedDBSessionStore):
+    pass
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.db import SessionStore as BaseDBSessionStore
+
+from apps.admin_panel.sessions.base import WriteAvoidingSessionMixin
+
+
+class SessionStore(WriteAvoidingSessionMixin, BaseDBSessionStore):
+    pass
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.signed_cookies import SessionStore as BaseSignedCookieSessionStore
+
+from apps.admin_panel.sessions.base import WriteAvoidingSessionMixin
+
+
+class SessionStore(WriteAvoidingSessionMixin, BaseSignedCookieSessionStore):
+    pass
@@ -0,0 +1,252 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.admin_panel.models import GroupCounter
+from apps.admin_panel.search.backends import get_user_search_backend
+from apps.admin_panel.selectors.caching import (
+    GROUPS_TAG,
+    PERMISSIONS_TAG,
+    USERS_TAG,
+    invalidate_tags,
+    user_tag,
+)
+from apps.admin_panel.services.bulk_writes import in_bulk_user_writes
+from apps.admin_panel.services.dashboard_stats import (
+    GROUP_COUNT,
+    USER_STAT_FIELDS,
+    apply_signup_deltas,
+    apply_stats_deltas,
+    signup_day,
+    user_stat_contribution,
+)
+from apps.admin_panel.services.invalidation import bus_is_installed, invalidate
+from apps.admin_panel.services.group_counters import (
+    PERMISSION_COUNT,
+    USER_COUNT,
+    apply_group_count_deltas,
+)
+
+User = get_user_model()
+
+USER_SEARCH_FIELDS = {"username", "email"}
+
+UserGroups = User.groups.through
+GroupPermissions = Group.permissions.through
+USER_GROUPS_USER_COLUMN = f"{User.groups.field.m2m_field_name()}_id"
+GROUP_PERMISSIONS_PERMISSION_COLUMN = f"{Group.permissions.field.m2m_reverse_field_name()}_id"
+
+@receiver(post_save, sender=User, dispatch_uid="admin_panel_index_user_on_save")
+def index_user_on_save(sender, instance, using, update_fields=None, **kwargs):
+    """Keep the user search index in step with username/email changes."""
+    if update_fields is not None and not USER_SEARCH_FIELDS.intersection(update_fields):
+        # e.g. the `last_login` update on every login.
+        return
+    get_user_search_backend().index([(instance.pk, instance.username, instance.email or "")], using=using)
+
+
+@receiver(post_delete, sender=User, dispatch_uid="admin_panel_unindex_user_on_delete")
+def unindex_user_on_delete(sender, instance, using, **kwargs):
+    if in_bulk_user_writes():
+        return
+    get_user_search_backend().remove([instance.pk], using=using)
+
+
+# Group counters ------------------------------------------------------------
+
+
+def _track_membership_change(*, field, through, other_column, group_is_instance, instance, action, pk_set):
+    """
+    Turn an m2m_changed signal into exact counter deltas.
+
+    `pk_set` on removal lists what was *requested*, not what existed, so the rows that
+    are really going away are looked up in pre_remove/pre_clear and applied afterwards.
+    """
+
+    if group_is_instance:
+        instance_column, related_column = "group_id", other_column
+    else:
+        instance_column, related_column = other_column, "group_id"
+
+    pending = instance.__dict__.setdefault("_admin_panel_pending_m2m", {})
+    if action in ("pre_remove", "pre_clear"):
+        rows = through.objects.filter(**{instance_column: instance.pk})
+        if action == "pre_remove":
+            rows = rows.filter(**{f"{related_column}__in": pk_set})
+        pending[(through, action)] = set(rows.values_list(related_column, flat=True))
+        return
+
+    if action == "post_add":
+        changed, sign = pk_set or set(), 1
+    elif action in ("post_remove", "post_clear"):
+        changed, sign = pending.pop((through, action.replace("post_", "pre_")), set()), -1
+    else:
+        return
+    if not changed:
+        return
+
+    if group_is_instance:
+        deltas = {instance.pk: sign * len(changed)}
+    else:
+        deltas = {group_id: sign for group_id in changed}
+    apply_group_count_deltas(field, deltas)
+
+
+@receiver(m2m_changed, sender=UserGroups, dispatch_uid="admin_panel_count_group_members")
+def count_group_members(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: user.groups.*(groups); reverse: group.user_set.*(users).
+    _track_membership_change(
+        field=USER_COUNT,
+        through=sender,
+        other_column=USER_GROUPS_USER_COLUMN,
+        group_is_instance=reverse,
+        instance=instance,
+        action=action,
+        pk_set=pk_set,
+    )
+
+
+@receiver(m2m_changed, sender=GroupPermissions, dispatch_uid="admin_panel_count_group_permissions")
+def count_group_permissions(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: group.permissions.*(permissions); reverse: permission.group_set.*(groups).
+    _track_membership_change(
+        field=PERMISSION_COUNT,
+        through=sender,
+        other_column=GROUP_PERMISSIONS_PERMISSION_COLUMN,
+        group_is_instance=not reverse,
+        instance=instance,
+        action=action,
+        pk_set=pk_set,
+    )
+
+
+@receiver(post_save, sender=Group, dispatch_uid="admin_panel_create_group_counter")
+def create_group_counter(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        GroupCounter.objects.get_or_create(group=instance)
+
+
+@receiver(pre_delete, sender=User, dispatch_uid="admin_panel_uncount_deleted_user")
+def uncount_deleted_user(sender, instance, **kwargs):
+    if in_bulk_user_writes():
+        return
+    # Deleting a user drops its membership rows without an m2m_changed signal.
+    group_ids = UserGroups.objects.filter(**{USER_GROUPS_USER_COLUMN: instance.pk}).values_list("group_id", flat=True)
+    apply_group_count_deltas(USER_COUNT, {group_id: -1 for group_id in group_ids})
+
+
+@receiver(pre_delete, sender=Permission, dispatch_uid="admin_panel_uncount_deleted_permission")
+def uncount_deleted_permission(sender, instance, **kwargs):
+    group_ids = GroupPermissions.objects.filter(
+        **{GROUP_PERMISSIONS_PERMISSION_COLUMN: instance.pk}
+    ).values_list("group_id", flat=True)
+    apply_group_count_deltas(PERMISSION_COUNT, {group_id: -1 for group_id in group_ids})
+
+
+# Dashboard stats -----------------------------------------------------------
+
+DASHBOARD_USER_FIELDS = (*USER_STAT_FIELDS, "date_joined")
+
+
+def _user_stats(user) -> tuple[dict[str, int], object]:
+    return (
+        user_stat_contribution(user.is_active, user.is_staff, user.is_superuser),
+        signup_day(user.date_joined),
+    )
+
+
+@receiver(pre_save, sender=User, dispatch_uid="admin_panel_snapshot_user_stats")
+def snapshot_user_stats(sender, instance, update_fields=None, **kwargs):
+    """Remember what an existing user contributed before the save changes it."""
+    if instance._state.adding:
+        return
+    if update_fields is not None and not set(DASHBOARD_USER_FIELDS).intersection(update_fields):
+        # e.g. the `last_login` update on every login.
+        return
+    row = sender.objects.filter(pk=instance.pk).values_list(*DASHBOARD_USER_FIELDS).first()
+    if row is not None:
+        is_active, is_staff, is_superuser, date_joined = row
+        instance.__dict__["_admin_panel_stats_before"] = (
+            user_stat_contribution(is_active, is_staff, is_superuser),
+            signup_day(date_joined),
+        )
+
+
+@receiver(post_save, sender=User, dispatch_uid="admin_panel_count_saved_user")
+def count_saved_user(sender, instance, created, **kwargs):
+    totals, day = _user_stats(instance)
+    if created:
+        if apply_stats_deltas(totals):
+            apply_signup_deltas({day: 1})
+        return
+    before = instance.__dict__.pop("_admin_panel_stats_before", None)
+    if before is None:
+        return
+    old_totals, old_day = before
+    applied = apply_stats_deltas({field: totals[field] - old_totals[field] for field in totals})
+    if applied and day != old_day:
+        apply_signup_deltas({old_day: -1, day: 1})
+
+
+@receiver(post_delete, sender=User, dispatch_uid="admin_panel_uncount_deleted_user_stats")
+def uncount_deleted_user_stats(sender, instance, **kwargs):
+    if in_bulk_user_writes():
+        return
+    totals, day = _user_stats(instance)
+    if apply_stats_deltas({field: -delta for field, delta in totals.items()}):
+        apply_signup_deltas({day: -1})
+
+
+@receiver(post_save, sender=Group, dispatch_uid="admin_panel_count_created_group")
+def count_created_group(sender, instance, created, **kwargs):
+    if created:
+        apply_stats_deltas({GROUP_COUNT: 1})
+
+
+@receiver(post_delete, sender=Group, dispatch_uid="admin_panel_uncount_deleted_group")
+def uncount_deleted_group(sender, **kwargs):
+    apply_stats_deltas({GROUP_COUNT: -1})
+
+
+# Selector cache invalidation ------------------------------------------------
+
+
+@receiver(post_save, sender=Group, dispatch_uid="admin_panel_invalidate_groups_on_save")
+@receiver(post_delete, sender=Group, dispatch_uid="admin_panel_invalidate_groups_on_delete")
+def invalidate_groups(sender, **kwargs):
+    invalidate(GROUPS_TAG)
+
+
+@receiver(post_save, sender=User, dispatch_uid="admin_panel_invalidate_users_on_save")
+def invalidate_users_on_save(sender, instance, created, update_fields=None, **kwargs):
+    # A new user has nothing cached yet, and the `last_login` update on every login
+    # changes nothing a cached request user is checked against.
+    if created or (update_fields is not None and set(update_fields) <= {"last_login"}):
+        return
+    invalidate(user_tag(instance.pk))
+
+
+@receiver(post_delete, sender=User, dispatch_uid="admin_panel_invalidate_users_on_delete")
+def invalidate_users_on_delete(sender, instance, **kwargs):
+    if in_bulk_user_writes():
+        return
+    invalidate(user_tag(instance.pk))
+
+
+@receiver(post_save, sender=Permission, dispatch_uid="admin_panel_invalidate_permissions_on_save")
+@receiver(post_delete, sender=Permission, dispatch_uid="admin_panel_invalidate_permissions_on_delete")
+@receiver(post_save, sender=ContentType, dispatch_uid="admin_panel_invalidate_content_types_on_save")
+@receiver(post_delete, sender=ContentType, dispatch_uid="admin_panel_invalidate_content_types_on_delete")
+def invalidate_permissions(sender, **kwargs):
+    invalidate(PERMISSIONS_TAG)
+
+
+@receiver(post_migrate, dispatch_uid="admin_panel_invalidate_selectors_on_migrate")
+def invalidate_after_migrate(sender, **kwargs):
+    # create_permissions uses bulk_create, which sends no post_save.
+    if bus_is_installed():
+        invalidate(GROUPS_TAG, PERMISSIONS_TAG, USERS_TAG)
+    else:
+        invalidate_tags(GROUPS_TAG, PERMISSIONS_TAG, USERS_TAG)
@@ -0,0 +1,31 @@
+from django import template
+from django.utils.html import format_html_join
+
+from apps.admin_panel.api.render_utils import PAGE_COMPONENT_CONTEXT_KEY
+from apps.admin_panel.assets.vite import (
+    LINK_HEADER_META_KEY,
+    get_dev_server_url,
+    get_link_header,
+    get_page_assets,
+)
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def vite_assets(context) -> str:
+    """
+    Stylesheets, modulepreload links and the entry script for this page, from the
+    dev server or the build manifest. Place it in <head>. The page's own chunks are
+    only preloaded for responses built by `render_utils.render`.
+    """
+
+    assets = get_page_assets(context.get(PAGE_COMPONENT_CONTEXT_KEY))
+    request = context.get("request")
+    if request is not None and not get_dev_server_url():
+        request.META[LINK_HEADER_META_KEY] = get_link_header(assets)
+    return (
+        format_html_join("", '<link rel="stylesheet" href="{}" />\n', ((url,) for url in assets.styles))
+        + format_html_join("", '<link rel="modulepreload" href="{}" />\n', ((url,) for url in assets.preloads))
+        + format_html_join("", '<script type="module" src="{}"></script>\n', ((url,) for url in assets.scripts))
+    )
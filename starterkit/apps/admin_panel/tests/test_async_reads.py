@@ -0,0 +1,114 @@
+import threading
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from apps.admin_panel.models import DashboardStats
+from apps.admin_panel.selectors.auth import aget_dashboard_stats, get_dashboard_stats
+from apps.admin_panel.selectors.concurrency import gather_reads
+from apps.admin_panel.selectors.groups import aget_group_page, get_group_page
+from apps.admin_panel.selectors.pagination import TOTAL_NONE
+from apps.admin_panel.selectors.users import aget_user_page, get_user_page
+
+User = get_user_model()
+
+
+def _user_count():
+    return (threading.get_ident(), User.objects.count())
+
+
+class AsyncSelectorTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", is_staff=True)
+        for i in range(5):
+            User.objects.create_user(username=f"user{i}", email=f"u{i}@example.com")
+        Group.objects.create(name="Editors")
+
+    async def test_async_selectors_match_sync_ones(self):
+        for kwargs in (
+            {"page_size": 2},
+            {"page": 3, "page_size": 2},
+            {"search": "user", "order_by": "-email"},
+            {"page_size": 2, "total_mode": TOTAL_NONE},
+        ):
+            self.assertEqual(await aget_user_page(**kwargs), await sync_to_async(get_user_page)(**kwargs))
+        first = await aget_user_page(page_size=2)
+        self.assertEqual(
+            await aget_user_page(cursor=first.next_cursor, page_size=2),
+            await sync_to_async(get_user_page)(cursor=first.next_cursor, page_size=2),
+        )
+        self.assertEqual(await aget_group_page(), await sync_to_async(get_group_page)())
+
+    async def test_dashboard_stats_with_and_without_rollup(self):
+        expected = await sync_to_async(get_dashboard_stats)(days=7)
+        self.assertEqual(await aget_dashboard_stats(days=7), expected)
+        await DashboardStats.objects.all().adelete()
+        self.assertEqual(await aget_dashboard_stats(days=7), expected)
+
+    async def test_reads_run_in_turn_inside_a_transaction(self):
+        (thread_a, count), (thread_b, _) = await gather_reads(_user_count, _user_count)
+        self.assertEqual(thread_a, thread_b)
+        # Rows written in this test's transaction are visible.
+        self.assertEqual(count, 6)
+
+    def test_async_views(self):
+        self.client.force_login(self.staff)
+        headers = {"X-Inertia": "true"}
+        props = self.client.get("/admin/users/?page_size=2&search=user", headers=headers).json()["props"]
+        self.assertEqual([u["username"] for u in props["users"]], ["user0", "user1"])
+        self.assertEqual(props["pagination"]["total"], 5)
+        self.assertEqual(props["auth"]["user"]["username"], "staff")
+        self.assertEqual(props["groups_choices"][0]["name"], "Editors")
+
+        props = self.client.get("/admin/groups/", headers=headers).json()["props"]
+        self.assertEqual([g["name"] for g in props["groups"]], ["Editors"])
+        props = self.client.get("/admin/", headers=headers).json()["props"]
+        self.assertEqual(props["stats"]["user_count"], 6)
+
+    async def test_middleware_chain_runs_in_async_mode(self):
+        # With DEBUG on, the handler logs every middleware it has to adapt between
+        # sync and async.
+        await self.async_client.aforce_login(self.staff)
+        with override_settings(DEBUG=True), self.assertNoLogs("django.request", "DEBUG"):
+            response = await self.async_client.get("/admin/users/", headers={"X-Inertia": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["props"]["auth"]["user"]["username"], "staff")
+
+
+class ConcurrentReadTests(TransactionTestCase):
+    def setUp(self):
+        for i in range(3):
+            User.objects.create_user(username=f"user{i}")
+        # Concurrency needs persistent connections; the test settings leave CONN_MAX_AGE at 0.
+        persistent = mock.patch.dict(connections.settings[DEFAULT_DB_ALIAS], {"CONN_MAX_AGE": 60})
+        persistent.start()
+        self.addCleanup(persistent.stop)
+
+    async def test_reads_run_on_separate_threads(self):
+        # Neither read can finish until both are running.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def read():
+            barrier.wait()
+            return _user_count()
+
+        (thread_a, count), (thread_b, _) = await gather_reads(read, read)
+        self.assertNotEqual(thread_a, thread_b)
+        self.assertEqual(count, 3)
+
+        page = await aget_user_page(page_size=2)
+        self.assertEqual((page.total, len(page.items), page.has_next), (3, 2, True))
+
+    @override_settings(ADMIN_PANEL_CONCURRENT_READS=False)
+    async def test_setting_turns_concurrency_off(self):
+        (thread_a, _), (thread_b, _) = await gather_reads(_user_count, _user_count)
+        self.assertEqual(thread_a, thread_b)
+
+    async def test_non_persistent_connections_turn_concurrency_off(self):
+        connections.settings[DEFAULT_DB_ALIAS]["CONN_MAX_AGE"] = 0
+        (thread_a, _), (thread_b, _) = await gather_reads(_user_count, _user_count)
+        self.assertEqual(thread_a, thread_b)
@@ -0,0 +1,74 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from apps.admin_panel.dto.users import UserFormInputDTO
+from apps.admin_panel.models import CacheTagVersion
+from apps.admin_panel.selectors.caching import user_tag
+from apps.admin_panel.services.invalidation import sync_invalidations
+from apps.admin_panel.services.users import delete_user_service, update_user_service
+
+User = get_user_model()
+
+
+@override_settings(ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL=60)
+class RequestUserCacheTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.admin = User.objects.create_superuser(username="root", password="pw")
+        self.client.force_login(self.staff)
+        self.client.get("/admin/")
+        # Within the sync interval, warm requests skip the shared version check.
+        sync_invalidations(force=True)
+
+    def admin_request(self):
+        request = RequestFactory().post("/")
+        request.user = self.admin
+        return request
+
+    def test_user_row_is_served_from_the_snapshot(self):
+        with self.assertNumQueries(3):  # session, stats row, signup series
+            response = self.client.get("/admin/", headers={"X-Inertia": "true"})
+        self.assertEqual(response.json()["props"]["auth"]["user"]["username"], "staff")
+
+    def test_update_user_service_evicts_the_snapshot(self):
+        dto = UserFormInputDTO(
+            username="staff",
+            email="",
+            first_name="",
+            last_name="",
+            password=None,
+            is_staff=False,
+            is_superuser=False,
+            is_active=True,
+            group_ids=[],
+        )
+        self.assertTrue(update_user_service(self.staff.id, dto, self.admin_request()).success)
+        self.assertEqual(self.client.get("/admin/").status_code, 302)
+
+    def test_delete_user_service_evicts_the_snapshot(self):
+        self.assertTrue(delete_user_service(self.staff.id, self.admin_request()).success)
+        self.assertEqual(self.client.get("/admin/").status_code, 302)
+
+    def test_password_change_logs_out_other_sessions(self):
+        self.staff.set_password("new")
+        self.staff.save()
+        self.assertEqual(self.client.get("/admin/").status_code, 302)
+
+    def test_last_login_update_keeps_the_snapshot(self):
+        self.staff.last_login = timezone.now()
+        self.staff.save(update_fields=["last_login"])
+        self.assertFalse(CacheTagVersion.objects.filter(tag=user_tag(self.staff.pk)).exists())
+
+    def test_saving_another_user_keeps_the_snapshot(self):
+        self.admin.first_name = "Root"
+        self.admin.save()
+        self.assertTrue(CacheTagVersion.objects.filter(tag=user_tag(self.admin.pk)).exists())
+        self.assertFalse(CacheTagVersion.objects.filter(tag=user_tag(self.staff.pk)).exists())
+        with self.assertNumQueries(3):  # session, stats row, signup series
+            self.client.get("/admin/", headers={"X-Inertia": "true"})
+
+    @override_settings(ADMIN_PANEL_AUTH_USER_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        with self.assertNumQueries(4):  # session, user, stats row, signup series
+            self.client.get("/admin/")
@@ -0,0 +1,57 @@
+from django.apps import apps
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db.models.signals import post_migrate
+from django.test import TestCase
+
+from apps.admin_panel.selectors.caching import cached_selector, invalidate_tags
+from apps.admin_panel.selectors.groups import get_all_permissions_choices, get_groups_choices
+
+
+class CachedSelectorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Group.objects.create(name="Admins")
+
+    def test_choices_are_served_from_cache(self):
+        with self.assertNumQueries(1):
+            first = get_groups_choices()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_groups_choices(), first)
+        with self.assertNumQueries(1):
+            get_all_permissions_choices()
+        with self.assertNumQueries(0):
+            get_all_permissions_choices()
+
+    def test_group_writes_invalidate_groups_only(self):
+        get_groups_choices()
+        get_all_permissions_choices()
+        group = Group.objects.create(name="Editors")
+        with self.assertNumQueries(1):
+            self.assertEqual([g["name"] for g in get_groups_choices()], ["Admins", "Editors"])
+        with self.assertNumQueries(0):
+            get_all_permissions_choices()
+        group.delete()
+        self.assertEqual([g["name"] for g in get_groups_choices()], ["Admins"])
+
+    def test_permission_changes_and_migrate_invalidate_permissions(self):
+        get_all_permissions_choices()
+        Permission.objects.filter(pk=Permission.objects.order_by("pk").first().pk).delete()
+        with self.assertNumQueries(1):
+            get_all_permissions_choices()
+        post_migrate.send(sender=apps.get_app_config("auth"), app_config=apps.get_app_config("auth"))
+        with self.assertNumQueries(1):
+            get_all_permissions_choices()
+
+    def test_arguments_and_tags_are_part_of_the_key(self):
+        calls = []
+
+        @cached_selector("things")
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        self.assertEqual((double(2), double(2), double(3)), (4, 4, 6))
+        invalidate_tags("things")
+        double(2)
+        self.assertEqual(calls, [2, 3, 2])
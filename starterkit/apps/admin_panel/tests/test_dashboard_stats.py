@@ -0,0 +1,105 @@
+import datetime
+from contextlib import contextmanager
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.admin_panel.models import DailySignupCount, DashboardStats
+from apps.admin_panel.selectors.auth import get_dashboard_stats
+from apps.admin_panel.services import dashboard_stats
+from apps.admin_panel.services.dashboard_stats import (
+    apply_signup_deltas,
+    rebuild_dashboard_stats,
+    record_users_added,
+)
+
+User = get_user_model()
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        rebuild_dashboard_stats()
+        self.users = [User.objects.create_user(username=f"user{i}") for i in range(3)]
+        self.users[0].is_staff = True
+        self.users[0].save()
+
+    def totals(self):
+        stats = DashboardStats.objects.get()
+        return (
+            stats.user_count,
+            stats.active_user_count,
+            stats.staff_user_count,
+            stats.superuser_count,
+            stats.group_count,
+        )
+
+    def test_signals_keep_totals_current(self):
+        Group.objects.create(name="Editors")
+        User.objects.create_superuser(username="root", password="pw")
+        self.users[1].is_active = False
+        self.users[1].save(update_fields=["is_active"])
+        self.assertEqual(self.totals(), (4, 3, 2, 1, 1))
+
+        self.users[0].delete()
+        Group.objects.get(name="Editors").delete()
+        self.assertEqual(self.totals(), (3, 2, 1, 1, 0))
+
+    def test_last_login_update_is_not_tracked(self):
+        with self.assertNumQueries(1):
+            self.users[2].last_login = timezone.now()
+            self.users[2].save(update_fields=["last_login"])
+
+    def test_daily_signups(self):
+        today = timezone.localdate()
+        self.users[2].date_joined -= datetime.timedelta(days=2)
+        self.users[2].save()
+        self.assertEqual(DailySignupCount.objects.get(day=today).count, 2)
+        self.assertEqual(DailySignupCount.objects.get(day=today - datetime.timedelta(days=2)).count, 1)
+
+        with self.assertNumQueries(2):
+            stats = get_dashboard_stats(days=7)
+        self.assertEqual(len(stats["signups"]), 7)
+        self.assertEqual(stats["signups"][-1], {"date": today.isoformat(), "count": 2})
+        self.assertEqual(stats["signups"][-3]["count"], 1)
+        self.assertEqual(stats["user_count"], 3)
+
+    def test_day_created_concurrently_keeps_both_counts(self):
+        day = datetime.date(2026, 1, 2)
+
+        @contextmanager
+        def atomic():
+            # Another writer inserts the day after this one looked for it.
+            if not DailySignupCount.objects.filter(day=day).exists():
+                DailySignupCount.objects.create(day=day, count=5)
+            with transaction.atomic():
+                yield
+
+        with mock.patch.object(dashboard_stats, "transaction", SimpleNamespace(atomic=atomic)):
+            apply_signup_deltas({day: 2})
+        self.assertEqual(DailySignupCount.objects.get(day=day).count, 7)
+
+    def test_bulk_writers_and_rebuild(self):
+        User.objects.bulk_create([User(username="bulk", is_superuser=True)])
+        record_users_added([(True, False, True, timezone.now())])
+        self.assertEqual(self.totals(), (4, 4, 1, 1, 0))
+        self.assertEqual(DailySignupCount.objects.get(day=timezone.localdate()).count, 4)
+
+        DashboardStats.objects.update(user_count=0)
+        DailySignupCount.objects.all().delete()
+        call_command("rebuild_dashboard_stats", stdout=StringIO())
+        self.assertEqual(self.totals(), (4, 4, 1, 1, 0))
+        self.assertEqual(DailySignupCount.objects.get(day=timezone.localdate()).count, 4)
+
+    def test_missing_rollup_row_is_rebuilt(self):
+        DashboardStats.objects.all().delete()
+        self.assertEqual(get_dashboard_stats()["user_count"], 3)
+        User.objects.create_user(username="late")
+        self.assertEqual(self.totals()[0], 4)
+        self.assertEqual(DailySignupCount.objects.get(day=timezone.localdate()).count, 4)
@@ -0,0 +1,54 @@
+import dataclasses
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from apps.admin_panel.dto.imports import ImportResultDTO, ImportRowErrorDTO
+from apps.admin_panel.dto.users import UserDetailDTO, UserListItemDTO
+from apps.admin_panel.serialization.dto import to_dict, to_dicts
+
+
+class DTOSerializationTests(SimpleTestCase):
+    def setUp(self):
+        self.detail = UserDetailDTO(
+            id=1,
+            username="ann",
+            email="ann@example.com",
+            first_name="Ann",
+            last_name="Lee",
+            is_staff=True,
+            is_superuser=False,
+            is_active=True,
+            group_ids=[1, 2],
+            group_names=["Editors", "Viewers"],
+        )
+
+    def test_matches_asdict_in_field_order(self):
+        result = to_dict(self.detail)
+        self.assertEqual(result, dataclasses.asdict(self.detail))
+        self.assertEqual(list(result), [field.name for field in dataclasses.fields(UserDetailDTO)])
+        # Shallow: values are shared with the DTO, not copied.
+        self.assertIs(result["group_ids"], self.detail.group_ids)
+
+    def test_nested_dtos_are_left_as_is(self):
+        row_error = ImportRowErrorDTO(line=2, errors={"username": ["Required."]})
+        result = to_dict(ImportResultDTO(created=1, failed=1, errors={}, row_errors=[row_error]))
+        self.assertEqual(result["row_errors"], [row_error])
+        self.assertEqual(to_dicts(result["row_errors"]), [{"line": 2, "errors": {"username": ["Required."]}}])
+
+    def test_to_dicts(self):
+        rows = [UserListItemDTO(n, f"u{n}", "", False, False, True) for n in range(3)]
+        self.assertEqual(to_dicts(rows), [dataclasses.asdict(row) for row in rows])
+        self.assertEqual(to_dicts(row for row in rows[:1]), [dataclasses.asdict(rows[0])])
+        self.assertEqual(to_dicts([]), [])
+
+    def test_dtos_use_slots(self):
+        self.assertFalse(hasattr(self.detail, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.detail.username = "bob"
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_dto_serialization", rows=10, rounds=1, stdout=out)
+        self.assertIn("UserListItemDTO", out.getvalue())
@@ -0,0 +1,94 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+
+from apps.admin_panel.dto.groups import GroupFormInputDTO
+from apps.admin_panel.models import GroupCounter
+from apps.admin_panel.selectors.groups import get_group_page
+from apps.admin_panel.services.groups import update_group_service
+
+User = get_user_model()
+
+
+class GroupCounterTests(TestCase):
+    def setUp(self):
+        self.group = Group.objects.create(name="Editors")
+        self.other = Group.objects.create(name="Viewers")
+        self.users = [User.objects.create_user(username=f"user{i}") for i in range(3)]
+        self.perms = list(Permission.objects.order_by("pk")[:4])
+
+    def assertCounts(self, group, users, permissions):
+        counter = GroupCounter.objects.get(group=group)
+        self.assertEqual((counter.user_count, counter.permission_count), (users, permissions))
+
+    def test_new_group_starts_at_zero(self):
+        self.assertCounts(self.group, 0, 0)
+
+    def test_member_changes_from_either_side(self):
+        self.group.user_set.add(*self.users)
+        self.users[0].groups.add(self.other)
+        self.assertCounts(self.group, 3, 0)
+        self.assertCounts(self.other, 1, 0)
+
+        self.group.user_set.add(self.users[0])  # already a member
+        self.group.user_set.remove(self.users[1])
+        self.other.user_set.remove(self.users[2])  # not a member
+        self.assertCounts(self.group, 2, 0)
+        self.assertCounts(self.other, 1, 0)
+
+        self.users[0].groups.set([self.other])
+        self.assertCounts(self.group, 1, 0)
+        self.users[0].groups.clear()
+        self.assertCounts(self.other, 0, 0)
+        self.group.user_set.clear()
+        self.assertCounts(self.group, 0, 0)
+
+    def test_permission_changes_and_deletes(self):
+        self.group.permissions.set(self.perms)
+        self.perms[0].group_set.add(self.other)
+        self.assertCounts(self.group, 0, 4)
+        self.assertCounts(self.other, 0, 1)
+        self.perms[0].delete()
+        self.assertCounts(self.group, 0, 3)
+        self.assertCounts(self.other, 0, 0)
+
+    def test_user_delete_decrements_its_groups(self):
+        self.users[0].groups.set([self.group, self.other])
+        self.users[1].groups.set([self.group])
+        self.users[0].delete()
+        self.assertCounts(self.group, 1, 0)
+        self.assertCounts(self.other, 0, 0)
+
+    def test_update_service_keeps_counts(self):
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        request = RequestFactory().post("/")
+        request.user = staff
+        dto = GroupFormInputDTO(name="Editors", permission_ids=[p.id for p in self.perms[:2]])
+        update_group_service(self.group.id, dto, request)
+        self.assertCounts(self.group, 0, 2)
+
+    def test_list_counts_are_not_multiplied(self):
+        self.group.user_set.add(*self.users[:2])
+        self.group.permissions.set(self.perms[:3])
+        page = get_group_page(order_by="-user_count")
+        self.assertEqual((page.items[0].name, page.items[0].user_count, page.items[0].permission_count), ("Editors", 2, 3))
+
+    def test_list_pages_through_groups_without_counter(self):
+        GroupCounter.objects.filter(group=self.other).delete()
+        first = get_group_page(order_by="user_count", page_size=1)
+        second = get_group_page(order_by="user_count", page_size=1, cursor=first.next_cursor)
+        items = first.items + second.items
+        self.assertEqual([(item.name, item.user_count) for item in items], [("Editors", 0), ("Viewers", 0)])
+
+    def test_reconcile_command_fixes_drift(self):
+        self.group.user_set.add(*self.users)
+        GroupCounter.objects.filter(group=self.group).update(user_count=42)
+        GroupCounter.objects.filter(group=self.other).delete()
+        out = StringIO()
+        call_command("reconcile_group_counters", stdout=out)
+        self.assertIn("2 corrected", out.getvalue())
+        self.assertCounts(self.group, 3, 0)
+        self.assertCounts(self.other, 0, 0)
@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
 from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 
 from apps.admin_panel.dto.groups import GroupFormInputDTO
 from apps.admin_panel.services.groups import create_group_service, delete_group_service, update_group_service
@@ -53,3 +55,28 @@ class GroupServicesTests(TestCase):
         result = delete_group_service(group.id, request)
         self.assertTrue(result.success)
         self.assertFalse(Group.objects.filter(pk=group.id).exists())
+
+    def test_update_group_writes_only_the_diff(self):
+        group = Group.objects.create(name="Editors")
+        perms = list(Permission.objects.order_by("pk")[:3])
+        group.permissions.set(perms[:2])
+        request = self.factory.post("/admin/groups/1/edit/")
+        request.user = self.staff
+
+        dto = GroupFormInputDTO(name="Editors", permission_ids=[p.pk for p in perms[:2]])
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(update_group_service(group.id, dto, request).success)
+        writes = [q["sql"] for q in ctx.captured_queries if not q["sql"].startswith(("SELECT", "SAVEPOINT", "RELEASE"))]
+        self.assertEqual(writes, [])
+
+        dto = GroupFormInputDTO(name="Editors", permission_ids=[perms[1].pk, perms[2].pk])
+        self.assertTrue(update_group_service(group.id, dto, request).success)
+        self.assertEqual(set(group.permissions.all()), {perms[1], perms[2]})
+
+    def test_update_group_duplicate_name_comes_from_the_constraint(self):
+        Group.objects.create(name="Taken")
+        group = Group.objects.create(name="Mine")
+        request = self.factory.post("/admin/groups/1/edit/")
+        request.user = self.staff
+        result = update_group_service(group.id, GroupFormInputDTO(name="Taken", permission_ids=[]), request)
+        self.assertEqual(result.errors, {"name": ["A group with that name already exists."]})
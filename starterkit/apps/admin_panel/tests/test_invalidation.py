@@ -0,0 +1,63 @@
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase, override_settings
+
+from apps.admin_panel.models import CacheTagVersion
+from apps.admin_panel.selectors.caching import LocalTagCache
+from apps.admin_panel.selectors.groups import get_groups_choices
+from apps.admin_panel.services.invalidation import publish_tags, sync_invalidations
+
+
+class InvalidationBusTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        sync_invalidations(force=True)
+        self.local = LocalTagCache("test")
+
+    def test_publish_bumps_shared_versions(self):
+        before = dict(CacheTagVersion.objects.values_list("tag", "version"))
+        publish_tags("groups", "new-tag")
+        publish_tags("groups")
+        after = dict(CacheTagVersion.objects.values_list("tag", "version"))
+        self.assertEqual(after["groups"], before.get("groups", 0) + 2)
+        self.assertEqual(after["new-tag"], 1)
+
+    def test_sync_drops_only_published_tags(self):
+        self.local.set("a", 1, tags=["groups"])
+        self.local.set("b", 2, tags=["users"])
+        # Simulate another worker committing a write.
+        publish_tags("groups")
+        self.assertEqual(sync_invalidations(force=True), {"groups"})
+        self.assertIsNone(self.local.get("a"))
+        self.assertEqual(self.local.get("b"), 2)
+        self.assertEqual(sync_invalidations(force=True), set())
+
+    def test_sync_evicts_per_process_selector_cache(self):
+        get_groups_choices()
+        # Another worker adds a group: the shared version moves but this process's
+        # LocMem cache was never told directly.
+        CacheTagVersion.objects.filter(tag="groups").update(version=F("version") + 1)
+        Group.objects.bulk_create([Group(name="Imported")])
+        self.assertEqual(get_groups_choices(), [])
+        sync_invalidations(force=True)
+        self.assertEqual([g["name"] for g in get_groups_choices()], ["Imported"])
+
+    @override_settings(ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL=60)
+    def test_sync_interval_skips_the_query(self):
+        sync_invalidations(force=True)
+        with self.assertNumQueries(0):
+            sync_invalidations()
+
+    def test_local_cache_ttl(self):
+        self.local.set("k", "v", tags=[], timeout=-1)
+        self.assertIsNone(self.local.get("k"))
+
+    def test_local_cache_max_entries(self):
+        bounded = LocalTagCache("bounded", max_entries=2)
+        bounded.set("expired", 0, tags=[], timeout=-1)
+        bounded.set("a", 1, tags=[])
+        bounded.set("b", 2, tags=[])
+        self.assertIsNone(bounded.get("expired"))
+        bounded.set("c", 3, tags=[])
+        self.assertEqual([bounded.get(k) for k in ("a", "b", "c")], [None, 2, 3])
@@ -0,0 +1,101 @@
+import datetime
+import json
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import RequestDataTooBig
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from inertia.settings import settings as inertia_settings
+from inertia.utils import InertiaJsonEncoder
+
+from apps.admin_panel.api.request_utils import get_request_data
+from apps.admin_panel.serialization import codecs
+from apps.admin_panel.serialization.codecs import (
+    CodecInertiaJsonEncoder,
+    JSONCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    get_json_codec,
+)
+
+User = get_user_model()
+
+PAGE = {
+    "component": "Admin/Users/Index",
+    "props": {
+        "users": [{"id": 1, "username": "zoë", "is_staff": True}],
+        "joined": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2026, 1, 2),
+        "ratio": Decimal("1.50"),
+        "grants": [(1, 2), (3, 4)],
+    },
+}
+
+
+class JSONCodecTests(SimpleTestCase):
+    def check_codec(self, codec):
+        expected = json.dumps(PAGE, cls=InertiaJsonEncoder)
+        encoded = codec.dumps(PAGE, default=InertiaJsonEncoder().default)
+        self.assertEqual(json.loads(encoded), json.loads(expected))
+        self.assertEqual(codec.loads(encoded.encode()), json.loads(expected))
+        with self.assertRaises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_stdlib_codec(self):
+        self.check_codec(StdlibCodec())
+        self.assertEqual(
+            StdlibCodec().dumps(PAGE, default=InertiaJsonEncoder().default),
+            json.dumps(PAGE, cls=InertiaJsonEncoder),
+        )
+
+    def test_orjson_codec_falls_back_without_orjson(self):
+        with mock.patch.object(codecs, "orjson", None):
+            self.assertFalse(OrjsonCodec().is_supported())
+            self.check_codec(OrjsonCodec())
+
+    @unittest.skipUnless(codecs.orjson, "orjson is not installed")
+    def test_orjson_codec(self):
+        self.check_codec(OrjsonCodec())
+
+    def test_inertia_encoder_uses_configured_codec(self):
+        self.assertIs(inertia_settings.INERTIA_JSON_ENCODER, CodecInertiaJsonEncoder)
+        with override_settings(ADMIN_PANEL_JSON_CODEC="apps.admin_panel.serialization.codecs.OrjsonCodec"):
+            self.assertIsInstance(get_json_codec(), OrjsonCodec)
+            with mock.patch.object(OrjsonCodec, "dumps", return_value="{}") as dumps:
+                self.assertEqual(json.dumps(PAGE, cls=CodecInertiaJsonEncoder), "{}")
+            dumps.assert_called_once()
+        self.assertIsInstance(get_json_codec(), StdlibCodec)
+        with self.assertRaises(TypeError):
+            JSONCodec()
+
+
+class RequestBodyTests(TestCase):
+    def post(self, body, **extra):
+        return RequestFactory().post("/", body, content_type="application/json", **extra)
+
+    def test_json_and_form_bodies(self):
+        self.assertEqual(get_request_data(self.post('{"a": [1, 2]}')), {"a": [1, 2]})
+        self.assertEqual(get_request_data(self.post("[1, 2]")), {})
+        self.assertEqual(get_request_data(self.post("{broken")), {})
+        request = RequestFactory().post("/", {"a": "1", "b": ["2", "3"]})
+        self.assertEqual(get_request_data(request), {"a": "1", "b": ["2", "3"]})
+
+    @override_settings(ADMIN_PANEL_JSON_MAX_BODY_SIZE=16)
+    def test_oversized_json_is_rejected_before_parsing(self):
+        with mock.patch.object(get_json_codec(), "loads") as loads:
+            with self.assertRaises(RequestDataTooBig):
+                get_request_data(self.post('{"name": "' + "x" * 32 + '"}'))
+        loads.assert_not_called()
+
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.post("/admin/groups/create/", {"name": "x" * 32}, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_inertia_page_round_trip(self):
+        staff = User.objects.create_user(username="zoë", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get("/admin/", headers={"X-Inertia": "true"})
+        self.assertEqual(response.json()["props"]["auth"]["user"]["username"], "zoë")
@@ -0,0 +1,109 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.admin_panel.dto.auth import LoginInputDTO
+from apps.admin_panel.services.auth import login_service
+from apps.admin_panel.services.login_throttle import throttle_login_attempt
+from apps.admin_panel.throttling.backends import (
+    CacheTokenBucketBackend,
+    LocalTokenBucketBackend,
+    LoginThrottleBackend,
+    get_login_throttle_backend,
+)
+
+User = get_user_model()
+
+RATES = {"username": (2, 60), "ip": (3, 60)}
+
+
+class TokenBucketBackendTests(SimpleTestCase):
+    def check_backend(self, backend):
+        buckets = [("a", 2, 1.0), ("b", 3, 1.0)]
+        self.assertEqual(backend.consume(buckets), 0)
+        self.assertEqual(backend.consume(buckets), 0)
+        self.assertGreater(backend.consume(buckets), 0)
+        # The rejected attempt took nothing from "b", which still has a token.
+        self.assertEqual(backend.consume([("b", 3, 1.0)]), 0)
+        backend.reset(["a"])
+        self.assertEqual(backend.consume([("a", 2, 1.0)]), 0)
+
+    def test_local_backend(self):
+        self.check_backend(LocalTokenBucketBackend())
+
+    def test_cache_backend(self):
+        backend = CacheTokenBucketBackend()
+        backend._cache().clear()
+        self.check_backend(backend)
+
+    def test_tokens_refill_over_time(self):
+        backend = LocalTokenBucketBackend()
+        with mock.patch("apps.admin_panel.throttling.backends.time.monotonic", return_value=100.0):
+            backend.consume([("a", 1, 0.5)])
+            self.assertEqual(backend.consume([("a", 1, 0.5)]), 2.0)
+        with mock.patch("apps.admin_panel.throttling.backends.time.monotonic", return_value=102.0):
+            self.assertEqual(backend.consume([("a", 1, 0.5)]), 0)
+
+    def test_local_backend_is_bounded(self):
+        backend = LocalTokenBucketBackend(max_entries=2)
+        for key in "abc":
+            backend.consume([(key, 1, 1.0)])
+        self.assertEqual(list(backend._buckets), ["b", "c"])
+
+    def test_configured_backend_follows_settings(self):
+        cache_backend = "apps.admin_panel.throttling.backends.CacheTokenBucketBackend"
+        with override_settings(ADMIN_PANEL_LOGIN_THROTTLE_BACKEND=cache_backend):
+            self.assertIsInstance(get_login_throttle_backend(), CacheTokenBucketBackend)
+        self.assertIsInstance(get_login_throttle_backend(), LocalTokenBucketBackend)
+        with self.assertRaises(TypeError):
+            LoginThrottleBackend()
+
+
+@override_settings(ADMIN_PANEL_LOGIN_THROTTLE_RATES=RATES)
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        get_login_throttle_backend().clear()
+        self.addCleanup(get_login_throttle_backend().clear)
+        User.objects.create_user(username="staff", password="pw", is_staff=True)
+
+    def login(self, username, password, ip="10.0.0.1"):
+        request = RequestFactory().post("/admin/login/", REMOTE_ADDR=ip)
+        request.session = SessionStore()
+        return login_service(LoginInputDTO(username, password, None), request)
+
+    def test_over_budget_attempts_skip_authenticate(self):
+        self.login("staff", "wrong")
+        self.login("STAFF", "wrong")
+        with mock.patch("apps.admin_panel.services.auth.authenticate") as authenticate:
+            result = self.login("staff", "pw")
+        authenticate.assert_not_called()
+        self.assertIn("Too many login attempts", result.errors["non_field_errors"][0])
+
+        # Another address still has its own budget for other usernames.
+        self.assertIn("correct username", self.login("other", "x", ip="10.0.0.2").errors["non_field_errors"][0])
+
+    def test_ip_budget_spans_usernames(self):
+        for name in ("a", "b", "c"):
+            self.login(name, "x")
+        self.assertIn("Too many login attempts", self.login("staff", "pw").errors["non_field_errors"][0])
+
+    def test_success_restores_the_username_budget(self):
+        self.login("staff", "wrong")
+        self.assertTrue(self.login("staff", "pw").success)
+        request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.9")
+        self.assertEqual(throttle_login_attempt(request, "staff"), 0)
+        self.assertEqual(throttle_login_attempt(request, "staff"), 0)
+
+    def test_login_view_renders_form_error(self):
+        for _ in range(2):
+            self.client.post("/admin/login/", {"username": "staff", "password": "wrong"})
+        response = self.client.post(
+            "/admin/login/",
+            {"username": "staff", "password": "pw"},
+            headers={"X-Inertia": "true"},
+        )
+        props = response.json()["props"]
+        self.assertIn("Too many login attempts", props["errors"]["non_field_errors"][0])
+        self.assertEqual(props["form"]["username"], "staff")
@@ -0,0 +1,73 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+User = get_user_model()
+
+
+class PartialReloadTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", is_staff=True, is_superuser=True)
+        self.member = User.objects.create_user(username="member")
+        self.group = Group.objects.create(name="Editors")
+        self.client.force_login(self.staff)
+
+    def get_props(self, path, component=None, only=()):
+        headers = {"X-Inertia": "true"}
+        if component:
+            headers.update({"X-Inertia-Partial-Component": component, "X-Inertia-Partial-Data": ",".join(only)})
+        return self.client.get(path, headers=headers).json()["props"]
+
+    def test_user_edit_loads_only_requested_props(self):
+        path = f"/admin/users/{self.member.pk}/edit/"
+        props = self.get_props(path)
+        self.assertEqual(props["user"]["username"], "member")
+        self.assertEqual(props["form"]["username"], "member")
+        self.assertIn("groups_choices", props)
+
+        with (
+            mock.patch("apps.admin_panel.api.user_views.get_user_detail_dto") as detail,
+            mock.patch("apps.admin_panel.api.user_views.get_groups_choices") as choices,
+        ):
+            props = self.get_props(path, "Admin/Users/Edit", ["errors"])
+        detail.assert_not_called()
+        choices.assert_not_called()
+        self.assertEqual(set(props) - {"auth", "csrf_token"}, {"errors"})
+
+    def test_user_edit_still_redirects_for_missing_user(self):
+        response = self.client.get("/admin/users/999/edit/", headers={"X-Inertia": "true"})
+        self.assertRedirects(response, "/admin/users/", fetch_redirect_response=False)
+
+    def test_group_members_reload_skips_group_and_permissions(self):
+        path = f"/admin/groups/{self.group.pk}/edit/"
+        with (
+            mock.patch("apps.admin_panel.api.group_views.get_group_detail_dto") as detail,
+            mock.patch("apps.admin_panel.api.group_views.get_all_permissions_choices") as choices,
+        ):
+            props = self.get_props(path, "Admin/Groups/Edit", ["members"])
+        detail.assert_not_called()
+        choices.assert_not_called()
+        self.assertEqual(props["members"]["items"], [])
+
+        props = self.get_props(path)
+        self.assertEqual(props["group"]["name"], "Editors")
+        self.assertEqual(props["form"], {"name": "Editors", "permission_ids": []})
+
+    def test_async_views_skip_unrequested_props(self):
+        dashboard_stats = "apps.admin_panel.api.admin_views.aget_dashboard_stats"
+        with mock.patch(dashboard_stats, new_callable=mock.AsyncMock) as stats:
+            props = self.get_props("/admin/", "Admin/Dashboard", ["errors"])
+        stats.assert_not_called()
+        self.assertNotIn("stats", props)
+
+        with mock.patch("apps.admin_panel.api.user_views.get_groups_choices") as choices:
+            props = self.get_props("/admin/users/", "Admin/Users/Index", ["users", "pagination"])
+        choices.assert_not_called()
+        self.assertEqual([u["username"] for u in props["users"]], ["member", "staff"])
+        self.assertNotIn("groups_choices", props)
+
+        props = self.get_props("/admin/users/")
+        self.assertEqual(props["groups_choices"][0]["name"], "Editors")
+        self.assertIn("user_count", self.get_props("/admin/")["stats"])
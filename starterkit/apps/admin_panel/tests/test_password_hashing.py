@@ -0,0 +1,134 @@
+import dataclasses
+import threading
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from apps.admin_panel.dto.auth import LoginInputDTO
+from apps.admin_panel.dto.users import UserFormInputDTO
+from apps.admin_panel.services import password_hashing
+from apps.admin_panel.services.auth import BUSY_LOGIN_ERROR, alogin_service
+from apps.admin_panel.services.password_hashing import HashingExecutor, HashQueueFull
+from apps.admin_panel.services.users import acreate_user_service, aupdate_user_service
+
+User = get_user_model()
+
+
+class HashingExecutorTests(SimpleTestCase):
+    def test_queue_is_bounded_and_measured(self):
+        executor = HashingExecutor(workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            running = executor.submit(release.wait)
+            queued = executor.submit(lambda: "done")
+            with self.assertRaises(HashQueueFull):
+                executor.submit(lambda: "rejected")
+            metrics = executor.metrics()
+            self.assertEqual((metrics.running, metrics.queued, metrics.rejected), (1, 1, 1))
+            release.set()
+            self.assertEqual(queued.result(timeout=5), "done")
+            running.result(timeout=5)
+        finally:
+            release.set()
+            executor.shutdown()
+        metrics = executor.metrics()
+        self.assertEqual((metrics.running, metrics.queued, metrics.completed, metrics.peak_queued), (0, 0, 2, 1))
+
+    async def test_run_awaits_result(self):
+        executor = HashingExecutor(workers=2)
+        try:
+            self.assertEqual(await executor.run(sum, [1, 2, 3]), 6)
+        finally:
+            executor.shutdown()
+
+
+class AsyncAuthServiceTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pw-staff", is_staff=True)
+        self.request = RequestFactory().post("/admin/login/")
+        self.request.session = SessionStore()
+        self.request.user = self.staff
+
+    async def test_alogin_service(self):
+        result = await alogin_service(LoginInputDTO("staff", "pw-staff", None), self.request)
+        self.assertTrue(result.success)
+        self.assertEqual(result.user_id, self.staff.pk)
+        self.assertEqual(self.request.session["_auth_user_id"], str(self.staff.pk))
+
+        result = await alogin_service(LoginInputDTO("staff", "wrong", None), self.request)
+        self.assertFalse(result.success)
+        result = await alogin_service(LoginInputDTO("nobody", "wrong", None), self.request)
+        self.assertIn("non_field_errors", result.errors)
+
+    @contextmanager
+    def full_hashing_queue(self):
+        saved = password_hashing._hashing_executor
+        password_hashing._hashing_executor = HashingExecutor(workers=1, max_queue=0)
+        release = threading.Event()
+        try:
+            password_hashing._hashing_executor.submit(release.wait)
+            yield
+        finally:
+            release.set()
+            password_hashing._hashing_executor.shutdown()
+            password_hashing._hashing_executor = saved
+
+    async def test_alogin_service_when_queue_is_full(self):
+        with self.full_hashing_queue():
+            result = await alogin_service(LoginInputDTO("staff", "pw-staff", None), self.request)
+        self.assertEqual(result.errors, {"non_field_errors": [BUSY_LOGIN_ERROR]})
+
+    def test_views_hash_on_the_executor(self):
+        headers = {"X-Inertia": "true"}
+        with self.full_hashing_queue():
+            response = self.client.post(
+                "/admin/login/", {"username": "staff", "password": "pw-staff"}, headers=headers
+            )
+            self.assertEqual(response.json()["props"]["errors"], {"non_field_errors": [BUSY_LOGIN_ERROR]})
+
+            self.client.force_login(self.staff)
+            response = self.client.post(
+                "/admin/users/create/", {"username": "new", "password": "pw-new"}, headers=headers
+            )
+            self.assertIn("busy", response.json()["props"]["errors"]["non_field_errors"][0])
+            response = self.client.post(
+                f"/admin/users/{self.staff.pk}/edit/",
+                {"username": "staff", "password": "pw-changed", "is_staff": "on", "is_active": "on"},
+                headers=headers,
+            )
+            self.assertIn("busy", response.json()["props"]["errors"]["non_field_errors"][0])
+        self.assertFalse(User.objects.filter(username="new").exists())
+
+        self.client.post("/admin/users/create/", {"username": "new", "password": "pw-new"})
+        self.assertTrue(User.objects.get(username="new").check_password("pw-new"))
+
+    async def test_async_user_services_hash_off_thread(self):
+        dto = UserFormInputDTO(
+            username="new",
+            email="",
+            first_name="",
+            last_name="",
+            is_staff=False,
+            is_superuser=False,
+            is_active=True,
+            group_ids=[],
+            password="pw-new",
+        )
+        result = await acreate_user_service(dto, self.request)
+        self.assertTrue(result.success)
+        user = await User.objects.aget(pk=result.user_id)
+        self.assertTrue(check_password("pw-new", user.password))
+
+        dto = dataclasses.replace(dto, password="pw-changed")
+        result = await aupdate_user_service(user.pk, dto, self.request)
+        self.assertTrue(result.success)
+        user = await User.objects.aget(pk=user.pk)
+        self.assertTrue(check_password("pw-changed", user.password))
+
+    def test_metrics_endpoint(self):
+        self.client.force_login(self.staff)
+        metrics = self.client.get("/admin/api/metrics/hashing/").json()
+        self.assertEqual(set(metrics), {"workers", "max_queue", "running", "queued", "peak_queued", "completed", "rejected"})
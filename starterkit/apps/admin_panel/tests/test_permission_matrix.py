@@ -0,0 +1,101 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from apps.admin_panel.dto.groups import PermissionMatrixCellDTO
+from apps.admin_panel.models import GroupCounter
+from apps.admin_panel.selectors.groups import get_permission_matrix
+from apps.admin_panel.services.group_counters import reconcile_group_counters
+from apps.admin_panel.services.groups import apply_permission_matrix_service
+
+User = get_user_model()
+
+
+class PermissionMatrixTests(TestCase):
+    def setUp(self):
+        # The matrix reads the cached permission choices; leave no entries behind.
+        self.addCleanup(cache.clear)
+        self.staff = User.objects.create_user(username="staff", is_staff=True)
+        self.request = RequestFactory().post("/")
+        self.request.user = self.staff
+        self.editors = Group.objects.create(name="Editors")
+        self.viewers = Group.objects.create(name="Viewers")
+        self.auth_perms = list(Permission.objects.filter(content_type__app_label="auth").order_by("pk")[:3])
+        self.editors.permissions.add(self.auth_perms[0], self.auth_perms[1])
+
+    def cell(self, group, perm, granted):
+        return PermissionMatrixCellDTO(group_id=group.pk, permission_id=perm.pk, granted=granted)
+
+    def test_selector_filters_by_app_label(self):
+        other = Permission.objects.exclude(content_type__app_label="auth").first()
+        self.viewers.permissions.add(other)
+        matrix = get_permission_matrix(app_label="auth")
+        self.assertIn("auth", matrix.app_labels)
+        self.assertTrue(all(p["codename"].startswith("auth.") for p in matrix.permissions))
+        self.assertEqual(
+            set(matrix.grants),
+            {(self.editors.pk, self.auth_perms[0].pk), (self.editors.pk, self.auth_perms[1].pk)},
+        )
+        self.assertEqual([g["name"] for g in matrix.groups], ["Editors", "Viewers"])
+
+    def test_batch_is_applied_with_bulk_writes(self):
+        p0, p1, p2 = self.auth_perms
+        cells = [
+            self.cell(self.editors, p0, True),  # already granted: no-op
+            self.cell(self.editors, p1, False),
+            self.cell(self.viewers, p1, True),
+            self.cell(self.viewers, p2, True),
+            self.cell(self.viewers, p2, False),  # last one wins
+        ]
+        with self.assertNumQueries(10):
+            # 2 existence checks, 1 counter lock, 1 read, 1 INSERT, 1 DELETE, 1 counter UPDATE per
+            # distinct delta (+1, -1), savepoint + release
+            result = apply_permission_matrix_service(cells, self.request)
+        self.assertTrue(result.success)
+        self.assertEqual((result.granted, result.revoked), (1, 1))
+        self.assertEqual(set(self.editors.permissions.all()), {p0})
+        self.assertEqual(set(self.viewers.permissions.all()), {p1})
+        self.assertEqual(GroupCounter.objects.get(group=self.editors).permission_count, 1)
+        self.assertEqual(reconcile_group_counters(), 0)
+
+    def test_unknown_ids_and_permission(self):
+        result = apply_permission_matrix_service(
+            [PermissionMatrixCellDTO(group_id=999, permission_id=self.auth_perms[0].pk, granted=True)],
+            self.request,
+        )
+        self.assertIn("changes", result.errors)
+
+        self.request.user = User.objects.create_user(username="plain")
+        result = apply_permission_matrix_service([], self.request)
+        self.assertEqual(result.errors, {"non_field_errors": ["Permission denied."]})
+
+    def test_matrix_view(self):
+        self.client.force_login(self.staff)
+        props = self.client.get("/admin/groups/permissions/?app_label=auth", headers={"X-Inertia": "true"}).json()["props"]
+        self.assertEqual(props["filters"], {"app_label": "auth"})
+        self.assertIn([self.editors.pk, self.auth_perms[0].pk], props["grants"])
+
+        response = self.client.post(
+            "/admin/groups/permissions/",
+            {
+                "app_label": "auth",
+                "changes": [{"group_id": self.viewers.pk, "permission_id": self.auth_perms[2].pk, "granted": True}],
+            },
+            content_type="application/json",
+        )
+        self.assertRedirects(response, "/admin/groups/permissions/?app_label=auth", fetch_redirect_response=False)
+        self.assertTrue(self.viewers.permissions.filter(pk=self.auth_perms[2].pk).exists())
+
+        # Malformed cells are skipped rather than failing the request.
+        changes = [
+            {"group_id": "\u00b2", "permission_id": self.auth_perms[1].pk, "granted": True},
+            {"group_id": True, "permission_id": self.auth_perms[2].pk, "granted": True},
+            {"group_id": str(self.viewers.pk), "permission_id": "1.5", "granted": True},
+        ]
+        response = self.client.post(
+            "/admin/groups/permissions/", {"app_label": "auth", "changes": changes}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(self.viewers.permissions.filter(pk=self.auth_perms[1].pk).exists())
+        self.assertFalse(self.editors.permissions.filter(pk=self.auth_perms[2].pk).exists())
@@ -0,0 +1,70 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from apps.admin_panel.search.backends import (
+    USER_SEARCH_TABLE,
+    IContainsSearchBackend,
+    SQLiteFTS5SearchBackend,
+    UserSearchBackend,
+    get_user_search_backend,
+)
+from apps.admin_panel.selectors.users import get_users_queryset
+
+User = get_user_model()
+
+
+def _indexed_ids():
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT rowid FROM {USER_SEARCH_TABLE} ORDER BY rowid")
+        return [row[0] for row in cursor.fetchall()]
+
+
+class UserSearchIndexTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", email="alice@example.com")
+        self.bob = User.objects.create_user(username="bob", email="bob@example.com")
+        self.charlie = User.objects.create_user(username="charlie", email="charlie@test.com")
+
+    def _search(self, term, order_by="username"):
+        return list(get_users_queryset(search=term, order_by=order_by).values_list("username", flat=True))
+
+    def test_search_matches_substrings_case_insensitively(self):
+        self.assertEqual(self._search("LIC"), ["alice"])
+        self.assertEqual(self._search("example.com"), ["alice", "bob"])
+        self.assertEqual(self._search("example.com", order_by="-username"), ["bob", "alice"])
+
+    def test_short_terms_fall_back_to_icontains(self):
+        self.assertEqual(self._search("ar"), ["charlie"])
+
+    def test_quotes_in_term_are_literal(self):
+        self.assertEqual(self._search('"bob'), [])
+
+    def test_configured_backend_follows_settings(self):
+        icontains = "apps.admin_panel.search.backends.IContainsSearchBackend"
+        with override_settings(ADMIN_PANEL_USER_SEARCH_BACKEND=icontains):
+            self.assertIs(type(get_user_search_backend()), IContainsSearchBackend)
+            self.assertEqual(self._search("LIC"), ["alice"])
+        self.assertIsInstance(get_user_search_backend(), SQLiteFTS5SearchBackend)
+        with self.assertRaises(TypeError):
+            UserSearchBackend()
+
+    def test_index_follows_save_and_delete(self):
+        self.bob.username = "robert"
+        self.bob.save()
+        self.assertEqual(self._search("robert"), ["robert"])
+        self.bob.delete()
+        self.assertEqual(self._search("robert"), [])
+        self.assertEqual(_indexed_ids(), [self.alice.id, self.charlie.id])
+
+    def test_rebuild_command_restores_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {USER_SEARCH_TABLE}")
+        self.assertEqual(self._search("alice"), [])
+        out = StringIO()
+        call_command("rebuild_user_search_index", stdout=out)
+        self.assertIn("Indexed 3 users", out.getvalue())
+        self.assertEqual(self._search("alice"), ["alice"])
@@ -1,9 +1,28 @@
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
-from django.test import TestCase
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
 
-from apps.admin_panel.selectors.groups import get_group_detail_dto, get_group_list_page, get_groups_queryset
-from apps.admin_panel.selectors.users import get_user_detail_dto, get_user_list_page, get_users_queryset
+from apps.admin_panel.selectors.auth import get_dashboard_stats
+from apps.admin_panel.selectors.groups import (
+    get_all_permissions_choices,
+    get_group_detail_dto,
+    get_group_detail_dtos,
+    get_group_list_page,
+    get_group_members_page,
+    get_group_page,
+    get_groups_choices,
+    get_groups_queryset,
+)
+from apps.admin_panel.selectors.users import (
+    get_user_detail_dto,
+    get_user_detail_dtos,
+    get_user_list_page,
+    get_user_page,
+    get_users_queryset,
+)
+from apps.admin_panel.selectors.loaders import get_user_detail_loader
+from apps.admin_panel.selectors.pagination import TOTAL_ESTIMATE, TOTAL_NONE
 
 User = get_user_model()
 
@@ -24,6 +43,55 @@ class UserSelectorsTests(TestCase):
         self.assertEqual(len(items), 2)
         self.assertEqual(total, 3)
 
+    def test_get_user_page_cursor_walks_forward_and_back(self):
+        first = get_user_page(page_size=2)
+        self.assertEqual([u.username for u in first.items], ["alice", "bob"])
+        self.assertTrue(first.has_next)
+        self.assertFalse(first.has_prev)
+
+        second = get_user_page(cursor=first.next_cursor, page_size=2)
+        self.assertEqual([u.username for u in second.items], ["charlie"])
+        self.assertFalse(second.has_next)
+        self.assertTrue(second.has_prev)
+
+        back = get_user_page(cursor=second.prev_cursor, page_size=2)
+        self.assertEqual([u.username for u in back.items], ["alice", "bob"])
+
+    def test_get_user_page_cursor_breaks_ties_on_id(self):
+        seen = []
+        result = get_user_page(order_by="-is_staff", page_size=1)
+        seen.extend(u.username for u in result.items)
+        while result.has_next:
+            result = get_user_page(order_by="-is_staff", cursor=result.next_cursor, page_size=1)
+            seen.extend(u.username for u in result.items)
+        self.assertEqual(seen[0], "alice")
+        self.assertCountEqual(seen, ["alice", "bob", "charlie"])
+
+    def test_get_user_page_ignores_cursor_for_other_ordering(self):
+        first = get_user_page(page_size=2)
+        result = get_user_page(order_by="-username", cursor=first.next_cursor, page_size=2)
+        self.assertEqual([u.username for u in result.items], ["charlie", "bob"])
+
+    def test_get_user_page_without_count_uses_extra_row(self):
+        first = get_user_page(page_size=2, total_mode=TOTAL_NONE)
+        self.assertIsNone(first.total)
+        self.assertTrue(first.has_next)
+        last = get_user_page(page=2, page_size=2, total_mode=TOTAL_NONE)
+        self.assertFalse(last.has_next)
+        self.assertEqual(last.total, 3)
+
+    def test_get_user_page_estimate_serves_cached_count(self):
+        cache.clear()
+        fresh = get_user_page(search="example", page_size=1, total_mode=TOTAL_ESTIMATE)
+        self.assertEqual(fresh.total, 2)
+        self.assertFalse(fresh.total_is_estimate)
+        User.objects.create_user(username="dave", email="dave@example.com")
+        cached = get_user_page(search="example", page_size=1, total_mode=TOTAL_ESTIMATE)
+        self.assertEqual(cached.total, 2)
+        self.assertTrue(cached.total_is_estimate)
+        other = get_user_page(search="test", page_size=1, total_mode=TOTAL_ESTIMATE)
+        self.assertEqual(other.total, 1)
+
     def test_get_user_detail_dto(self):
         user = User.objects.first()
         dto = get_user_detail_dto(user.id)
@@ -48,8 +116,94 @@ class GroupSelectorsTests(TestCase):
         self.assertEqual(len(items), 2)
         self.assertEqual(total, 3)
 
+    def test_get_group_page_cursor_on_annotated_count(self):
+        first = get_group_page(order_by="-user_count", page_size=2)
+        second = get_group_page(order_by="-user_count", cursor=first.next_cursor, page_size=2)
+        names = [g.name for g in first.items + second.items]
+        self.assertCountEqual(names, ["Admins", "Editors", "Viewers"])
+        self.assertEqual(second.total, 3)
+
     def test_get_group_detail_dto(self):
         group = Group.objects.first()
         dto = get_group_detail_dto(group.id)
         self.assertIsNotNone(dto)
         self.assertEqual(dto.name, group.name)
+
+
+class SelectorQueryCountTests(TestCase):
+    """The documented query count of each selector must not grow with the data."""
+
+    def setUp(self):
+        perms = list(Permission.objects.all()[:5])
+        users = [User.objects.create_user(username=f"user{i}", email=f"user{i}@example.com") for i in range(5)]
+        self.groups = []
+        for i in range(3):
+            group = Group.objects.create(name=f"Group {i}")
+            group.permissions.set(perms)
+            group.user_set.set(users)
+            self.groups.append(group)
+        self.user = users[0]
+
+    def test_list_selectors(self):
+        with self.assertNumQueries(2):
+            get_user_list_page(page_size=3)
+        with self.assertNumQueries(2):
+            get_user_page(page_size=3)
+        with self.assertNumQueries(1):
+            get_user_page(page_size=3, total_mode=TOTAL_NONE)
+        with self.assertNumQueries(2):
+            get_group_list_page(page_size=2)
+        with self.assertNumQueries(2):
+            get_group_page(page_size=2)
+
+    def test_detail_selectors(self):
+        with self.assertNumQueries(1):
+            dto = get_user_detail_dto(self.user.id)
+        self.assertEqual(dto.group_names, ["Group 0", "Group 1", "Group 2"])
+        with self.assertNumQueries(1):
+            dto = get_group_detail_dto(self.groups[0].id)
+        self.assertEqual(len(dto.permission_codenames), 5)
+        self.assertEqual(dto.user_count, 5)
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_group_detail_dto(0))
+
+    def test_choices_and_stats(self):
+        with self.assertNumQueries(1):
+            get_groups_choices()
+        with self.assertNumQueries(1):
+            choices = get_all_permissions_choices()
+        self.assertEqual(len(choices), Permission.objects.count())
+        with self.assertNumQueries(2):  # rollup row, signup series
+            get_dashboard_stats()
+
+    def test_batched_detail_selectors(self):
+        user_ids = [u.id for u in User.objects.all()]
+        with self.assertNumQueries(1):
+            users = get_user_detail_dtos(user_ids + [0])
+        self.assertEqual(set(users), set(user_ids))
+        self.assertEqual(users[self.user.id].group_ids, [g.id for g in self.groups])
+        with self.assertNumQueries(1):
+            groups = get_group_detail_dtos([g.id for g in self.groups])
+        self.assertTrue(all(dto.user_count == 5 for dto in groups.values()))
+
+    def test_group_members_page(self):
+        group = self.groups[0]
+        with self.assertNumQueries(1):
+            first = get_group_members_page(group.id, page_size=3, total_mode=TOTAL_NONE)
+        self.assertEqual([m.username for m in first.items], ["user0", "user1", "user2"])
+        rest = get_group_members_page(group.id, cursor=first.next_cursor, page_size=3)
+        self.assertEqual([m.username for m in rest.items], ["user3", "user4"])
+        self.assertFalse(rest.has_next)
+        found = get_group_members_page(group.id, search="user3@example")
+        self.assertEqual([m.username for m in found.items], ["user3"])
+
+    def test_request_loader_deduplicates(self):
+        request = RequestFactory().get("/")
+        loader = get_user_detail_loader(request)
+        with self.assertNumQueries(1):
+            first = loader.load_many([self.user.id, self.user.id, 0])
+        self.assertEqual(first[0], first[1])
+        self.assertIsNone(first[2])
+        with self.assertNumQueries(0):
+            self.assertIs(get_user_detail_loader(request).load(self.user.id), first[0])
+            self.assertIsNone(loader.load(0))
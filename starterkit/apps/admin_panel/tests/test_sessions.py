@@ -0,0 +1,65 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model, login
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.admin_panel.sessions.db import SessionStore
+
+User = get_user_model()
+
+
+class WriteAvoidingSessionTests(TestCase):
+    def setUp(self):
+        store = SessionStore()
+        store.update({"a": 1, "items": [1]})
+        store.save()
+        self.session = SessionStore(store.session_key)
+
+    def test_unchanged_scalar_is_not_a_modification(self):
+        self.session["a"] = 1
+        self.session.update({"a": 1})
+        self.assertFalse(self.session.modified)
+        self.session["a"] = True  # equal, but a different type
+        self.assertTrue(self.session.modified)
+
+    def test_containers_always_count_as_changed(self):
+        self.session["items"] = self.session["items"]
+        self.assertTrue(self.session.modified)
+
+    def test_repeated_login_does_not_write(self):
+        user = User.objects.create_user(username="staff", password="pw")
+        request = RequestFactory().get("/")
+        request.session = self.session
+        login(request, user, backend="django.contrib.auth.backends.ModelBackend")
+        request.session.save()
+        request.session = SessionStore(request.session.session_key)
+        login(request, user, backend="django.contrib.auth.backends.ModelBackend")
+        self.assertFalse(request.session.modified)
+
+
+class SessionEngineQueryTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+
+    def session_queries(self, engine):
+        with override_settings(SESSION_ENGINE=engine):
+            client = Client()  # SessionMiddleware binds the engine when it is loaded
+            client.force_login(self.staff)
+            client.get("/admin/")
+            with CaptureQueriesContext(connection) as ctx:
+                client.get("/admin/")
+        return [q["sql"] for q in ctx.captured_queries if "django_session" in q["sql"]]
+
+    def test_cached_and_cookie_sessions_skip_the_session_table(self):
+        self.assertEqual(len(self.session_queries("apps.admin_panel.sessions.db")), 1)
+        self.assertEqual(self.session_queries("apps.admin_panel.sessions.cached_db"), [])
+        self.assertEqual(self.session_queries("apps.admin_panel.sessions.signed_cookies"), [])
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_admin_sessions", rounds=1, stdout=out)
+        self.assertIn("signed_cookies", out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith="bench-").exists())
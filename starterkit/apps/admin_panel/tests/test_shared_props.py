@@ -0,0 +1,45 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.utils.functional import SimpleLazyObject
+
+from main.middleware import get_auth_props, inertia_shared_props
+
+User = get_user_model()
+
+
+class SharedPropsTests(TestCase):
+    def setUp(self):
+        self.loads = 0
+
+        def load_user():
+            self.loads += 1
+            return AnonymousUser()
+
+        self.request = RequestFactory().get("/")
+        self.request.user = SimpleLazyObject(load_user)
+
+    def test_props_are_not_resolved_without_an_inertia_page(self):
+        response = inertia_shared_props(lambda request: HttpResponse())(self.request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.loads, 0)
+        self.assertNotIn("CSRF_COOKIE", self.request.META)
+
+    def test_auth_props_are_built_once_per_user(self):
+        inertia_shared_props(lambda request: HttpResponse())(self.request)
+        shared = self.request.inertia.all()
+        self.assertEqual(shared["auth"](), {"user": None})
+        self.assertIs(shared["auth"](), get_auth_props(self.request))
+        self.assertEqual(self.loads, 1)
+
+        self.request.user = User.objects.create_user(username="alice")
+        self.assertEqual(get_auth_props(self.request)["user"]["username"], "alice")
+
+    def test_views_reuse_shared_auth_prop(self):
+        staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get("/admin/", headers={"X-Inertia": "true"})
+        props = response.json()["props"]
+        self.assertEqual(props["auth"]["user"]["username"], "staff")
+        self.assertIn("csrf_token", props)
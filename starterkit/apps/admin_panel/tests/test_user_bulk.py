@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import RequestFactory, TestCase
+
+from apps.admin_panel.dto.users import UserBulkActionInputDTO
+from apps.admin_panel.models import DailySignupCount, DashboardStats, GroupCounter
+from apps.admin_panel.selectors.users import get_user_page
+from apps.admin_panel.services.dashboard_stats import rebuild_dashboard_stats
+from apps.admin_panel.services.group_counters import reconcile_group_counters
+from apps.admin_panel.services.user_bulk import bulk_user_action_service
+
+User = get_user_model()
+
+
+class UserBulkActionTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="admin", is_staff=True)
+        self.group = Group.objects.create(name="Editors")
+        self.users = [User.objects.create_user(username=f"member{i}", email=f"m{i}@example.com") for i in range(5)]
+        self.other = User.objects.create_user(username="outsider", email="o@example.com")
+        self.users[0].groups.add(self.group)
+        self.request = RequestFactory().post("/")
+        self.request.user = self.admin
+
+    def run_action(self, action, user_ids=(), select_all=False, search=None, group_id=None, chunk_size=2):
+        dto = UserBulkActionInputDTO(
+            action=action,
+            user_ids=list(user_ids),
+            select_all=select_all,
+            search=search,
+            group_id=group_id,
+        )
+        return bulk_user_action_service(dto, self.request, chunk_size=chunk_size)
+
+    def snapshot_stats(self):
+        return (
+            DashboardStats.objects.values().get(),
+            dict(DailySignupCount.objects.values_list("day", "count")),
+        )
+
+    def assert_derived_in_step(self):
+        stats = self.snapshot_stats()
+        rebuild_dashboard_stats()
+        self.assertEqual(stats, self.snapshot_stats())
+        self.assertEqual(reconcile_group_counters(), 0)
+
+    def test_flag_actions_count_only_changed_rows(self):
+        ids = [u.pk for u in self.users]
+        self.users[0].is_staff = True
+        self.users[0].save()
+        result = self.run_action("make_staff", ids)
+        self.assertTrue(result.success)
+        self.assertEqual(result.affected, 4)
+        self.assertEqual(User.objects.filter(pk__in=ids, is_staff=True).count(), 5)
+        self.assertEqual(DashboardStats.objects.get().staff_user_count, 6)
+
+        result = self.run_action("deactivate", ids[:3])
+        self.assertEqual(result.affected, 3)
+        self.assertEqual(DashboardStats.objects.get().active_user_count, User.objects.count() - 3)
+        self.assert_derived_in_step()
+
+    def test_select_all_applies_to_every_search_match(self):
+        result = self.run_action("deactivate", select_all=True, search="member")
+        self.assertEqual(result.affected, 5)
+        self.assertTrue(User.objects.get(username="outsider").is_active)
+
+    def test_acting_user_is_never_deactivated_or_deleted(self):
+        result = self.run_action("delete", select_all=True)
+        self.assertEqual(result.affected, 6)
+        self.assertEqual(list(User.objects.values_list("username", flat=True)), ["admin"])
+
+    def test_delete_keeps_counters_search_index_and_stats_in_step(self):
+        ids = [u.pk for u in self.users[:3]]
+        result = self.run_action("delete", ids)
+        self.assertEqual(result.affected, 3)
+        self.assertFalse(User.objects.filter(pk__in=ids).exists())
+        self.assertEqual(GroupCounter.objects.get(group=self.group).user_count, 0)
+        self.assertEqual(get_user_page(search="m0@exa").items, [])
+        self.assertEqual(DashboardStats.objects.get().user_count, 4)
+        self.assert_derived_in_step()
+
+    def test_group_membership_actions(self):
+        ids = [u.pk for u in self.users]
+        result = self.run_action("add_to_group", ids, group_id=self.group.pk)
+        self.assertEqual(result.affected, 4)
+        self.assertEqual(self.group.user_set.count(), 5)
+        self.assertEqual(GroupCounter.objects.get(group=self.group).user_count, 5)
+
+        result = self.run_action("remove_from_group", ids[:2], group_id=self.group.pk)
+        self.assertEqual(result.affected, 2)
+        self.assertEqual(GroupCounter.objects.get(group=self.group).user_count, 3)
+        self.assert_derived_in_step()
+
+    def test_validation_and_permission_errors(self):
+        self.assertEqual(set(self.run_action("explode").errors), {"action", "user_ids"})
+        self.assertIn("group_id", self.run_action("add_to_group", [self.other.pk], group_id=999).errors)
+
+        self.request.user = self.other
+        result = self.run_action("activate", [self.other.pk])
+        self.assertEqual(result.errors, {"non_field_errors": ["Permission denied."]})
+
+    def test_admin_view_redirects_with_filters(self):
+        self.client.force_login(self.admin)
+        response = self.client.post(
+            "/admin/users/bulk/",
+            {
+                "action": "deactivate",
+                "user_ids": [u.pk for u in self.users[:2]],
+                "search": "member",
+                "order_by": "-email",
+            },
+            content_type="application/json",
+        )
+        self.assertRedirects(response, "/admin/users/?search=member&order_by=-email", fetch_redirect_response=False)
+        self.assertEqual(User.objects.filter(is_active=False).count(), 2)
+
+        response = self.client.post(
+            "/admin/users/bulk/",
+            {"action": "add_to_group", "user_ids": [self.other.pk]},
+            content_type="application/json",
+            headers={"X-Inertia": "true"},
+        )
+        self.assertIn("group_id", response.json()["props"]["errors"])
+
+    def test_admin_view_rejects_non_ascii_digits(self):
+        self.client.force_login(self.admin)
+        response = self.client.post(
+            "/admin/users/bulk/",
+            {"action": "add_to_group", "user_ids": ["\u00b2", self.other.pk], "group_id": "\u00b2"},
+            content_type="application/json",
+            headers={"X-Inertia": "true"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("group_id", response.json()["props"]["errors"])
+
+        response = self.client.post(
+            "/admin/users/bulk/", {"action": "deactivate", "user_ids": ["\u00b2"]}, headers={"X-Inertia": "true"}
+        )
+        self.assertIn("user_ids", response.json()["props"]["errors"])
+        self.assertFalse(User.objects.filter(is_active=False).exists())
@@ -0,0 +1,138 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import TestCase
+
+from apps.admin_panel.models import DashboardStats, GroupCounter
+from apps.admin_panel.selectors.users import get_user_page
+from apps.admin_panel.services import user_import
+from apps.admin_panel.services.password_hashing import PasswordHasherPool, get_import_hasher_pool
+from apps.admin_panel.services.user_import import import_users, iter_import_rows
+
+User = get_user_model()
+
+CSV = """username,email,password,is_staff,groups
+alice,alice@example.com,secret,yes,Editors;Viewers
+bob,not-an-email,,no,
+carol,carol@example.com,,maybe,
+alice,dup@example.com,,,
+dave,dave@example.com,,,Missing
+erin,,,1,Editors
+"""
+
+
+class UserImportTests(TestCase):
+    def setUp(self):
+        self.editors = Group.objects.create(name="Editors")
+        self.viewers = Group.objects.create(name="Viewers")
+        User.objects.create_user(username="existing")
+
+    def run_import(self, text, fmt="csv", **kwargs):
+        return import_users(iter_import_rows(io.StringIO(text), fmt), workers=1, **kwargs)
+
+    def test_valid_rows_are_created_and_bad_rows_reported(self):
+        result = self.run_import(CSV, batch_size=2)
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.failed, 4)
+        self.assertEqual(
+            {e.line: sorted(e.errors) for e in result.row_errors},
+            {3: ["email"], 4: ["is_staff"], 5: ["username"], 6: ["groups"]},
+        )
+
+        alice = User.objects.get(username="alice")
+        self.assertTrue(alice.is_staff)
+        self.assertTrue(alice.check_password("secret"))
+        self.assertEqual(set(alice.groups.values_list("name", flat=True)), {"Editors", "Viewers"})
+        self.assertFalse(User.objects.get(username="erin").has_usable_password())
+
+    def test_overlong_email_is_a_row_error(self):
+        email = "x" * 250 + "@example.com"
+        result = self.run_import(f"username,email\nlong,{email}\nshort,short@example.com\n")
+        self.assertEqual((result.created, result.failed), (1, 1))
+        self.assertEqual({e.line: sorted(e.errors) for e in result.row_errors}, {2: ["email"]})
+        self.assertFalse(User.objects.filter(username="long").exists())
+
+    def test_derived_structures_are_kept_in_step(self):
+        self.run_import(CSV)
+        self.assertEqual(GroupCounter.objects.get(group=self.editors).user_count, 2)
+        self.assertEqual(GroupCounter.objects.get(group=self.viewers).user_count, 1)
+        stats = DashboardStats.objects.get()
+        self.assertEqual((stats.user_count, stats.staff_user_count), (User.objects.count(), 2))
+        self.assertEqual([u.username for u in get_user_page(search="alice@exa").items], ["alice"])
+
+    def test_jsonl_existing_usernames_and_password_hashes(self):
+        encoded = make_password("pw")
+        text = "\n".join([
+            '{"username": "existing"}',
+            "not json",
+            f'{{"username": "frank", "password_hash": "{encoded}", "groups": ["Viewers"]}}',
+            '{"username": "gina", "password_hash": "plaintext"}',
+        ])
+        result = self.run_import(text, fmt="jsonl")
+        self.assertEqual(result.created, 1)
+        self.assertEqual([(e.line, list(e.errors)) for e in result.row_errors], [
+            (1, ["username"]),
+            (2, ["row"]),
+            (4, ["password_hash"]),
+        ])
+        self.assertTrue(User.objects.get(username="frank").check_password("pw"))
+
+    def test_process_pool_hashing(self):
+        with PasswordHasherPool(workers=2) as pool:
+            hashes = pool.hash([f"pw{i}" for i in range(8)])
+        self.assertEqual(len(set(hashes)), 8)
+        self.assertTrue(all(h.startswith("pbkdf2_sha256$") for h in hashes))
+
+    def test_retry_after_conflict_reuses_hashes(self):
+        hasher = PasswordHasherPool(workers=1)
+        insert_batch = user_import._insert_batch
+
+        def conflict_once(batch, passwords):
+            if insert.call_count == 1:
+                raise IntegrityError
+            insert_batch(batch, passwords)
+
+        with (
+            mock.patch.object(hasher, "hash", wraps=hasher.hash) as hash_,
+            mock.patch.object(user_import, "_insert_batch", side_effect=conflict_once) as insert,
+        ):
+            result = import_users(iter_import_rows(io.StringIO("username,password\nzed,pw\n"), "csv"), hasher=hasher)
+        self.assertEqual(result.created, 1)
+        self.assertEqual(insert.call_count, 2)
+        hash_.assert_called_once_with(["pw"])
+        self.assertTrue(User.objects.get(username="zed").check_password("pw"))
+
+    def test_management_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "users.csv"
+            path.write_text(CSV)
+            out, err = io.StringIO(), io.StringIO()
+            call_command("import_users", str(path), workers=1, stdout=out, stderr=err)
+        self.assertIn("Imported 2 users (4 rejected)", out.getvalue())
+        self.assertIn("line 6: groups: Unknown group(s): Missing.", err.getvalue())
+
+    def test_admin_upload(self):
+        staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        upload = SimpleUploadedFile("users.csv", CSV.encode())
+        pool = get_import_hasher_pool()
+        with mock.patch.object(pool, "hash", wraps=pool.hash) as hash_:
+            response = self.client.post("/admin/users/import/", {"file": upload}, headers={"X-Inertia": "true"})
+        hash_.assert_called()
+        result = response.json()["props"]["result"]
+        self.assertEqual((result["created"], result["failed"]), (2, 4))
+
+        response = self.client.post(
+            "/admin/users/import/",
+            {"file": SimpleUploadedFile("users.txt", b"x")},
+            headers={"X-Inertia": "true"},
+        )
+        self.assertIn("file", response.json()["props"]["errors"])
@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
 from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 
 from apps.admin_panel.dto.users import UserFormInputDTO
 from apps.admin_panel.services.users import create_user_service, delete_user_service, update_user_service
@@ -82,3 +85,48 @@ class UserServicesTests(TestCase):
         result = delete_user_service(user.id, request)
         self.assertTrue(result.success)
         self.assertFalse(User.objects.filter(pk=user.id).exists())
+
+    def _form(self, user, **overrides):
+        values = {
+            "username": user.username,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_staff": user.is_staff,
+            "is_superuser": user.is_superuser,
+            "is_active": user.is_active,
+            "group_ids": list(user.groups.values_list("pk", flat=True)),
+            "password": None,
+        }
+        values.update(overrides)
+        return UserFormInputDTO(**values)
+
+    def test_update_user_writes_only_the_diff(self):
+        editors, viewers = Group.objects.create(name="Editors"), Group.objects.create(name="Viewers")
+        user = User.objects.create_user(username="diffed", email="d@example.com")
+        user.groups.add(editors)
+        request = self.factory.post("/admin/users/1/edit/")
+        request.user = self.staff
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(update_user_service(user.id, self._form(user), request).success)
+        writes = [q["sql"] for q in ctx.captured_queries if not q["sql"].startswith(("SELECT", "SAVEPOINT", "RELEASE"))]
+        self.assertEqual(writes, [])
+
+        with CaptureQueriesContext(connection) as ctx:
+            update_user_service(user.id, self._form(user, first_name="Dee", group_ids=[viewers.id]), request)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('UPDATE "auth_user"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET "first_name"', updates[0])
+        self.assertNotIn('"email"', updates[0])
+        self.assertEqual(list(user.groups.values_list("name", flat=True)), ["Viewers"])
+
+    def test_update_user_duplicate_username_comes_from_the_constraint(self):
+        User.objects.create_user(username="taken")
+        user = User.objects.create_user(username="renamed")
+        request = self.factory.post("/admin/users/1/edit/")
+        request.user = self.staff
+        result = update_user_service(user.id, self._form(user, username="taken"), request)
+        self.assertEqual(result.errors, {"username": ["A user with that username already exists."]})
+        user.refresh_from_db()
+        self.assertEqual(user.username, "renamed")
@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.admin_panel.assets.vite import get_asset_version, get_page_assets
+from apps.admin_panel.checks import check_vite_build
+
+User = get_user_model()
+
+MANIFEST = {
+    "app.js": {
+        "file": "assets/app-1a2b.js",
+        "isEntry": True,
+        "imports": ["_vendor-3c4d.js"],
+        "dynamicImports": ["Pages/Admin/Dashboard.vue", "Pages/Admin/Users/Index.vue"],
+        "css": ["assets/app-5e6f.css"],
+    },
+    "_vendor-3c4d.js": {"file": "assets/vendor-3c4d.js"},
+    "_chart-7a8b.js": {"file": "assets/chart-7a8b.js", "imports": ["_vendor-3c4d.js"], "css": ["assets/chart-9c0d.css"]},
+    "Pages/Admin/Dashboard.vue": {
+        "file": "assets/Dashboard-aaaa.js",
+        "imports": ["app.js", "_chart-7a8b.js"],
+    },
+    "Pages/Admin/Users/Index.vue": {"file": "assets/Index-bbbb.js", "imports": ["app.js"]},
+}
+
+
+class ViteManifestMixin:
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.manifest_path = Path(tmp.name) / "manifest.json"
+        self.write_manifest(MANIFEST)
+        override = override_settings(ADMIN_PANEL_VITE_DEV_SERVER=None, ADMIN_PANEL_VITE_MANIFEST=self.manifest_path)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def write_manifest(self, manifest, mtime=1_000_000):
+        self.manifest_path.write_text(json.dumps(manifest))
+        os.utime(self.manifest_path, (mtime, mtime))
+
+
+class ViteAssetTests(ViteManifestMixin, SimpleTestCase):
+    def test_page_assets_follow_static_imports(self):
+        assets = get_page_assets("Admin/Dashboard")
+        self.assertEqual(assets.scripts, ["/static/assets/app-1a2b.js"])
+        self.assertEqual(
+            assets.preloads,
+            ["/static/assets/vendor-3c4d.js", "/static/assets/Dashboard-aaaa.js", "/static/assets/chart-7a8b.js"],
+        )
+        self.assertEqual(assets.styles, ["/static/assets/app-5e6f.css", "/static/assets/chart-9c0d.css"])
+        self.assertEqual(get_page_assets("Admin/Unknown").preloads, ["/static/assets/vendor-3c4d.js"])
+
+    def test_version_changes_once_per_build(self):
+        version = get_asset_version()
+        self.assertEqual(get_asset_version(), version)
+        self.write_manifest({**MANIFEST, "app.js": {**MANIFEST["app.js"], "file": "assets/app-ffff.js"}}, mtime=2_000_000)
+        self.assertNotEqual(get_asset_version(), version)
+
+    def test_without_build_or_with_dev_server(self):
+        with override_settings(ADMIN_PANEL_VITE_MANIFEST=self.manifest_path.with_name("missing.json")):
+            self.assertEqual(get_page_assets("Admin/Dashboard").scripts, [])
+        with override_settings(ADMIN_PANEL_VITE_DEV_SERVER="http://localhost:5173/"):
+            self.assertEqual(
+                get_page_assets("Admin/Dashboard").scripts,
+                ["http://localhost:5173/@vite/client", "http://localhost:5173/app.js"],
+            )
+            self.assertEqual(get_asset_version(), "dev")
+
+    def test_tag_reads_component_from_context(self):
+        template = Template("{% load vite %}{% vite_assets %}")
+        html = template.render(Context({"inertia_component": "Admin/Dashboard"}))
+        self.assertIn("/static/assets/Dashboard-aaaa.js", html)
+        self.assertNotIn("/static/assets/Index-bbbb.js", html)
+        html = template.render(Context({"page": json.dumps({"component": "Admin/Dashboard"})}))
+        self.assertIn("/static/assets/app-1a2b.js", html)
+        self.assertNotIn("Dashboard-aaaa.js", html)
+
+    def test_missing_build_is_reported_by_checks(self):
+        self.assertEqual(check_vite_build(None), [])
+        with override_settings(ADMIN_PANEL_VITE_MANIFEST=self.manifest_path.with_name("missing.json")):
+            self.assertEqual([w.id for w in check_vite_build(None)], ["admin_panel.W002"])
+            with override_settings(ADMIN_PANEL_VITE_DEV_SERVER="http://localhost:5173"):
+                self.assertEqual(check_vite_build(None), [])
+        with override_settings(ADMIN_PANEL_VITE_ENTRY="src/main.js"):
+            self.assertEqual([w.id for w in check_vite_build(None)], ["admin_panel.W003"])
+
+
+class ViteResponseTests(ViteManifestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_user(username="staff", is_staff=True))
+
+    def test_full_page_load_has_tags_and_link_header(self):
+        response = self.client.get("/admin/")
+        html = response.content.decode()
+        self.assertIn('<script type="module" src="/static/assets/app-1a2b.js"></script>', html)
+        self.assertIn('<link rel="modulepreload" href="/static/assets/Dashboard-aaaa.js" />', html)
+        self.assertIn('<link rel="stylesheet" href="/static/assets/chart-9c0d.css" />', html)
+        self.assertNotIn("localhost:5173", html)
+        self.assertIn("</static/assets/app-5e6f.css>; rel=preload; as=style", response["Link"])
+        self.assertIn("</static/assets/Dashboard-aaaa.js>; rel=modulepreload", response["Link"])
+
+    def test_inertia_version_comes_from_the_manifest(self):
+        version = get_asset_version()
+        response = self.client.get("/admin/", headers={"X-Inertia": "true", "X-Inertia-Version": version})
+        self.assertEqual(response.json()["version"], version)
+        self.assertFalse(response.has_header("Link"))
+
+        response = self.client.get("/admin/", headers={"X-Inertia": "true", "X-Inertia-Version": "stale"})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response["X-Inertia-Location"], "http://testserver/admin/")
@@ -0,0 +1,126 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Sequence
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.admin_panel.conf import cached_setting_import
+
+DEFAULT_LOGIN_THROTTLE_BACKEND = "apps.admin_panel.throttling.backends.LocalTokenBucketBackend"
+
+# (key, capacity, tokens refilled per second)
+Bucket = tuple[str, int, float]
+# (tokens left, time of the last update)
+BucketState = tuple[float, float]
+
+
+def _refill(state: BucketState | None, capacity: int, rate: float, now: float) -> float:
+    if state is None:
+        return float(capacity)
+    tokens, updated_at = state
+    return min(float(capacity), tokens + max(0.0, now - updated_at) * rate)
+
+
+def _take(states: dict[str, BucketState | None], buckets: Sequence[Bucket], now: float):
+    """
+    Take one token from every bucket, or from none of them.
+
+    Returns (new states, seconds until a retry can succeed); the wait is 0 when the
+    tokens were taken.
+    """
+
+    levels = {key: _refill(states.get(key), capacity, rate, now) for key, capacity, rate in buckets}
+    wait = max(((1 - levels[key]) / rate for key, _, rate in buckets if levels[key] < 1), default=0.0)
+    if wait:
+        return {key: (levels[key], now) for key, _, _ in buckets}, wait
+    return {key: (levels[key] - 1, now) for key, _, _ in buckets}, 0.0
+
+
+class LoginThrottleBackend(ABC):
+    """
+    Interface for the token buckets behind the login throttle.
+    """
+
+    @abstractmethod
+    def consume(self, buckets: Sequence[Bucket]) -> float:
+        """
+        Take a token from each bucket if all have one; return 0, or else the seconds
+        to wait before the next attempt can pass.
+        """
+
+    def reset(self, keys: Sequence[str]) -> None:
+        """Refill the given buckets."""
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+
+
+class LocalTokenBucketBackend(LoginThrottleBackend):
+    """
+    Buckets in this process only: no I/O, but each worker keeps its own budget.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._buckets: OrderedDict[str, BucketState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, buckets: Sequence[Bucket]) -> float:
+        now = time.monotonic()
+        with self._lock:
+            states, wait = _take({key: self._buckets.get(key) for key, _, _ in buckets}, buckets, now)
+            for key, state in states.items():
+                self._buckets[key] = state
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def reset(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheTokenBucketBackend(LoginThrottleBackend):
+    """
+    Buckets in the Django cache named by ADMIN_PANEL_LOGIN_THROTTLE_CACHE, shared by
+    every worker using it.
+
+    Read-modify-write without a lock, so two workers racing on one bucket can each
+    spend the same token; the budget holds to within the number of workers.
+    """
+
+    key_prefix = "admin_panel:login_throttle"
+
+    def _cache(self):
+        return caches[getattr(settings, "ADMIN_PANEL_LOGIN_THROTTLE_CACHE", "default")]
+
+    def consume(self, buckets: Sequence[Bucket]) -> float:
+        now = time.time()
+        cache = self._cache()
+        keys = {key: f"{self.key_prefix}:{key}" for key, _, _ in buckets}
+        stored = cache.get_many(list(keys.values()))
+        states, wait = _take({key: stored.get(cache_key) for key, cache_key in keys.items()}, buckets, now)
+        # A bucket left alone for capacity / rate seconds is full again: let it expire.
+        ttl = {key: int(capacity / rate) + 1 for key, capacity, rate in buckets}
+        for key, state in states.items():
+            cache.set(keys[key], state, ttl[key])
+        return wait
+
+    def reset(self, keys: Sequence[str]) -> None:
+        self._cache().delete_many([f"{self.key_prefix}:{key}" for key in keys])
+
+    def clear(self) -> None:
+        # Buckets expire on their own; there is no prefix scan on Django caches.
+        pass
+
+
+get_login_throttle_backend = cached_setting_import("ADMIN_PANEL_LOGIN_THROTTLE_BACKEND", DEFAULT_LOGIN_THROTTLE_BACKEND)
@@ -1,5 +1,6 @@
 from django.contrib.auth.decorators import login_required
-from inertia import render
+
+from apps.admin_panel.api.render_utils import render
 
 @login_required
 def dashboard(request):
@@ -0,0 +1,54 @@
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import HttpRequest, JsonResponse
+
+from apps.admin_panel.domain.policies import can_manage_groups, can_manage_users
+from apps.admin_panel.selectors.loaders import get_group_detail_loader, get_user_detail_loader
+from apps.admin_panel.serialization.dto import to_dicts
+
+MAX_IDS_PER_REQUEST = 100
+
+
+def _parse_ids(request: HttpRequest) -> tuple[list[int], dict]:
+    """
+    Parse `?ids=1,2,3` into unique ids, keeping the requested order.
+    """
+
+    raw = [part.strip() for part in request.GET.get("ids", "").split(",") if part.strip()]
+    if not raw:
+        return [], {"ids": ["This field is required."]}
+    # ASCII only: isdigit() also accepts "²", which int() then rejects.
+    if not all(part.isascii() and part.isdecimal() for part in raw):
+        return [], {"ids": ["Enter a comma-separated list of integer ids."]}
+    ids = list(dict.fromkeys(int(part) for part in raw))
+    if len(ids) > MAX_IDS_PER_REQUEST:
+        return [], {"ids": [f"At most {MAX_IDS_PER_REQUEST} ids can be requested at once."]}
+    return ids, {}
+
+
+def _bulk_response(request: HttpRequest, key: str, loader) -> JsonResponse:
+    ids, errors = _parse_ids(request)
+    if errors:
+        return JsonResponse({"errors": errors}, status=400)
+    found = dict(zip(ids, loader.load_many(ids)))
+    return JsonResponse({
+        key: to_dicts(dto for dto in found.values() if dto is not None),
+        "missing": [pk for pk, dto in found.items() if dto is None],
+    })
+
+
+@login_required
+@user_passes_test(can_manage_users)
+def users_by_ids(request: HttpRequest):
+    """
+    JSON read endpoint: `UserDetailDTO`s for `?ids=...` in one constant-query batch.
+    """
+    return _bulk_response(request, "users", get_user_detail_loader(request))
+
+
+@login_required
+@user_passes_test(can_manage_groups)
+def groups_by_ids(request: HttpRequest):
+    """
+    JSON read endpoint: `GroupDetailDTO`s for `?ids=...` in one constant-query batch.
+    """
+    return _bulk_response(request, "groups", get_group_detail_loader(request))
@@ -1,3 +1,74 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from apps.admin_panel.services.invalidation import sync_invalidations
+
+User = get_user_model()
+
+
+class BulkDetailEndpointTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.group = Group.objects.create(name="Editors")
+        self.users = [User.objects.create_user(username=f"user{i}") for i in range(3)]
+        self.group.user_set.set(self.users)
+        self.client.force_login(self.staff)
+
+    def test_users_by_ids_returns_requested_order_and_missing(self):
+        ids = [self.users[2].id, self.users[0].id, self.users[2].id, 9999]
+        sync_invalidations(force=True)
+        with override_settings(ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL=60), self.assertNumQueries(3):
+            # session, request user, batched detail
+            response = self.client.get(reverse("admin_api_users"), {"ids": ",".join(map(str, ids))})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([u["username"] for u in data["users"]], ["user2", "user0"])
+        self.assertEqual(data["users"][0]["group_names"], ["Editors"])
+        self.assertEqual(data["missing"], [9999])
+
+    def test_groups_by_ids(self):
+        response = self.client.get(reverse("admin_api_groups"), {"ids": str(self.group.id)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["groups"][0]["user_count"], 3)
+
+    def test_invalid_ids_are_rejected(self):
+        for ids in ("1,abc", "1,\u00b2", "-1"):
+            response = self.client.get(reverse("admin_api_users"), {"ids": ids})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("ids", response.json()["errors"])
+
+    def test_requires_staff(self):
+        self.client.force_login(User.objects.create_user(username="plain", password="pw"))
+        response = self.client.get(reverse("admin_api_users"), {"ids": "1"})
+        self.assertEqual(response.status_code, 302)
+
+
+class GroupEditMembersPropTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.group = Group.objects.create(name="Editors")
+        self.group.user_set.set([User.objects.create_user(username=f"user{i}") for i in range(3)])
+        self.client.force_login(self.staff)
+        self.url = f"/admin/groups/{self.group.id}/edit/"
+
+    def test_members_are_not_loaded_on_first_visit(self):
+        response = self.client.get(self.url, headers={"X-Inertia": "true"})
+        props = response.json()["props"]
+        self.assertEqual(props["group"]["user_count"], 3)
+        self.assertNotIn("members", props)
+
+    def test_partial_reload_loads_members(self):
+        response = self.client.get(
+            self.url,
+            {"members_search": "user1"},
+            headers={
+                "X-Inertia": "true",
+                "X-Inertia-Partial-Component": "Admin/Groups/Edit",
+                "X-Inertia-Partial-Data": "members",
+            },
+        )
+        props = response.json()["props"]
+        self.assertEqual([m["username"] for m in props["members"]["items"]], ["user1"])
+        self.assertNotIn("permissions_choices", props)
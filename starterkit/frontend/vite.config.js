@@ -2,8 +2,10 @@ import path from "path"
 import { defineConfig } from "vite"
 import vue from "@vitejs/plugin-vue"
 
-export default defineConfig({
+export default defineConfig(({ command }) => ({
   plugins: [vue()],
+  // Built files are served by Django under STATIC_URL; the dev server serves from "/".
+  base: command === "build" ? "/static/" : "/",
   resolve: {
     alias: {
       "@": path.resolve(__dirname),
@@ -12,8 +14,10 @@ export default defineConfig({
   build: {
     outDir: "../static",
     emptyOutDir: true,
+    // static/.vite/manifest.json: read by the `vite_assets` template tag
+    manifest: true,
     rollupOptions: {
       input: path.resolve(__dirname, "app.js"),
     },
   },
-})
\ No newline at end of file
+}))
\ No newline at end of file
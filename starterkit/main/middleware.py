@@ -1,12 +1,10 @@
+from asgiref.sync import iscoroutinefunction
 from django.middleware.csrf import get_token
+from django.utils.decorators import sync_and_async_middleware
 from inertia import share
 
 
-def get_auth_props(request):
-    """
-    Build auth payload for Inertia props. Use in middleware (share) and in views (explicit pass).
-    """
-    user = getattr(request, "user", None)
+def _build_auth_props(user):
     if user is None or not getattr(user, "is_authenticated", False):
         return {"user": None}
     return {
@@ -22,18 +20,49 @@ def get_auth_props(request):
     }
 
 
+def get_auth_props(request):
+    """
+    Build auth payload for Inertia props, once per request.
+
+    The shared `auth` prop resolves through this, so views normally don't pass `auth`
+    themselves. The memo is keyed on the `request.user` object, so a login or logout
+    earlier in the same request is picked up.
+    """
+    user = getattr(request, "user", None)
+    memo = request.__dict__.get("_inertia_auth_props")
+    if memo is None or memo[0] is not user:
+        memo = (user, _build_auth_props(user))
+        request.__dict__["_inertia_auth_props"] = memo
+    return memo[1]
+
+
+@sync_and_async_middleware
 def inertia_shared_props(get_response):
     """
     Middleware to inject global Inertia props, keeping Django authoritative.
+
+    Props are shared as callables, which Inertia only resolves while serializing a page,
+    so redirects, JSON endpoints and partial reloads that don't ask for them never load
+    the user or touch the CSRF cookie.
     """
 
-    def middleware(request):
+    def share_props(request):
         share(
             request,
-            auth=get_auth_props(request),
-            csrf_token=get_token(request),
+            auth=lambda: get_auth_props(request),
+            csrf_token=lambda: get_token(request),
         )
-        return get_response(request)
 
-    return middleware
+    if iscoroutinefunction(get_response):
 
+        async def middleware(request):
+            share_props(request)
+            return await get_response(request)
+
+    else:
+
+        def middleware(request):
+            share_props(request)
+            return get_response(request)
+
+    return middleware
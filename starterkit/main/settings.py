@@ -44,11 +44,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'apps.admin_panel.middleware.vite_preload_headers',
+    'apps.admin_panel.middleware.invalidation_sync',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'inertia.middleware.InertiaMiddleware',
+    'apps.admin_panel.middleware.InertiaMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.admin_panel.middleware.CachedAuthenticationMiddleware',
     'main.middleware.inertia_shared_props',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -125,6 +127,71 @@ USE_TZ = True
 STATIC_URL = 'static/'
 
 INERTIA_LAYOUT = 'base.html'
+# INERTIA_JSON_ENCODER defaults to the admin panel's encoder, which serializes page objects
+# with the ADMIN_PANEL_JSON_CODEC codec below, and INERTIA_VERSION to the asset version
+# below; set them here only to replace those defaults.
+
+# Frontend assets. With ADMIN_PANEL_VITE_DEV_SERVER set, pages load the entry from the Vite
+# dev server; with it None they use the build that `npm run build` writes to static/, via
+# its manifest, which also versions Inertia: a new build makes each open tab reload once.
+ADMIN_PANEL_VITE_DEV_SERVER = 'http://localhost:5173' if DEBUG else None
+ADMIN_PANEL_VITE_MANIFEST = BASE_DIR / 'static' / '.vite' / 'manifest.json'
+ADMIN_PANEL_VITE_ENTRY = 'app.js'
+
+# Sessions: "apps.admin_panel.sessions.<store>" where store is "db", "cached_db" or
+# "signed_cookies" (no server-side storage). All of them skip the write when a request
+# only re-assigns values the session already holds. "cached_db" serves reads from
+# CACHES[SESSION_CACHE_ALIAS]; opt into it only once that cache is shared by every
+# worker (Redis, Memcached), since a per-process cache keeps serving a session another
+# worker has logged out or flushed.
+SESSION_ENGINE = 'apps.admin_panel.sessions.db'
+
+# Admin panel list pagination: "exact", "estimate" (planner stats / cached counts) or "none".
+ADMIN_PANEL_LIST_TOTAL_MODE = 'estimate'
+ADMIN_PANEL_COUNT_CACHE_TIMEOUT = 60
+# Async list and dashboard views run their independent reads (count, page rows) at once,
+# each on its own worker thread and connection; False runs them one after another.
+# Only takes effect with persistent connections (DATABASES CONN_MAX_AGE > 0 or None):
+# otherwise each read would open and close its own connection, so they run in turn.
+ADMIN_PANEL_CONCURRENT_READS = True
+
+# Cached admin selectors (group/permission choices), invalidated by tag on writes.
+ADMIN_PANEL_SELECTOR_CACHE = 'default'
+ADMIN_PANEL_SELECTOR_CACHE_TIMEOUT = 300
+# Seconds between checks of the shared invalidation versions (0 = every request, which
+# costs a query per request). Other workers see a write at most this late; the worker
+# that made it sees it at once.
+ADMIN_PANEL_INVALIDATION_SYNC_INTERVAL = 2
+
+# Seconds a worker may serve request.user from its in-process snapshot (0 = always load).
+ADMIN_PANEL_AUTH_USER_CACHE_TIMEOUT = 30
+
+# Processes hashing passwords during admin uploads of users (None = CPU count), in one
+# pool per web worker; the import_users command takes --workers instead.
+ADMIN_PANEL_IMPORT_HASH_WORKERS = None
+
+# Threads hashing/checking passwords for the async auth and user services (None = CPU
+# count), and how many jobs may wait for one before new ones are turned away.
+ADMIN_PANEL_HASH_EXECUTOR_WORKERS = None
+ADMIN_PANEL_HASH_EXECUTOR_MAX_QUEUE = 64
+
+# Login throttle: token buckets per username and per client IP, as (burst, seconds to
+# refill it); a scope set to None is not throttled. The local backend keeps buckets per
+# process; "apps.admin_panel.throttling.backends.CacheTokenBucketBackend" shares them
+# through CACHES[ADMIN_PANEL_LOGIN_THROTTLE_CACHE].
+ADMIN_PANEL_LOGIN_THROTTLE_RATES = {"username": (5, 60), "ip": (20, 60)}
+ADMIN_PANEL_LOGIN_THROTTLE_BACKEND = 'apps.admin_panel.throttling.backends.LocalTokenBucketBackend'
+ADMIN_PANEL_LOGIN_THROTTLE_CACHE = 'default'
+
+# JSON codec for request bodies and Inertia pages. StdlibCodec uses the standard library;
+# OrjsonCodec uses orjson when it is installed (pip install orjson) and falls back to the
+# standard library otherwise. JSON bodies larger than ADMIN_PANEL_JSON_MAX_BODY_SIZE bytes
+# are rejected with a 400 before parsing (None = only DATA_UPLOAD_MAX_MEMORY_SIZE applies).
+ADMIN_PANEL_JSON_CODEC = 'apps.admin_panel.serialization.codecs.StdlibCodec'
+ADMIN_PANEL_JSON_MAX_BODY_SIZE = 1024 * 1024
+
+# Index behind the admin user search (FTS5 trigram on SQLite, icontains elsewhere).
+ADMIN_PANEL_USER_SEARCH_BACKEND = 'apps.admin_panel.search.backends.SQLiteFTS5SearchBackend'
 
 TEMPLATES[0]["DIRS"] = [BASE_DIR / "templates"]
 STATICFILES_DIRS = [BASE_DIR / "static", BASE_DIR / "static_assets"]
\ No newline at end of file
@@ -18,20 +18,26 @@ from django.contrib import admin
 from django.urls import path
 
 from main.views import home
-from apps.admin_panel.api.admin_views import dashboard
+from apps.admin_panel.api.admin_views import dashboard, hashing_metrics
 from apps.admin_panel.api.auth_views import login_view, logout_view
 from apps.admin_panel.api.group_views import (
     group_create,
     group_delete,
     group_edit,
+    group_export,
     group_list,
+    group_permissions,
 )
 from apps.admin_panel.api.user_views import (
+    user_bulk_action,
     user_create,
     user_delete,
     user_edit,
+    user_export,
+    user_import,
     user_list,
 )
+from apps.users.api.detail_views import groups_by_ids, users_by_ids
 
 urlpatterns = [
     path("", home, name="home"),
@@ -42,10 +48,19 @@ urlpatterns = [
     path("admin/", dashboard, name="admin_dashboard"),
     path("admin/users/", user_list, name="admin_users"),
     path("admin/users/create/", user_create, name="admin_user_create"),
+    path("admin/users/import/", user_import, name="admin_user_import"),
+    path("admin/users/export/", user_export, name="admin_user_export"),
+    path("admin/users/bulk/", user_bulk_action, name="admin_user_bulk"),
     path("admin/users/<int:user_id>/edit/", user_edit, name="admin_user_edit"),
     path("admin/users/<int:user_id>/delete/", user_delete, name="admin_user_delete"),
     path("admin/groups/", group_list, name="admin_groups"),
     path("admin/groups/create/", group_create, name="admin_group_create"),
+    path("admin/groups/export/", group_export, name="admin_group_export"),
+    path("admin/groups/permissions/", group_permissions, name="admin_group_permissions"),
     path("admin/groups/<int:group_id>/edit/", group_edit, name="admin_group_edit"),
     path("admin/groups/<int:group_id>/delete/", group_delete, name="admin_group_delete"),
+    # JSON read API
+    path("admin/api/users/", users_by_ids, name="admin_api_users"),
+    path("admin/api/metrics/hashing/", hashing_metrics, name="admin_api_hashing_metrics"),
+    path("admin/api/groups/", groups_by_ids, name="admin_api_groups"),
 ]